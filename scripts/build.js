@@ -6,8 +6,10 @@
  */
 
 import { spawn } from 'child_process';
+import crypto from 'crypto';
 import fs from 'fs';
 import path from 'path';
+import zlib from 'zlib';
 import { fileURLToPath } from 'url';
 
 const __filename = fileURLToPath(import.meta.url);
@@ -30,10 +32,35 @@ function logSuccess(message) {
   console.log(`${colors.green}[SUCCESS]${colors.reset} ${message}`);
 }
 
+function logWarning(message) {
+  console.log(`${colors.yellow}[WARNING]${colors.reset} ${message}`);
+}
+
 function logError(message) {
   console.log(`${colors.red}[ERROR]${colors.reset} ${message}`);
 }
 
+// Gzipped size budgets in KB; the first matching pattern applies
+const BUNDLE_BUDGETS = [
+  { pattern: /^vendor-react-.*\.js$/, maxKb: 60 },
+  { pattern: /^vendor-router-.*\.js$/, maxKb: 25 },
+  { pattern: /^vendor-axios-.*\.js$/, maxKb: 20 },
+  { pattern: /^vendor-headlessui-.*\.js$/, maxKb: 40 },
+  { pattern: /^index-.*\.js$/, maxKb: 80 },
+  { pattern: /\.js$/, maxKb: 40 },
+  { pattern: /\.css$/, maxKb: 30 }
+];
+
+const SOURCEMAP_DIR = 'sourcemaps';
+
+// Written by Vite (build.manifest in vite.config.js), read to build the service worker precache
+const ASSET_MANIFEST = 'asset-manifest.json';
+const SERVICE_WORKER_TEMPLATE = path.join(__dirname, 'sw-template.js');
+
+// Precompressed .gz/.br siblings served by nginx gzip_static/brotli_static
+const COMPRESSIBLE_FILES = /\.(js|mjs|css|html|json|svg|txt|xml|webmanifest|ico|ttf|otf|eot)$/;
+const MIN_COMPRESS_SIZE = 1024;
+
 // Check if .env file exists
 function checkEnvFile() {
   const envPath = path.join(process.cwd(), '.env');
@@ -59,14 +86,145 @@ function cleanDist() {
   }
 }
 
+// Move hidden source maps out of dist/ so they are never deployed;
+// upload the sourcemaps/ directory to the error tracker as a separate step
+function extractSourceMaps() {
+  const assetsPath = path.join(process.cwd(), 'dist', 'assets');
+  const targetPath = path.join(process.cwd(), SOURCEMAP_DIR);
+  if (!fs.existsSync(assetsPath)) return;
+
+  fs.rmSync(targetPath, { recursive: true, force: true });
+  const maps = fs.readdirSync(assetsPath).filter((file) => file.endsWith('.map'));
+  if (maps.length === 0) return;
+
+  fs.mkdirSync(targetPath, { recursive: true });
+  maps.forEach((file) => {
+    fs.renameSync(path.join(assetsPath, file), path.join(targetPath, file));
+  });
+  log(`Moved ${maps.length} source map(s) to ${SOURCEMAP_DIR}/ for out-of-band upload.`);
+}
+
+// Fail the build when any chunk exceeds its gzipped size budget
+function checkBundleBudgets() {
+  const assetsPath = path.join(process.cwd(), 'dist', 'assets');
+  if (!fs.existsSync(assetsPath)) return true;
+
+  let withinBudget = true;
+  fs.readdirSync(assetsPath)
+    .filter((file) => /\.(js|css)$/.test(file))
+    .forEach((file) => {
+      const budget = BUNDLE_BUDGETS.find(({ pattern }) => pattern.test(file));
+      if (!budget) return;
+
+      const gzippedKb = zlib.gzipSync(fs.readFileSync(path.join(assetsPath, file))).length / 1024;
+      const summary = `${file}: ${gzippedKb.toFixed(1)} KB gzip (budget ${budget.maxKb} KB)`;
+      if (gzippedKb > budget.maxKb) {
+        logError(`Bundle budget exceeded - ${summary}`);
+        withinBudget = false;
+      } else if (gzippedKb > budget.maxKb * 0.9) {
+        logWarning(`Close to bundle budget - ${summary}`);
+      } else {
+        log(summary);
+      }
+    });
+
+  return withinBudget;
+}
+
+// Generate dist/sw.js from the template, precaching index.html and every
+// hashed file in the Vite manifest; the version changes whenever any of them do
+function generateServiceWorker() {
+  const distPath = path.join(process.cwd(), 'dist');
+  const manifestPath = path.join(distPath, ASSET_MANIFEST);
+  if (!fs.existsSync(manifestPath)) {
+    logWarning(`${ASSET_MANIFEST} not found, skipping service worker generation.`);
+    return;
+  }
+
+  const manifest = JSON.parse(fs.readFileSync(manifestPath, 'utf8'));
+  const files = new Set(['index.html']);
+  Object.values(manifest).forEach((chunk) => {
+    [chunk.file, ...(chunk.css || []), ...(chunk.assets || [])].forEach((file) => files.add(file));
+  });
+  const urls = [...files].sort().map((file) => `/${file}`);
+
+  const version = crypto.createHash('sha256');
+  urls.forEach((url) => {
+    version.update(url);
+    version.update(fs.readFileSync(path.join(distPath, url)));
+  });
+
+  const serviceWorker = fs.readFileSync(SERVICE_WORKER_TEMPLATE, 'utf8')
+    .replace('__BUILD_VERSION__', version.digest('hex').slice(0, 12))
+    .replace('__PRECACHE_URLS__', JSON.stringify(urls, null, 2));
+  fs.writeFileSync(path.join(distPath, 'sw.js'), serviceWorker);
+  log(`Generated sw.js precaching ${urls.length} file(s).`);
+}
+
+function listFiles(dir) {
+  return fs.readdirSync(dir, { withFileTypes: true }).flatMap((entry) => {
+    const entryPath = path.join(dir, entry.name);
+    return entry.isDirectory() ? listFiles(entryPath) : [entryPath];
+  });
+}
+
+// Write maximum-compression .gz and .br files next to every text asset,
+// so nginx never compresses static files per request
+function precompressAssets() {
+  const distPath = path.join(process.cwd(), 'dist');
+  if (!fs.existsSync(distPath)) return;
+
+  let originalBytes = 0;
+  let brotliBytes = 0;
+  let count = 0;
+
+  listFiles(distPath)
+    .filter((file) => COMPRESSIBLE_FILES.test(file))
+    .forEach((file) => {
+      const contents = fs.readFileSync(file);
+      if (contents.length < MIN_COMPRESS_SIZE) return;
+
+      const gzipped = zlib.gzipSync(contents, { level: zlib.constants.Z_BEST_COMPRESSION });
+      const brotli = zlib.brotliCompressSync(contents, {
+        params: {
+          [zlib.constants.BROTLI_PARAM_MODE]: zlib.constants.BROTLI_MODE_TEXT,
+          [zlib.constants.BROTLI_PARAM_QUALITY]: zlib.constants.BROTLI_MAX_QUALITY,
+          [zlib.constants.BROTLI_PARAM_SIZE_HINT]: contents.length
+        }
+      });
+
+      // Only keep variants that are actually smaller
+      if (gzipped.length < contents.length) fs.writeFileSync(`${file}.gz`, gzipped);
+      if (brotli.length < contents.length) fs.writeFileSync(`${file}.br`, brotli);
+
+      originalBytes += contents.length;
+      brotliBytes += Math.min(brotli.length, contents.length);
+      count += 1;
+    });
+
+  if (count > 0) {
+    log(`Precompressed ${count} file(s): ${(originalBytes / 1024).toFixed(1)} KB -> ${(brotliBytes / 1024).toFixed(1)} KB brotli.`);
+  }
+}
+
 // Build the application
 function buildApp() {
-  log('Building React application for production...');
+  const mode = process.argv.includes('--debug') ? 'debug' : 'production';
+  log(`Building React application (${mode} mode)...`);
   
-  const buildProcess = spawn('npx', ['vite', 'build'], { stdio: 'inherit', shell: true });
+  const buildProcess = spawn('npx', ['vite', 'build', '--mode', mode], { stdio: 'inherit', shell: true });
   
   buildProcess.on('close', (code) => {
     if (code === 0) {
+      if (mode === 'production') {
+        extractSourceMaps();
+        if (!checkBundleBudgets()) {
+          logError('Build failed: one or more chunks exceed their size budget.');
+          process.exit(1);
+        }
+        generateServiceWorker();
+        precompressAssets();
+      }
       logSuccess('Build completed successfully!');
       log('Built files are available in the dist/ directory.');
       log('You can now deploy the dist/ directory to any static hosting service.');
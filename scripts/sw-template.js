@@ -0,0 +1,96 @@
+/**
+ * Service Worker
+ * Template filled in by scripts/build.js after `vite build`: the
+ * placeholders below are replaced with the build version and the hashed
+ * files listed in dist/asset-manifest.json.
+ *
+ * - App shell (index.html and every hashed chunk) is precached on install
+ *   and served cache-first, so repeat visits need no network for static files
+ * - Read-only API calls (resumes, analyses, job descriptions, profile) go to
+ *   the network and fall back to the last stored response when offline
+ */
+
+const BUILD_VERSION = '__BUILD_VERSION__';
+const PRECACHE_URLS = __PRECACHE_URLS__;
+
+const SHELL_CACHE_PREFIX = 'app-shell-';
+const SHELL_CACHE = `${SHELL_CACHE_PREFIX}${BUILD_VERSION}`;
+// Also cleared by the app on logout (src/utils/serviceWorker.ts)
+const API_CACHE = 'api-v1';
+
+// API reads worth keeping for offline use, matched against the end of the path
+// so they work with both the /api proxy and a separate API origin
+const API_CACHE_PATTERNS = [
+  /\/resume\/user-resumes$/,
+  /\/resume\/\d+$/,
+  /\/resume\/\d+\/improvements$/,
+  /\/dashboard\/summary$/,
+  /\/job-descriptions$/,
+  /\/profile$/,
+];
+
+self.addEventListener('install', (event) => {
+  event.waitUntil(caches.open(SHELL_CACHE).then((cache) => cache.addAll(PRECACHE_URLS)));
+  // No skipWaiting: open tabs keep the shell (and lazy chunks) they started with
+});
+
+self.addEventListener('activate', (event) => {
+  event.waitUntil(
+    caches.keys().then((names) =>
+      Promise.all(
+        names
+          .filter((name) => name.startsWith(SHELL_CACHE_PREFIX) && name !== SHELL_CACHE)
+          .map((name) => caches.delete(name))
+      )
+    ).then(() => self.clients.claim())
+  );
+});
+
+const isApiRead = (url) => API_CACHE_PATTERNS.some((pattern) => pattern.test(url.pathname));
+
+/**
+ * Network first, stored copy when the network fails. The app already keeps
+ * its own stale-while-revalidate caches, so serving stale responses while
+ * online would only hide fresh data from them.
+ */
+const networkFallingBackToCache = async (request) => {
+  const cache = await caches.open(API_CACHE);
+  try {
+    const response = await fetch(request);
+    if (response.ok) cache.put(request, response.clone());
+    return response;
+  } catch (error) {
+    const cached = await cache.match(request);
+    if (cached) return cached;
+    throw error;
+  }
+};
+
+const cacheFirst = async (request) => {
+  const cached = await caches.match(request, { cacheName: SHELL_CACHE });
+  return cached || fetch(request);
+};
+
+self.addEventListener('fetch', (event) => {
+  const { request } = event;
+  if (request.method !== 'GET') return;
+  const url = new URL(request.url);
+
+  // Client-side routes all render the cached app shell; real files
+  // (e.g. /privacy-policy.html) are left to the network
+  if (request.mode === 'navigate' && url.origin === self.location.origin && !/\.\w+$/.test(url.pathname)) {
+    event.respondWith(
+      caches.match('/index.html', { cacheName: SHELL_CACHE }).then((cached) => cached || fetch(request))
+    );
+    return;
+  }
+
+  if (url.origin === self.location.origin && PRECACHE_URLS.includes(url.pathname)) {
+    event.respondWith(cacheFirst(request));
+    return;
+  }
+
+  if (isApiRead(url)) {
+    event.respondWith(networkFallingBackToCache(request));
+  }
+});
@@ -1,4 +1,4 @@
-import React from 'react';
+import React, { Suspense } from 'react';
 import { BrowserRouter as Router, Routes, Route, Navigate } from 'react-router-dom';
 import { 
   AuthProvider, 
@@ -7,7 +7,9 @@ import {
 import { 
   Layout, 
   ProtectedRoute, 
-  Notification
+  Notification,
+  PageSkeleton,
+  RouteSuspense
 } from '@components';
 import {
   Login, 
@@ -19,9 +21,20 @@ import {
   JobMatching,
   CoverLetter,
   Profile
-} from '@modules';
+} from './routes';
 import './App.css';
 
+// Protected page inside the app shell; the sidebar stays visible while the page chunk loads
+const protectedPage = (Page, skeleton) => (
+  <ProtectedRoute>
+    <Layout>
+      <RouteSuspense fallback={<PageSkeleton variant={skeleton} />}>
+        <Page />
+      </RouteSuspense>
+    </Layout>
+  </ProtectedRoute>
+);
+
 function App() {
   return (
     <AuthProvider>
@@ -29,64 +42,24 @@ function App() {
         <Router>
           <div className="App">
             <Notification />
-            <Routes>
-              <Route path="/login" element={<Login />} />
-              <Route path="/register" element={<Register />} />
-              <Route path="/" element={
-                <ProtectedRoute>
-                  <Navigate to="/dashboard" replace />
-                </ProtectedRoute>
-              } />
-              <Route path="/dashboard" element={
-                <ProtectedRoute>
-                  <Layout>
-                    <Dashboard />
-                  </Layout>
-                </ProtectedRoute>
-              } />
-              <Route path="/upload" element={
-                <ProtectedRoute>
-                  <Layout>
-                    <ResumeUpload />
-                  </Layout>
-                </ProtectedRoute>
-              } />
-              <Route path="/analysis" element={
-                <ProtectedRoute>
-                  <Layout>
-                    <ResumeAnalysis />
-                  </Layout>
-                </ProtectedRoute>
-              } />
-              <Route path="/matching" element={
-                <ProtectedRoute>
-                  <Layout>
-                    <JobMatching />
-                  </Layout>
-                </ProtectedRoute>
-              } />
-              <Route path="/improvement" element={
-                <ProtectedRoute>
-                  <Layout>
-                    <ResumeImprovement />
-                  </Layout>
-                </ProtectedRoute>
-              } />
-              <Route path="/cover-letter" element={
-                <ProtectedRoute>
-                  <Layout>
-                    <CoverLetter />
-                  </Layout>
-                </ProtectedRoute>
-              } />
-              <Route path="/profile" element={
-                <ProtectedRoute>
-                  <Layout>
-                    <Profile />
-                  </Layout>
-                </ProtectedRoute>
-              } />
-            </Routes>
+            <Suspense fallback={<PageSkeleton variant="auth" />}>
+              <Routes>
+                <Route path="/login" element={<Login />} />
+                <Route path="/register" element={<Register />} />
+                <Route path="/" element={
+                  <ProtectedRoute>
+                    <Navigate to="/dashboard" replace />
+                  </ProtectedRoute>
+                } />
+                <Route path="/dashboard" element={protectedPage(Dashboard, 'dashboard')} />
+                <Route path="/upload" element={protectedPage(ResumeUpload, 'form')} />
+                <Route path="/analysis" element={protectedPage(ResumeAnalysis, 'list')} />
+                <Route path="/matching" element={protectedPage(JobMatching, 'list')} />
+                <Route path="/improvement" element={protectedPage(ResumeImprovement, 'list')} />
+                <Route path="/cover-letter" element={protectedPage(CoverLetter, 'list')} />
+                <Route path="/profile" element={protectedPage(Profile, 'form')} />
+              </Routes>
+            </Suspense>
           </div>
         </Router>
       </NotificationProvider>
@@ -94,4 +67,4 @@ function App() {
   );
 }
 
-export default App;
\ No newline at end of file
+export default App;
@@ -0,0 +1,68 @@
+import React from 'react';
+import type { PreMatchResult } from '@utils/keywordMatcher';
+
+interface KeywordPreMatchProps {
+  result: PreMatchResult | null;
+  /** Maximum number of keyword chips per group */
+  limit?: number;
+}
+
+/** Below this overlap a full LLM match is unlikely to be worth running */
+const LOW_MATCH_THRESHOLD = 30;
+
+const scoreColor = (score: number): string => {
+  if (score >= 70) return 'text-green-700 bg-green-100';
+  if (score >= LOW_MATCH_THRESHOLD) return 'text-yellow-700 bg-yellow-100';
+  return 'text-red-700 bg-red-100';
+};
+
+/**
+ * Instant keyword overlap between a job description and the selected
+ * resume, computed in the browser while the user types.
+ */
+const KeywordPreMatch: React.FC<KeywordPreMatchProps> = ({ result, limit = 12 }) => {
+  if (!result || result.keywords.length === 0) return null;
+
+  const { score, matched, missing, keywords } = result;
+
+  return (
+    <div className="mt-3 space-y-2" aria-live="polite">
+      <div className="flex items-center justify-between text-sm">
+        <span className="text-gray-600">
+          {keywords.length} skill{keywords.length === 1 ? '' : 's'} detected
+        </span>
+        {score !== null && (
+          <span className={`px-2 py-0.5 rounded-full text-xs font-medium ${scoreColor(score)}`}>
+            Quick match {score}%
+          </span>
+        )}
+      </div>
+
+      <div className="flex flex-wrap gap-1">
+        {(score === null ? keywords : matched).slice(0, limit).map((keyword) => (
+          <span
+            key={keyword}
+            className={`px-2 py-0.5 rounded-full text-xs ${
+              score === null ? 'bg-gray-100 text-gray-700' : 'bg-green-100 text-green-800'
+            }`}
+          >
+            {keyword}
+          </span>
+        ))}
+        {score !== null && missing.slice(0, limit).map((keyword) => (
+          <span key={keyword} className="px-2 py-0.5 rounded-full text-xs bg-red-50 text-red-700 line-through">
+            {keyword}
+          </span>
+        ))}
+      </div>
+
+      {score !== null && score < LOW_MATCH_THRESHOLD && (
+        <p className="text-xs text-gray-500">
+          Few of this role's skills appear on the selected resume. A full match is unlikely to score well.
+        </p>
+      )}
+    </div>
+  );
+};
+
+export default KeywordPreMatch;
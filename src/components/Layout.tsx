@@ -1,8 +1,12 @@
 import React, { useState, useEffect, useRef } from 'react';
 import { Link, useLocation } from 'react-router-dom';
-import { useAuth } from '@contexts/AuthContext';
+import { useAuthActions, useAuthSelector } from '@contexts/AuthContext';
+import { useNotification } from '@contexts/NotificationContext';
 import LinkedInLogoutModal from './LinkedInLogoutModal';
 import { logoutService } from '@auth/services';
+import { analysisStatusTracker } from '@resume/services';
+import { prefetchRoute } from '@/routes';
+import { useAvatar, useOnlineStatus } from '@hooks';
 import {
   HomeIcon,
   DocumentArrowUpIcon,
@@ -30,9 +34,17 @@ const Layout = ({ children }: { children: React.ReactNode }) => {
   ]);
   const [showNotifications, setShowNotifications] = useState(false);
   const [darkMode, setDarkMode] = useState(false);
-  const { user, logout } = useAuth();
+  const user = useAuthSelector((state) => state.user);
+  const { logout } = useAuthActions();
+  const online = useOnlineStatus();
+  const avatarUrl = useAvatar(user, 36);
+  const notify = useNotification();
+  const notifyRef = useRef(notify);
+  notifyRef.current = notify;
   const location = useLocation();
   const notificationRef = useRef<HTMLDivElement>(null);
+  const mobileNavRef = useRef<HTMLElement>(null);
+  const desktopNavRef = useRef<HTMLElement>(null);
 
   // Close notifications dropdown when clicking outside
   useEffect(() => {
@@ -48,6 +60,27 @@ const Layout = ({ children }: { children: React.ReactNode }) => {
     };
   }, []);
 
+  // Watch resumes that are still being analyzed and announce when they finish
+  useEffect(() => analysisStatusTracker.start(), []);
+
+  useEffect(() => {
+    return analysisStatusTracker.onComplete((resume) => {
+      const name = resume.original_filename || resume.filename || 'your resume';
+      const message = resume.analysis_status === 'completed'
+        ? `Analysis of ${name} is complete`
+        : `Analysis of ${name} ${resume.analysis_status}`;
+      if (resume.analysis_status === 'completed') {
+        notifyRef.current.success(message);
+      } else {
+        notifyRef.current.warning(message);
+      }
+      setNotifications((previous) => [
+        { id: Date.now(), message, time: 'Just now', unread: true },
+        ...previous
+      ]);
+    });
+  }, []);
+
   const navigation = [
     { name: 'Dashboard', href: '/dashboard', icon: HomeIcon },
     { name: 'Upload Resume', href: '/upload', icon: DocumentArrowUpIcon },
@@ -58,6 +91,23 @@ const Layout = ({ children }: { children: React.ReactNode }) => {
     { name: 'Profile', href: '/profile', icon: UserIcon },
   ];
 
+  // Prefetch every sidebar page chunk once the sidebar is on screen and the browser is idle
+  useEffect(() => {
+    if (!('IntersectionObserver' in window)) return;
+
+    const observer = new IntersectionObserver((entries) => {
+      if (!entries.some((entry) => entry.isIntersecting)) return;
+      observer.disconnect();
+      const scheduleIdle = window.requestIdleCallback || ((callback: () => void) => setTimeout(callback, 200));
+      scheduleIdle(() => navigation.forEach((item) => prefetchRoute(item.href)));
+    });
+
+    [mobileNavRef.current, desktopNavRef.current].forEach((element) => {
+      if (element) observer.observe(element);
+    });
+    return () => observer.disconnect();
+  }, []);
+
   const isActive = (path: string): boolean => location.pathname === path;
 
   // Get background configuration for current page
@@ -135,11 +185,13 @@ const Layout = ({ children }: { children: React.ReactNode }) => {
               <XMarkIcon className="h-6 w-6" />
             </button>
           </div>
-          <nav className="flex-1 space-y-1 px-2 py-4">
+          <nav ref={mobileNavRef} className="flex-1 space-y-1 px-2 py-4">
             {navigation.map((item) => (
               <Link
                 key={item.name}
                 to={item.href}
+                onMouseEnter={() => prefetchRoute(item.href)}
+                onFocus={() => prefetchRoute(item.href)}
                 className={`group flex items-center px-2 py-2 text-sm font-medium rounded-md ${
                   isActive(item.href)
                     ? 'bg-blue-100 text-blue-900'
@@ -173,11 +225,13 @@ const Layout = ({ children }: { children: React.ReactNode }) => {
               <XMarkIcon className="h-6 w-6" />
             </button>
           </div>
-          <nav className="flex-1 space-y-1 px-2 py-4">
+          <nav ref={desktopNavRef} className="flex-1 space-y-1 px-2 py-4">
             {navigation.map((item) => (
               <Link
                 key={item.name}
                 to={item.href}
+                onMouseEnter={() => prefetchRoute(item.href)}
+                onFocus={() => prefetchRoute(item.href)}
                 className={`group flex items-center px-2 py-2 text-sm font-medium rounded-md ${
                   isActive(item.href)
                     ? 'bg-blue-100 text-blue-900'
@@ -305,9 +359,9 @@ const Layout = ({ children }: { children: React.ReactNode }) => {
               className="h-9 w-9 rounded-full bg-gradient-to-br from-blue-500 to-blue-600 flex items-center justify-center overflow-hidden shadow-sm hover:shadow-md transition-shadow duration-200 focus:outline-none focus:ring-2 focus:ring-inset focus:ring-blue-500"
               title={`Go to ${user?.first_name || 'User'}'s profile`}
             >
-              {user?.profile_photo ? (
+              {avatarUrl ? (
                 <img
-                  src={user.profile_photo}
+                  src={avatarUrl}
                   alt="Profile"
                   className="h-9 w-9 rounded-full object-cover"
                 />
@@ -379,6 +433,11 @@ const Layout = ({ children }: { children: React.ReactNode }) => {
           {/* Content */}
           <div className="relative z-10 py-6">
             <div className="mx-auto max-w-7xl px-4 sm:px-6 lg:px-8">
+              {!online && (
+                <div role="status" className="mb-6 rounded-lg border border-amber-200 bg-amber-50 px-4 py-3 text-sm text-amber-800">
+                  You are offline. Showing saved data; changes are disabled until the connection is back.
+                </div>
+              )}
               {children}
             </div>
           </div>
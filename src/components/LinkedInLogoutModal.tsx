@@ -1,5 +1,5 @@
 import React, { useState } from 'react';
-import { linkedinAuthService } from '@auth/services';
+import { loadLinkedInAuthService } from '@auth/services';
 
 interface LinkedInLogoutModalProps {
   isOpen: boolean;
@@ -24,6 +24,7 @@ const LinkedInLogoutModal: React.FC<LinkedInLogoutModalProps> = ({
     setLogoutResult('');
     
     try {
+      const linkedinAuthService = await loadLinkedInAuthService();
       const result = await linkedinAuthService.revokeAccess();
       if (result.success) {
         setLogoutResult('✅ LinkedIn access token revoked successfully!');
@@ -41,7 +42,8 @@ const LinkedInLogoutModal: React.FC<LinkedInLogoutModalProps> = ({
     }
   };
 
-  const handleRedirectToLinkedIn = () => {
+  const handleRedirectToLinkedIn = async () => {
+    const linkedinAuthService = await loadLinkedInAuthService();
     linkedinAuthService.redirectToLinkedInLogout();
     setLogoutResult('🔄 Redirecting to LinkedIn logout page...');
     setTimeout(() => {
@@ -1,5 +1,5 @@
 import React from 'react';
-import { useNotification } from '@contexts/NotificationContext';
+import { useNotification, useNotifications } from '@contexts/NotificationContext';
 import {
   CheckCircleIcon,
   ExclamationTriangleIcon,
@@ -9,7 +9,8 @@ import {
 } from '@heroicons/react/24/outline';
 
 const Notification = () => {
-  const { notifications, removeNotification } = useNotification();
+  const notifications = useNotifications();
+  const { removeNotification } = useNotification();
 
   const getIcon = (type: string) => {
     switch (type) {
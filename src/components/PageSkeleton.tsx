@@ -0,0 +1,76 @@
+import React from 'react';
+
+export type PageSkeletonVariant = 'auth' | 'dashboard' | 'list' | 'form';
+
+interface PageSkeletonProps {
+  variant?: PageSkeletonVariant;
+}
+
+const Block = ({ className = '' }: { className?: string }) => (
+  <div className={`bg-gray-200 rounded-lg animate-pulse ${className}`} />
+);
+
+/**
+ * Placeholder shown while a lazily loaded page chunk is downloading.
+ * The variant roughly matches the layout of the page being loaded.
+ */
+const PageSkeleton: React.FC<PageSkeletonProps> = ({ variant = 'list' }) => {
+  if (variant === 'auth') {
+    return (
+      <div className="min-h-screen flex items-center justify-center bg-gray-50 px-4" aria-busy="true">
+        <div className="w-full max-w-md space-y-4">
+          <Block className="h-8 w-1/2 mx-auto" />
+          <Block className="h-12" />
+          <Block className="h-12" />
+          <Block className="h-12" />
+          <div className="flex gap-3">
+            <Block className="h-10 flex-1" />
+            <Block className="h-10 flex-1" />
+          </div>
+        </div>
+      </div>
+    );
+  }
+
+  if (variant === 'dashboard') {
+    return (
+      <div className="space-y-8" aria-busy="true">
+        <Block className="h-40 rounded-2xl" />
+        <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-4 gap-6">
+          {[0, 1, 2, 3].map((index) => (
+            <Block key={index} className="h-32 rounded-2xl" />
+          ))}
+        </div>
+        <Block className="h-36 rounded-2xl" />
+        <div className="grid grid-cols-1 lg:grid-cols-2 gap-8">
+          <Block className="h-72 rounded-2xl" />
+          <Block className="h-72 rounded-2xl" />
+        </div>
+      </div>
+    );
+  }
+
+  if (variant === 'form') {
+    return (
+      <div className="max-w-4xl mx-auto space-y-6" aria-busy="true">
+        <Block className="h-10 w-1/3 mx-auto" />
+        <Block className="h-5 w-1/2 mx-auto" />
+        <Block className="h-64" />
+        <Block className="h-40" />
+      </div>
+    );
+  }
+
+  return (
+    <div className="max-w-6xl mx-auto space-y-6" aria-busy="true">
+      <Block className="h-10 w-1/3 mx-auto" />
+      <Block className="h-5 w-1/2 mx-auto" />
+      <div className="grid grid-cols-1 lg:grid-cols-2 gap-6">
+        <Block className="h-72" />
+        <Block className="h-72" />
+      </div>
+    </div>
+  );
+};
+
+export default PageSkeleton;
@@ -1,9 +1,10 @@
 import React from 'react';
 import { Navigate } from 'react-router-dom';
-import { useAuth } from '@contexts/AuthContext';
+import { useAuthSelector } from '@contexts/AuthContext';
 
 const ProtectedRoute = ({ children }: { children: React.ReactNode }) => {
-  const { user, loading } = useAuth();
+  const signedIn = useAuthSelector((state) => !!state.user);
+  const loading = useAuthSelector((state) => state.loading);
 
   if (loading) {
     return (
@@ -13,7 +14,7 @@ const ProtectedRoute = ({ children }: { children: React.ReactNode }) => {
     );
   }
 
-  if (!user) {
+  if (!signedIn) {
     return <Navigate to="/login" replace />;
   }
 
@@ -0,0 +1,40 @@
+import React, { Suspense, useEffect, useState } from 'react';
+import { useLocation } from 'react-router-dom';
+import { isTelemetryEnabled, recordRouteTiming } from '@utils/telemetry';
+
+interface RouteSuspenseProps {
+  fallback: React.ReactNode;
+  children: React.ReactNode;
+}
+
+// The first route of a page load is timed from navigation start
+let firstRoute = true;
+
+const Rendered = ({ onRendered }: { onRendered: () => void }) => {
+  useEffect(onRendered, []);
+  return null;
+};
+
+/**
+ * Suspense boundary for a lazily loaded route that reports how long the
+ * route took to render, including its chunk download, to telemetry.
+ */
+const RouteSuspense: React.FC<RouteSuspenseProps> = ({ fallback, children }) => {
+  const { pathname } = useLocation();
+  const [startedAt] = useState(() => {
+    const start = firstRoute ? 0 : performance.now();
+    firstRoute = false;
+    return start;
+  });
+
+  return (
+    <Suspense fallback={fallback}>
+      {children}
+      {isTelemetryEnabled() && (
+        <Rendered onRendered={() => recordRouteTiming(pathname, performance.now() - startedAt)} />
+      )}
+    </Suspense>
+  );
+};
+
+export default RouteSuspense;
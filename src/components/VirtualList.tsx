@@ -0,0 +1,288 @@
+import React, { useCallback, useEffect, useId, useLayoutEffect, useMemo, useRef, useState } from 'react';
+
+interface VirtualListItemState {
+  /** Item has keyboard focus within the list */
+  active: boolean;
+  selected: boolean;
+}
+
+export interface VirtualListProps<T> {
+  items: T[];
+  itemKey: (item: T, index: number) => React.Key;
+  renderItem: (item: T, index: number, state: VirtualListItemState) => React.ReactNode;
+  /**
+   * Row height in px. A number means fixed rows; a function gives a
+   * per-item estimate that is corrected by measuring rendered rows.
+   */
+  itemHeight: number | ((item: T, index: number) => number);
+  /** Maximum height of the scroll viewport in px */
+  height?: number;
+  /** Items per row, or a function of the list width for responsive grids */
+  columns?: number | ((width: number) => number);
+  /** Space between rows and columns in px */
+  gap?: number;
+  /** Rows rendered above and below the viewport */
+  overscan?: number;
+  isSelected?: (item: T, index: number) => boolean;
+  /** Called when an item is chosen with Enter or Space */
+  onSelect?: (item: T, index: number) => void;
+  /** Called when the user scrolls near the end, to load more items */
+  onEndReached?: () => void;
+  /** Distance from the end (px) at which onEndReached fires */
+  endReachedThreshold?: number;
+  /** Show a loading row after the last item */
+  loadingMore?: boolean;
+  className?: string;
+  'aria-label'?: string;
+}
+
+const LOADING_ROW_HEIGHT = 48;
+
+/**
+ * Responsive column count for grid lists: as many columns of at least
+ * `minColumnWidth` px as fit, up to `maxColumns`
+ */
+export const columnsForWidth = (minColumnWidth: number, maxColumns: number, gap = 0) =>
+  (width: number): number => Math.min(maxColumns, Math.max(1, Math.floor((width + gap) / (minColumnWidth + gap))));
+
+/**
+ * Find the last row whose offset is at or before `position`
+ */
+const findRow = (offsets: number[], position: number): number => {
+  let low = 0;
+  let high = offsets.length - 2;
+  while (low < high) {
+    const middle = Math.ceil((low + high) / 2);
+    if (offsets[middle] <= position) {
+      low = middle;
+    } else {
+      high = middle - 1;
+    }
+  }
+  return Math.max(0, low);
+};
+
+/**
+ * Windowed list: only the rows in (or near) the viewport are mounted, so
+ * long resume and job description lists render in constant time.
+ * Supports fixed and measured variable row heights, multi-column grids,
+ * keyboard navigation and incremental loading.
+ */
+function VirtualList<T>({
+  items,
+  itemKey,
+  renderItem,
+  itemHeight,
+  height = 400,
+  columns = 1,
+  gap = 0,
+  overscan = 4,
+  isSelected,
+  onSelect,
+  onEndReached,
+  endReachedThreshold = 200,
+  loadingMore = false,
+  className = '',
+  'aria-label': ariaLabel,
+}: VirtualListProps<T>) {
+  const listId = useId();
+  const containerRef = useRef<HTMLDivElement>(null);
+  const [scrollTop, setScrollTop] = useState(0);
+  const [width, setWidth] = useState(0);
+  const [activeIndex, setActiveIndex] = useState(-1);
+  const measuredHeights = useRef(new Map<string, number>());
+  const [measureVersion, setMeasureVersion] = useState(0);
+  const endReachedFor = useRef(-1);
+
+  const columnCount = Math.max(1, typeof columns === 'function' ? columns(width) : columns);
+  const rowCount = Math.ceil(items.length / columnCount);
+  const measured = typeof itemHeight === 'function';
+
+  // Track the list width for responsive column counts
+  useLayoutEffect(() => {
+    const element = containerRef.current;
+    if (!element) return;
+    setWidth(element.clientWidth);
+    if (typeof ResizeObserver === 'undefined') return;
+    const observer = new ResizeObserver(([entry]) => setWidth(entry.contentRect.width));
+    observer.observe(element);
+    return () => observer.disconnect();
+  }, []);
+
+  const rowKey = (row: number) => String(itemKey(items[row * columnCount], row * columnCount));
+
+  // Prefix sums of row heights: offsets[row] is the top of that row
+  const offsets = useMemo(() => {
+    const result = new Array<number>(rowCount + 1);
+    result[0] = 0;
+    for (let row = 0; row < rowCount; row++) {
+      let rowHeight: number;
+      if (typeof itemHeight === 'number') {
+        rowHeight = itemHeight;
+      } else {
+        rowHeight = measuredHeights.current.get(rowKey(row)) ?? 0;
+        if (!rowHeight) {
+          const end = Math.min(items.length, (row + 1) * columnCount);
+          for (let index = row * columnCount; index < end; index++) {
+            rowHeight = Math.max(rowHeight, itemHeight(items[index], index));
+          }
+        }
+      }
+      result[row + 1] = result[row] + rowHeight + (row < rowCount - 1 ? gap : 0);
+    }
+    return result;
+  }, [items, itemHeight, columnCount, rowCount, gap, measureVersion]);
+
+  const contentHeight = offsets[rowCount] + (loadingMore ? LOADING_ROW_HEIGHT : 0);
+  const viewportHeight = Math.min(height, contentHeight);
+  const firstRow = rowCount > 0 ? Math.max(0, findRow(offsets, scrollTop) - overscan) : 0;
+  const lastRow = rowCount > 0 ? Math.min(rowCount - 1, findRow(offsets, scrollTop + viewportHeight) + overscan) : -1;
+
+  // Measure rendered rows when heights are only estimates
+  const resizeObserver = useMemo(() => {
+    if (!measured || typeof ResizeObserver === 'undefined') return null;
+    return new ResizeObserver((entries) => {
+      let changed = false;
+      entries.forEach((entry) => {
+        const key = (entry.target as HTMLElement).dataset.rowKey;
+        if (key === undefined) return;
+        const next = Math.ceil(entry.borderBoxSize?.[0]?.blockSize ?? entry.contentRect.height);
+        if (next > 0 && measuredHeights.current.get(key) !== next) {
+          measuredHeights.current.set(key, next);
+          changed = true;
+        }
+      });
+      if (changed) setMeasureVersion((version) => version + 1);
+    });
+  }, [measured]);
+
+  useEffect(() => () => resizeObserver?.disconnect(), [resizeObserver]);
+
+  const measureRow = useCallback((element: HTMLDivElement | null) => {
+    if (!element || !resizeObserver) return;
+    resizeObserver.observe(element);
+    return () => resizeObserver.unobserve(element);
+  }, [resizeObserver]);
+
+  // Incremental loading: ask once per list length when nearing the end
+  useEffect(() => {
+    if (!onEndReached || loadingMore || items.length === 0) return;
+    if (scrollTop + viewportHeight >= offsets[rowCount] - endReachedThreshold && endReachedFor.current !== items.length) {
+      endReachedFor.current = items.length;
+      onEndReached();
+    }
+  }, [scrollTop, viewportHeight, offsets, rowCount, items.length, loadingMore, onEndReached, endReachedThreshold]);
+
+  const scrollToIndex = (index: number): void => {
+    const container = containerRef.current;
+    if (!container) return;
+    const row = Math.floor(index / columnCount);
+    const top = offsets[row];
+    const bottom = offsets[row + 1];
+    if (top < container.scrollTop) {
+      container.scrollTop = top;
+    } else if (bottom > container.scrollTop + container.clientHeight) {
+      container.scrollTop = bottom - container.clientHeight;
+    }
+  };
+
+  const moveTo = (index: number): void => {
+    const next = Math.max(0, Math.min(items.length - 1, index));
+    setActiveIndex(next);
+    scrollToIndex(next);
+  };
+
+  const handleKeyDown = (event: React.KeyboardEvent<HTMLDivElement>): void => {
+    if (items.length === 0 || event.target !== event.currentTarget) return;
+    const rowsPerPage = Math.max(1, findRow(offsets, scrollTop + viewportHeight) - findRow(offsets, scrollTop));
+    const current = activeIndex < 0 ? 0 : activeIndex;
+
+    const moves: Record<string, () => number> = {
+      ArrowDown: () => (activeIndex < 0 ? 0 : current + columnCount),
+      ArrowUp: () => current - columnCount,
+      ArrowRight: () => current + 1,
+      ArrowLeft: () => current - 1,
+      PageDown: () => current + rowsPerPage * columnCount,
+      PageUp: () => current - rowsPerPage * columnCount,
+      Home: () => 0,
+      End: () => items.length - 1,
+    };
+
+    if (moves[event.key]) {
+      if (columnCount === 1 && (event.key === 'ArrowRight' || event.key === 'ArrowLeft')) return;
+      event.preventDefault();
+      moveTo(moves[event.key]());
+    } else if ((event.key === 'Enter' || event.key === ' ') && activeIndex >= 0) {
+      event.preventDefault();
+      onSelect?.(items[activeIndex], activeIndex);
+    }
+  };
+
+  const rows: React.ReactNode[] = [];
+  for (let row = firstRow; row <= lastRow; row++) {
+    const start = row * columnCount;
+    const rowItems = items.slice(start, start + columnCount);
+    rows.push(
+      <div
+        key={rowKey(row)}
+        ref={measured ? measureRow : undefined}
+        data-row-key={measured ? rowKey(row) : undefined}
+        className="absolute left-0 right-0 grid"
+        style={{
+          top: 0,
+          transform: `translateY(${offsets[row]}px)`,
+          height: measured ? undefined : offsets[row + 1] - offsets[row] - (row < rowCount - 1 ? gap : 0),
+          gridTemplateColumns: `repeat(${columnCount}, minmax(0, 1fr))`,
+          columnGap: gap,
+        }}
+      >
+        {rowItems.map((item, offset) => {
+          const index = start + offset;
+          const selected = isSelected?.(item, index) ?? false;
+          return (
+            <div
+              key={itemKey(item, index)}
+              id={`${listId}-option-${index}`}
+              role="option"
+              aria-selected={selected}
+              aria-posinset={index + 1}
+              aria-setsize={items.length}
+              className={index === activeIndex ? 'rounded-lg ring-2 ring-blue-500 ring-offset-1' : undefined}
+              onMouseDown={() => setActiveIndex(index)}
+            >
+              {renderItem(item, index, { active: index === activeIndex, selected })}
+            </div>
+          );
+        })}
+      </div>
+    );
+  }
+
+  return (
+    <div
+      ref={containerRef}
+      role="listbox"
+      tabIndex={0}
+      aria-label={ariaLabel}
+      aria-activedescendant={activeIndex >= 0 ? `${listId}-option-${activeIndex}` : undefined}
+      onKeyDown={handleKeyDown}
+      onScroll={(event) => setScrollTop(event.currentTarget.scrollTop)}
+      className={`relative overflow-y-auto focus:outline-none ${className}`}
+      style={{ height: viewportHeight }}
+    >
+      <div className="relative" style={{ height: contentHeight }}>
+        {rows}
+        {loadingMore && (
+          <div
+            className="absolute left-0 right-0 flex items-center justify-center"
+            style={{ top: offsets[rowCount], height: LOADING_ROW_HEIGHT }}
+          >
+            <div className="animate-spin rounded-full h-6 w-6 border-b-2 border-blue-600"></div>
+          </div>
+        )}
+      </div>
+    </div>
+  );
+}
+
+export default VirtualList;
@@ -2,6 +2,10 @@
 export { default as Layout } from './Layout';
 export { default as Notification } from './Notification';
 export { default as ProtectedRoute } from './ProtectedRoute';
+export { default as PageSkeleton } from './PageSkeleton';
+export { default as RouteSuspense } from './RouteSuspense';
+export { default as KeywordPreMatch } from './KeywordPreMatch';
+export { default as VirtualList } from './VirtualList';
 export { default as LinkedInLogoutModal } from './LinkedInLogoutModal';
 export { default as LogoutTest } from './LogoutTest';
 
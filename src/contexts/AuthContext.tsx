@@ -1,10 +1,85 @@
-import React, { createContext, useContext, useState, useEffect, useMemo } from 'react';
-import { authService, googleAuthService, linkedinAuthService, logoutService } from '@auth/services';
-import type { User, AuthContextType } from '@types';
+import React, { createContext, useContext, useEffect, useMemo, useSyncExternalStore } from 'react';
+import { authService, loadGoogleAuthService, loadLinkedInAuthService, logoutService } from '@auth/services';
+import { queryCache } from '@utils/queryCache';
+import { persistentCache } from '@utils/persistentCache';
+import { clearOfflineData } from '@utils/serviceWorker';
+import { avatarCache } from '@profile/services';
+import { tokenStore } from '@utils/tokenStore';
+import type { User, AuthActions, AuthContextType, AuthState } from '@types';
 
-const AuthContext = createContext<AuthContextType | undefined>(undefined);
+/** Delay (ms) before user changes are written to localStorage */
+const PERSIST_USER_DELAY = 500;
 
-export const useAuth = () => {
+type AuthListener = () => void;
+
+const restoreUser = (): User | null => {
+  // Try to restore user from localStorage on initialization
+  try {
+    const savedUser = localStorage.getItem('user');
+    return savedUser ? JSON.parse(savedUser) : null;
+  } catch {
+    return null;
+  }
+};
+
+/**
+ * Auth state store
+ * Components read slices of it with useAuthSelector and re-render only
+ * when their slice changes.
+ */
+const authStore = (() => {
+  const user = restoreUser();
+  // Only block rendering when there is a session but no cached user to show
+  let state: AuthState = { user, loading: !!tokenStore.get() && !user };
+  const listeners = new Set<AuthListener>();
+
+  return {
+    getState: (): AuthState => state,
+    setState: (patch: Partial<AuthState>): void => {
+      state = { ...state, ...patch };
+      listeners.forEach((listener) => listener());
+    },
+    subscribe: (listener: AuthListener): (() => void) => {
+      listeners.add(listener);
+      return () => {
+        listeners.delete(listener);
+      };
+    }
+  };
+})();
+
+let persistTimer: ReturnType<typeof setTimeout> | null = null;
+
+const flushUserPersistence = (): void => {
+  if (!persistTimer) return;
+  clearTimeout(persistTimer);
+  persistTimer = null;
+  const { user } = authStore.getState();
+  if (user) localStorage.setItem('user', JSON.stringify(user));
+};
+
+// Writes are deferred; make sure the latest user is saved before the page goes away
+if (typeof window !== 'undefined') {
+  addEventListener('pagehide', flushUserPersistence);
+}
+
+// Save the user off the critical path; sign-out is removed at once
+const saveUserToStorage = (userData: User | null) => {
+  if (userData) {
+    if (!persistTimer) persistTimer = setTimeout(flushUserPersistence, PERSIST_USER_DELAY);
+  } else {
+    if (persistTimer) clearTimeout(persistTimer);
+    persistTimer = null;
+    localStorage.removeItem('user');
+  }
+};
+
+const AuthContext = createContext<AuthActions | undefined>(undefined);
+
+/**
+ * Stable auth actions (login, logout, updateUser, ...); never cause re-renders
+ */
+export const useAuthActions = (): AuthActions => {
   const context = useContext(AuthContext);
   if (!context) {
     throw new Error('useAuth must be used within an AuthProvider');
@@ -12,30 +87,32 @@ export const useAuth = () => {
   return context;
 };
 
+/**
+ * Subscribe to one slice of the auth state, e.g.
+ * `useAuthSelector((state) => state.user?.first_name)`. The selector must
+ * return stored values or primitives, not new objects.
+ */
+export const useAuthSelector = <T,>(selector: (state: AuthState) => T): T =>
+  useSyncExternalStore(authStore.subscribe, () => selector(authStore.getState()));
+
+/**
+ * Whole auth state plus actions; re-renders on every auth change.
+ * Prefer useAuthSelector and useAuthActions.
+ */
+export const useAuth = (): AuthContextType => {
+  const actions = useAuthActions();
+  const state = useAuthSelector((current) => current);
+  return useMemo(() => ({ ...state, ...actions }), [state, actions]);
+};
+
 interface AuthProviderProps {
   children: React.ReactNode;
 }
 
 export const AuthProvider = ({ children }: AuthProviderProps) => {
-  const [user, setUser] = useState<User | null>(() => {
-    // Try to restore user from localStorage on initialization
-    try {
-      const savedUser = localStorage.getItem('user');
-      return savedUser ? JSON.parse(savedUser) : null;
-    } catch {
-      return null;
-    }
-  });
-  const [loading, setLoading] = useState<boolean>(true);
-
-  // Helper function to save user to localStorage
-  const saveUserToStorage = (userData: User | null) => {
-    if (userData) {
-      localStorage.setItem('user', JSON.stringify(userData));
-    } else {
-      localStorage.removeItem('user');
-    }
-  };
+  const user = useAuthSelector((state) => state.user);
+  const setUser = (userData: User | null) => authStore.setState({ user: userData });
+  const setLoading = (loading: boolean) => authStore.setState({ loading });
 
   // Helper function to set user and save to storage
   const setUserAndSave = (userData: User | null) => {
@@ -43,9 +120,17 @@ export const AuthProvider = ({ children }: AuthProviderProps) => {
     saveUserToStorage(userData);
   };
 
+  // Drop every cache holding data of the signed-in user
+  const clearUserData = () => {
+    queryCache.clear();
+    persistentCache.clear();
+    clearOfflineData();
+    avatarCache.clear();
+  };
+
+  // The cached user is shown right away; the session is revalidated in the background
   useEffect(() => {
-    const token = localStorage.getItem('token');
-    if (token) {
+    if (tokenStore.get()) {
       // Initialize auth method detection
       logoutService.initializeAuthMethod();
       
@@ -54,22 +139,45 @@ export const AuthProvider = ({ children }: AuthProviderProps) => {
           setUserAndSave(response.user || null);
         })
         .catch((error) => {
-          // Only clear token if it's an actual authentication error, not a network error
-          if (error.response?.status === 401 && error.response?.data?.message?.includes('token')) {
-            localStorage.removeItem('token');
+          // Only sign out if the server rejected the token, not on network errors
+          if (error.response?.status === 401) {
+            tokenStore.clear();
             localStorage.removeItem('google_auth_token');
             localStorage.removeItem('linkedin_auth_token');
+            setUserAndSave(null);
+            clearUserData();
           }
           // For network errors, keep the token and user state
         })
         .finally(() => {
           setLoading(false);
         });
-    } else {
-      setLoading(false);
     }
   }, []);
 
+  // Follow logins and logouts made in other tabs, and sessions ended by a failed token refresh
+  useEffect(() => {
+    let previousToken = tokenStore.get();
+    return tokenStore.subscribe((token, external) => {
+      const wasSignedOut = !previousToken;
+      previousToken = token;
+      if (!token) {
+        if (authStore.getState().user) {
+          setUserAndSave(null);
+          clearUserData();
+        }
+        return;
+      }
+      // A refresh rotating the token of a live session changes nothing about the user
+      if (!external || (!wasSignedOut && authStore.getState().user)) return;
+      authService.getCurrentUser()
+        .then((response) => setUserAndSave(response.user || null))
+        .catch(() => {
+          // Keep the current state; the next request will surface any problem
+        });
+    });
+  }, []);
+
   // Handle LinkedIn OAuth callback
   useEffect(() => {
     const handleLinkedInCallback = async () => {
@@ -82,11 +190,12 @@ export const AuthProvider = ({ children }: AuthProviderProps) => {
         setLoading(true);
         try {
           console.log('🔗 LinkedIn OAuth callback - processing...');
+          const linkedinAuthService = await loadLinkedInAuthService();
           const response = await linkedinAuthService.signIn();
           console.log('🔗 LinkedIn response:', response);
           
           if (response.success && response.token) {
-            localStorage.setItem('token', response.token);
+            tokenStore.set(response.token);
             // Store LinkedIn auth token for detection
             localStorage.setItem('linkedin_auth_token', response.token);
             // Track authentication method
@@ -127,7 +236,8 @@ export const AuthProvider = ({ children }: AuthProviderProps) => {
     try {
       const response = await authService.login(email, password);
       if (response.token) {
-        localStorage.setItem('token', response.token);
+        tokenStore.setRefreshToken(response.refresh_token);
+        tokenStore.set(response.token);
         // Track authentication method
         logoutService.setAuthMethod('email');
       }
@@ -144,7 +254,8 @@ export const AuthProvider = ({ children }: AuthProviderProps) => {
     try {
       const response = await authService.register(email, password, firstName, lastName);
       if (response.token) {
-        localStorage.setItem('token', response.token);
+        tokenStore.setRefreshToken(response.refresh_token);
+        tokenStore.set(response.token);
         // Track authentication method
         logoutService.setAuthMethod('email');
       }
@@ -162,14 +273,16 @@ export const AuthProvider = ({ children }: AuthProviderProps) => {
       // Use the comprehensive logout service
       const result = await logoutService.logout();
       
-      // Clear user state
+      // Clear user state and any data cached for this user
       setUserAndSave(null);
+      clearUserData();
       
       return result;
     } catch (error: any) {
       // Fallback to basic logout if service fails
-      localStorage.removeItem('token');
+      tokenStore.clear();
       setUser(null);
+      clearUserData();
       return { 
         success: false, 
         error: error.message || 'Logout failed' 
@@ -179,9 +292,10 @@ export const AuthProvider = ({ children }: AuthProviderProps) => {
 
   const googleLogin = async (): Promise<{ success: boolean; error?: string }> => {
     try {
+      const googleAuthService = await loadGoogleAuthService();
       const response = await googleAuthService.signIn();
       if (response.success && response.token) {
-        localStorage.setItem('token', response.token);
+        tokenStore.set(response.token);
         // Store Google auth token for detection
         localStorage.setItem('google_auth_token', response.token);
         // Track authentication method
@@ -217,11 +331,12 @@ export const AuthProvider = ({ children }: AuthProviderProps) => {
   const linkedinLogin = async (): Promise<{ success: boolean; error?: string }> => {
     try {
       console.log('🔗 LinkedIn login initiated...');
+      const linkedinAuthService = await loadLinkedInAuthService();
       const response = await linkedinAuthService.signIn();
       console.log('🔗 LinkedIn login response:', response);
       
       if (response.success && response.token) {
-        localStorage.setItem('token', response.token);
+        tokenStore.set(response.token);
         // Store LinkedIn auth token for detection
         localStorage.setItem('linkedin_auth_token', response.token);
         // Track authentication method
@@ -256,25 +371,25 @@ export const AuthProvider = ({ children }: AuthProviderProps) => {
   };
 
   const updateUser = (userData: Partial<User>) => {
-    if (user) {
-      const updatedUser = { ...user, ...userData };
+    const { user: currentUser } = authStore.getState();
+    if (currentUser) {
+      const updatedUser = { ...currentUser, ...userData };
       setUserAndSave(updatedUser);
     }
   };
 
-  const value = useMemo(() => ({
-    user,
+  // The actions only go through the store, so the first render's closures stay valid
+  const actions = useMemo<AuthActions>(() => ({
     login,
     register,
     googleLogin,
     linkedinLogin,
     logout,
-    updateUser,
-    loading
-  }), [user, loading]);
+    updateUser
+  }), []);
 
   return (
-    <AuthContext.Provider value={value}>
+    <AuthContext.Provider value={actions}>
       {children}
     </AuthContext.Provider>
   );
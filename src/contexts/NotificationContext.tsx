@@ -1,5 +1,95 @@
-import React, { createContext, useContext, useState } from 'react';
-import type { NotificationContextType, Notification } from '@types';
+import React, { createContext, useContext, useSyncExternalStore } from 'react';
+import type { NotificationContextType, Notification, NotificationType } from '@types';
+
+/** Toasts shown at once; the oldest is dropped when another arrives */
+const MAX_NOTIFICATIONS = 5;
+
+/** Toasts expiring within this window (ms) of each other are removed together */
+const EXPIRY_BATCH_WINDOW = 250;
+
+type NotificationListener = () => void;
+
+/**
+ * Toast store
+ * Holds the visible toasts outside React so firing one re-renders only the
+ * toast list, never the components that fired it. All expiry goes through
+ * a single timer set for the earliest deadline.
+ */
+class NotificationStore {
+  private notifications: Notification[] = [];
+  private expiresAt = new Map<number, number>();
+  private listeners = new Set<NotificationListener>();
+  private timer: ReturnType<typeof setTimeout> | null = null;
+  private nextId = 0;
+
+  subscribe = (listener: NotificationListener): (() => void) => {
+    this.listeners.add(listener);
+    return () => {
+      this.listeners.delete(listener);
+    };
+  };
+
+  getSnapshot = (): Notification[] => this.notifications;
+
+  add(message: string, type: NotificationType = 'info', duration: number = 5000): number {
+    const id = ++this.nextId;
+    const next = [...this.notifications, { id, message, type, duration }];
+    this.set(next.slice(-MAX_NOTIFICATIONS));
+    if (duration > 0) {
+      this.expiresAt.set(id, Date.now() + duration);
+      this.schedule();
+    }
+    return id;
+  }
+
+  remove(id: number): void {
+    if (!this.notifications.some((notification) => notification.id === id)) return;
+    this.set(this.notifications.filter((notification) => notification.id !== id));
+  }
+
+  clear(): void {
+    this.set([]);
+  }
+
+  private set(notifications: Notification[]): void {
+    this.notifications = notifications;
+    // Forget deadlines of toasts that are gone (closed or pushed out)
+    const visible = new Set(notifications.map((notification) => notification.id));
+    this.expiresAt.forEach((_, id) => {
+      if (!visible.has(id)) this.expiresAt.delete(id);
+    });
+    this.schedule();
+    this.listeners.forEach((listener) => listener());
+  }
+
+  private schedule(): void {
+    if (this.timer) {
+      clearTimeout(this.timer);
+      this.timer = null;
+    }
+    if (this.expiresAt.size === 0) return;
+
+    const earliest = Math.min(...this.expiresAt.values());
+    this.timer = setTimeout(() => {
+      this.timer = null;
+      const cutoff = Date.now() + EXPIRY_BATCH_WINDOW;
+      this.set(this.notifications.filter((notification) => (this.expiresAt.get(notification.id) ?? Infinity) > cutoff));
+    }, Math.max(0, earliest - Date.now()));
+  }
+}
+
+const notificationStore = new NotificationStore();
+
+// Actions never change, so components firing toasts never re-render because of them
+const notificationActions: NotificationContextType = {
+  addNotification: (message, type, duration) => notificationStore.add(message, type, duration),
+  removeNotification: (id) => notificationStore.remove(id),
+  success: (message, duration) => notificationStore.add(message, 'success', duration),
+  error: (message, duration) => notificationStore.add(message, 'error', duration),
+  warning: (message, duration) => notificationStore.add(message, 'warning', duration),
+  info: (message, duration) => notificationStore.add(message, 'info', duration),
+  clear: () => notificationStore.clear()
+};
 
 const NotificationContext = createContext<NotificationContextType | undefined>(undefined);
 
@@ -11,52 +101,18 @@ export const useNotification = () => {
   return context;
 };
 
+/**
+ * Visible toasts. Only the component rendering them should subscribe.
+ */
+export const useNotifications = (): Notification[] =>
+  useSyncExternalStore(notificationStore.subscribe, notificationStore.getSnapshot);
+
 interface NotificationProviderProps {
   children: React.ReactNode;
 }
 
-export const NotificationProvider = ({ children }: NotificationProviderProps) => {
-  const [notifications, setNotifications] = useState<Notification[]>([]);
-
-  const addNotification = (message: string, type: 'info' | 'success' | 'warning' | 'error' = 'info', duration: number = 5000) => {
-    const id = Date.now() + Math.random();
-    const notification: Notification = { id, message, type, duration };
-    
-    setNotifications(prev => [...prev, notification]);
-    
-    if (duration > 0) {
-      setTimeout(() => {
-        removeNotification(id);
-      }, duration);
-    }
-    
-    return id;
-  };
-
-  const removeNotification = (id: number) => {
-    setNotifications(prev => prev.filter(notification => notification.id !== id));
-  };
-
-  const success = (message: string, duration?: number) => addNotification(message, 'success', duration);
-  const error = (message: string, duration?: number) => addNotification(message, 'error', duration);
-  const warning = (message: string, duration?: number) => addNotification(message, 'warning', duration);
-  const info = (message: string, duration?: number) => addNotification(message, 'info', duration);
-  const clear = () => setNotifications([]);
-
-  const value = {
-    notifications,
-    addNotification,
-    removeNotification,
-    success,
-    error,
-    warning,
-    info,
-    clear
-  };
-
-  return (
-    <NotificationContext.Provider value={value}>
-      {children}
-    </NotificationContext.Provider>
-  );
-};
+export const NotificationProvider = ({ children }: NotificationProviderProps) => (
+  <NotificationContext.Provider value={notificationActions}>
+    {children}
+  </NotificationContext.Provider>
+);
@@ -1,3 +1,3 @@
 // Core contexts
-export { AuthProvider, useAuth } from './AuthContext';
-export { NotificationProvider, useNotification } from './NotificationContext';
+export { AuthProvider, useAuth, useAuthActions, useAuthSelector } from './AuthContext';
+export { NotificationProvider, useNotification, useNotifications } from './NotificationContext';
@@ -0,0 +1,8 @@
+// Shared hooks
+export * from './useQuery';
+export * from './useKeywordPreMatch';
+export * from './useInfiniteQuery';
+export * from './useDebouncedValue';
+export * from './useResumeList';
+export * from './useOnlineStatus';
+export * from './useAvatar';
@@ -0,0 +1,27 @@
+import { useCallback, useEffect, useState, useSyncExternalStore } from 'react';
+import { avatarCache, avatarVariantFor } from '@profile/services';
+import type { User } from '@types';
+
+/**
+ * Object URL of a user's profile photo, sized for `displaySize` CSS px.
+ * Every component showing the same user shares one cached download;
+ * falls back to the photo URL on the user record if loading fails.
+ */
+export const useAvatar = (user: User | null | undefined, displaySize: number): string | null => {
+  const userId = user?.profile_photo ? user.id : null;
+  const [failed, setFailed] = useState<boolean>(false);
+
+  const subscribe = useCallback((onChange: () => void) => avatarCache.subscribe(onChange), []);
+  const getSnapshot = useCallback(() => (userId !== null ? avatarCache.getUrl(userId) : null), [userId]);
+  const url = useSyncExternalStore(subscribe, getSnapshot);
+
+  const size = avatarVariantFor(displaySize);
+  useEffect(() => {
+    setFailed(false);
+    if (userId === null) return;
+    avatarCache.load(userId, size).catch(() => setFailed(true));
+  }, [userId, size, user?.profile_photo]);
+
+  if (!user?.profile_photo) return null;
+  return url ?? (failed ? user.profile_photo : null);
+};
@@ -0,0 +1,16 @@
+import { useEffect, useState } from 'react';
+
+/**
+ * `value`, updated only after it has stopped changing for `delay` ms.
+ * Use it for search inputs that drive queries.
+ */
+export const useDebouncedValue = <T>(value: T, delay: number = 300): T => {
+  const [debounced, setDebounced] = useState<T>(value);
+
+  useEffect(() => {
+    const timer = setTimeout(() => setDebounced(value), delay);
+    return () => clearTimeout(timer);
+  }, [value, delay]);
+
+  return debounced;
+};
@@ -0,0 +1,121 @@
+import { useCallback, useEffect, useRef, useState, useSyncExternalStore } from 'react';
+import { queryCache } from '@utils/queryCache';
+import type { QueryFetchOptions } from '@utils/queryCache';
+import { isAbortError } from '@utils/httpClient';
+import type { InfiniteData } from '@types';
+
+const NO_PAGES: never[] = [];
+
+export interface UseInfiniteQueryOptions<P> {
+  /** Cursor of the page after `page`, or null/undefined on the last page */
+  getNextCursor: (page: P) => string | null | undefined;
+  enabled?: boolean;
+}
+
+export interface UseInfiniteQueryResult<P> {
+  pages: P[];
+  error: any;
+  isLoading: boolean;
+  isFetching: boolean;
+  isFetchingNextPage: boolean;
+  hasNextPage: boolean;
+  fetchNextPage: () => Promise<void>;
+  refetch: () => Promise<InfiniteData<P>>;
+}
+
+/**
+ * Subscribe a component to a cursor-paginated list query.
+ * `loadPage` is a cache-aware service method taking the page cursor
+ * (null for the first page). Loaded pages are kept in the query cache under
+ * `key`, so returning to a view restores them without refetching; when the
+ * query goes stale or is invalidated it restarts from the first page.
+ */
+export const useInfiniteQuery = <P>(
+  key: string | null,
+  loadPage: (cursor: string | null, options?: QueryFetchOptions) => Promise<P>,
+  { getNextCursor, enabled = true }: UseInfiniteQueryOptions<P>
+): UseInfiniteQueryResult<P> => {
+  const loadPageRef = useRef(loadPage);
+  loadPageRef.current = loadPage;
+  const getNextCursorRef = useRef(getNextCursor);
+  getNextCursorRef.current = getNextCursor;
+  const nextPageRequest = useRef<Promise<void> | null>(null);
+  const [isFetchingNextPage, setFetchingNextPage] = useState<boolean>(false);
+  const [nextPageError, setNextPageError] = useState<any>(null);
+
+  const subscribe = useCallback(
+    (onChange: () => void) => (key ? queryCache.subscribe(key, onChange) : () => {}),
+    [key]
+  );
+  const getSnapshot = useCallback(() => (key ? queryCache.getEntry<InfiniteData<P>>(key) : undefined), [key]);
+  const entry = useSyncExternalStore(subscribe, getSnapshot);
+
+  const loadFirstPage = useCallback((options?: QueryFetchOptions) => {
+    if (!key) return Promise.reject(new Error('Query is disabled'));
+    return queryCache.fetch<InfiniteData<P>>(
+      key,
+      async () => {
+        // The page entry may be just as stale as the list, so bypass it
+        const page = await loadPageRef.current(null, { force: true });
+        return { pages: [page], nextCursor: getNextCursorRef.current(page) ?? null };
+      },
+      options
+    );
+  }, [key]);
+
+  // Load on mount, key change and whenever the entry is invalidated
+  const invalidations = entry?.invalidations ?? 0;
+  useEffect(() => {
+    setNextPageError(null);
+    if (!key || !enabled) return;
+    loadFirstPage().catch(() => {}); // Errors are exposed through the entry
+  }, [key, enabled, invalidations, loadFirstPage]);
+
+  // Cancel outstanding page requests once this key is no longer needed
+  useEffect(() => {
+    if (!key) return;
+    return () => queryCache.release(key);
+  }, [key]);
+
+  const fetchNextPage = useCallback((): Promise<void> => {
+    const cursor = key ? queryCache.getData<InfiniteData<P>>(key)?.nextCursor : null;
+    if (!key || !cursor) return Promise.resolve();
+    if (nextPageRequest.current) return nextPageRequest.current;
+
+    setFetchingNextPage(true);
+    setNextPageError(null);
+    const request = loadPageRef.current(cursor)
+      .then((page) => {
+        // Drop the page if the list was reloaded from the start meanwhile
+        if (queryCache.getData<InfiniteData<P>>(key)?.nextCursor !== cursor) return;
+        queryCache.setData<InfiniteData<P>>(key, (previous) => ({
+          pages: [...(previous?.pages || []), page],
+          nextCursor: getNextCursorRef.current(page) ?? null
+        }));
+      })
+      .catch((error) => {
+        if (!isAbortError(error)) setNextPageError(error);
+      })
+      .finally(() => {
+        nextPageRequest.current = null;
+        setFetchingNextPage(false);
+      });
+
+    nextPageRequest.current = request;
+    return request;
+  }, [key]);
+
+  const refetch = useCallback(() => loadFirstPage({ force: true }), [loadFirstPage]);
+
+  const hasData = !!entry && entry.updatedAt > 0;
+  return {
+    pages: entry?.data?.pages || NO_PAGES,
+    error: entry?.error || nextPageError,
+    isLoading: enabled && !!key && !hasData && !entry?.error,
+    isFetching: entry?.isFetching ?? false,
+    isFetchingNextPage,
+    hasNextPage: !!entry?.data?.nextCursor,
+    fetchNextPage,
+    refetch
+  };
+};
@@ -0,0 +1,114 @@
+import { useEffect, useState } from 'react';
+import type { PreMatchResult } from '@utils/keywordMatcher';
+import type {
+  KeywordExtractionRequest,
+  KeywordExtractionResponse
+} from '../workers/keywordExtraction.worker';
+
+/**
+ * Delay (ms) after the last keystroke before the text is analyzed
+ */
+const PRE_MATCH_DEBOUNCE = 60;
+
+interface PendingRequest {
+  request: KeywordExtractionRequest;
+  resolve: (result: PreMatchResult) => void;
+}
+
+let worker: Worker | null = null;
+// Set once the worker failed to load or crashed; later requests run on the main thread
+let workerFailed = false;
+let nextRequestId = 0;
+const pending = new Map<number, PendingRequest>();
+
+/**
+ * Match on the main thread, for browsers without workers or a failed worker
+ */
+const preMatchOnMainThread = async (text: string, resumeKeywords: string[]): Promise<PreMatchResult> => {
+  const { KeywordMatcher } = await import('@utils/keywordMatcher');
+  return new KeywordMatcher().preMatch(text, resumeKeywords);
+};
+
+/**
+ * Drop a broken worker and answer whatever it was still working on
+ */
+const discardWorker = (): void => {
+  worker?.terminate();
+  worker = null;
+  workerFailed = true;
+  const requests = [...pending.values()];
+  pending.clear();
+  requests.forEach(({ request, resolve }) => {
+    preMatchOnMainThread(request.text, request.resumeKeywords).then(resolve);
+  });
+};
+
+/**
+ * Shared worker, created on first use; null without worker support or
+ * once the worker could not run
+ */
+const getWorker = (): Worker | null => {
+  if (worker || workerFailed || typeof Worker === 'undefined') return worker;
+  worker = new Worker(new URL('../workers/keywordExtraction.worker.ts', import.meta.url), {
+    type: 'module'
+  });
+  worker.addEventListener('message', (event: MessageEvent<KeywordExtractionResponse>) => {
+    const { id, ...result } = event.data;
+    pending.get(id)?.resolve(result);
+    pending.delete(id);
+  });
+  // Script failed to load (CSP, chunk gone after a deploy) or a message could not be deserialized
+  worker.addEventListener('error', (event) => {
+    event.preventDefault();
+    discardWorker();
+  });
+  worker.addEventListener('messageerror', discardWorker);
+  return worker;
+};
+
+/**
+ * Extract skills from the text and score them against the resume keywords
+ */
+const runPreMatch = async (text: string, resumeKeywords: string[]): Promise<PreMatchResult> => {
+  const keywordWorker = getWorker();
+  if (!keywordWorker) {
+    return preMatchOnMainThread(text, resumeKeywords);
+  }
+
+  const id = ++nextRequestId;
+  return new Promise((resolve) => {
+    const request: KeywordExtractionRequest = { id, text, resumeKeywords };
+    pending.set(id, { request, resolve });
+    keywordWorker.postMessage(request);
+  });
+};
+
+/**
+ * Instant, client-side keyword pre-match of a job description against a
+ * resume. Returns null until the text contains something to analyze.
+ */
+export const useKeywordPreMatch = (text: string, resumeKeywords: string[]): PreMatchResult | null => {
+  const [result, setResult] = useState<PreMatchResult | null>(null);
+  const keywordsKey = resumeKeywords.join('\n');
+
+  useEffect(() => {
+    if (!text.trim()) {
+      setResult(null);
+      return;
+    }
+
+    let cancelled = false;
+    const timer = setTimeout(() => {
+      runPreMatch(text, resumeKeywords).then((nextResult) => {
+        if (!cancelled) setResult(nextResult);
+      });
+    }, PRE_MATCH_DEBOUNCE);
+
+    return () => {
+      cancelled = true;
+      clearTimeout(timer);
+    };
+  }, [text, keywordsKey]);
+
+  return result;
+};
@@ -0,0 +1,18 @@
+import { useSyncExternalStore } from 'react';
+
+const subscribe = (onChange: () => void) => {
+  addEventListener('online', onChange);
+  addEventListener('offline', onChange);
+  return () => {
+    removeEventListener('online', onChange);
+    removeEventListener('offline', onChange);
+  };
+};
+
+const getSnapshot = () => navigator.onLine;
+
+/**
+ * Whether the browser reports a network connection. While offline the app
+ * is read-only: pages render stored data and changes are rejected.
+ */
+export const useOnlineStatus = (): boolean => useSyncExternalStore(subscribe, getSnapshot);
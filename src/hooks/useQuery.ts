@@ -0,0 +1,61 @@
+import { useCallback, useEffect, useRef, useSyncExternalStore } from 'react';
+import { queryCache } from '@utils/queryCache';
+import type { QueryFetchOptions } from '@utils/queryCache';
+
+export interface UseQueryOptions {
+  /** Set to false to skip loading, e.g. while a required parameter is missing */
+  enabled?: boolean;
+}
+
+export interface UseQueryResult<T> {
+  data: T | undefined;
+  error: any;
+  isLoading: boolean;
+  isFetching: boolean;
+  refetch: () => Promise<T>;
+}
+
+/**
+ * Subscribe a component to a cached query.
+ * `load` is a cache-aware service method (e.g. `resumeService.getUserResumes`)
+ * that reads and writes `key` in the shared query cache.
+ */
+export const useQuery = <T>(
+  key: string | null,
+  load: (options?: QueryFetchOptions) => Promise<T>,
+  { enabled = true }: UseQueryOptions = {}
+): UseQueryResult<T> => {
+  const loadRef = useRef(load);
+  loadRef.current = load;
+
+  const subscribe = useCallback(
+    (onChange: () => void) => (key ? queryCache.subscribe(key, onChange) : () => {}),
+    [key]
+  );
+  const getSnapshot = useCallback(() => (key ? queryCache.getEntry<T>(key) : undefined), [key]);
+  const entry = useSyncExternalStore(subscribe, getSnapshot);
+
+  // Refetch on mount, key change and whenever the entry is invalidated
+  const invalidations = entry?.invalidations ?? 0;
+  useEffect(() => {
+    if (!key || !enabled) return;
+    loadRef.current().catch(() => {}); // Errors are exposed through the entry
+  }, [key, enabled, invalidations]);
+
+  // Cancel the request once this key is no longer needed
+  useEffect(() => {
+    if (!key) return;
+    return () => queryCache.release(key);
+  }, [key]);
+
+  const refetch = useCallback(() => loadRef.current({ force: true }), []);
+
+  const hasData = !!entry && entry.updatedAt > 0;
+  return {
+    data: entry?.data,
+    error: entry?.error,
+    isLoading: enabled && !!key && !hasData && !entry?.error,
+    isFetching: entry?.isFetching ?? false,
+    refetch
+  };
+};
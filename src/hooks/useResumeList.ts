@@ -0,0 +1,34 @@
+import { useMemo } from 'react';
+import { resumeService, resumePagesQueryKey } from '@resume/services';
+import type { PageQuery, ResumeListResponse, ResumeScan } from '@types';
+import { useInfiniteQuery } from './useInfiniteQuery';
+import type { UseInfiniteQueryResult } from './useInfiniteQuery';
+
+export interface UseResumeListResult extends UseInfiniteQueryResult<ResumeListResponse> {
+  resumes: ResumeScan[];
+  /** Total matching resumes on the server, including pages not loaded yet */
+  total: number;
+}
+
+const getNextCursor = (page: ResumeListResponse) => page.next_cursor;
+
+/**
+ * The signed-in user's resumes, loaded one page at a time.
+ * Call `fetchNextPage` (e.g. from VirtualList's onEndReached) to load more.
+ */
+export const useResumeList = (
+  query: PageQuery = {},
+  { enabled = true }: { enabled?: boolean } = {}
+): UseResumeListResult => {
+  const { search, sort, order, limit } = query;
+  const result = useInfiniteQuery(
+    resumePagesQueryKey(query),
+    (cursor, options) => resumeService.getUserResumesPage({ search, sort, order, limit, cursor }, options),
+    { getNextCursor, enabled }
+  );
+
+  const resumes = useMemo(() => result.pages.flatMap((page) => page.resumes || []), [result.pages]);
+  const total = result.pages[0]?.total ?? 0;
+
+  return { ...result, resumes, total };
+};
@@ -1,8 +1,15 @@
 import React from 'react'
 import ReactDOM from 'react-dom/client'
 import App from './App.jsx'
+import { initTelemetry } from './utils/telemetry'
+import { registerServiceWorker } from './utils/serviceWorker'
 import './index.css'
 
+// No-op unless this session is sampled (VITE_TELEMETRY_SAMPLE_RATE)
+initTelemetry();
+// Production only: precached app shell and offline reads
+registerServiceWorker();
+
 const rootElement = document.getElementById('root');
 if (!rootElement) throw new Error('Failed to find the root element');
 
@@ -1,5 +1,7 @@
-import React, { useState } from 'react';
+import React, { useEffect, useState } from 'react';
 import SocialLoginButton from './SocialLoginButton';
+import { preloadSocialAuth } from '@auth/services';
+import type { SocialProvider } from '@auth/services';
 
 interface SocialLoginGroupProps {
   onGoogleLogin: () => void;
@@ -17,6 +19,21 @@ const SocialLoginGroup: React.FC<SocialLoginGroupProps> = ({
   const [googleLoading, setGoogleLoading] = useState(false);
   const [linkedinLoading, setLinkedinLoading] = useState(false);
 
+  // The buttons are on screen: fetch the provider chunks once the browser is idle
+  useEffect(() => {
+    const scheduleIdle = window.requestIdleCallback || ((callback: () => void) => setTimeout(callback, 200));
+    scheduleIdle(() => {
+      preloadSocialAuth('google');
+      preloadSocialAuth('linkedin');
+    });
+  }, []);
+
+  // Hover or focus signals intent: load that provider right away
+  const preloadHandlers = (provider: SocialProvider) => ({
+    onPointerEnter: () => preloadSocialAuth(provider),
+    onFocus: () => preloadSocialAuth(provider),
+  });
+
   const handleGoogleClick = () => {
     setGoogleLoading(true);
     try {
@@ -37,18 +54,22 @@ const SocialLoginGroup: React.FC<SocialLoginGroupProps> = ({
 
   return (
     <div className={`flex gap-3 ${className}`}>
-      <SocialLoginButton
-        provider="google"
-        onClick={handleGoogleClick}
-        disabled={googleLoading || linkedinLoading}
-        loading={googleLoading}
-      />
-      <SocialLoginButton
-        provider="linkedin"
-        onClick={handleLinkedInClick}
-        disabled={googleLoading || linkedinLoading}
-        loading={linkedinLoading}
-      />
+      <div className="flex-1 min-w-0" {...preloadHandlers('google')}>
+        <SocialLoginButton
+          provider="google"
+          onClick={handleGoogleClick}
+          disabled={googleLoading || linkedinLoading}
+          loading={googleLoading}
+        />
+      </div>
+      <div className="flex-1 min-w-0" {...preloadHandlers('linkedin')}>
+        <SocialLoginButton
+          provider="linkedin"
+          onClick={handleLinkedInClick}
+          disabled={googleLoading || linkedinLoading}
+          loading={linkedinLoading}
+        />
+      </div>
     </div>
   );
 };
@@ -1,43 +1,9 @@
-import axios, { AxiosResponse } from 'axios';
+import type { AxiosResponse } from 'axios';
+import { apiClient } from '@utils/httpClient';
 import type { 
   AuthResponse 
 } from '@types';
 
-const API_BASE_URL = import.meta.env.VITE_API_URL || '/api';
-
-const api = axios.create({
-  baseURL: API_BASE_URL,
-  headers: {
-    'Content-Type': 'application/json',
-  },
-});
-
-// Add token to requests
-api.interceptors.request.use((config) => {
-  const token = localStorage.getItem('token');
-  if (token) {
-    config.headers.Authorization = `Bearer ${token}`;
-  }
-  return config;
-});
-
-// Handle token expiration and network errors
-api.interceptors.response.use(
-  (response) => response,
-  (error) => {
-    // Only handle 401 errors for actual authentication failures, not network issues
-    if (error.response?.status === 401 && error.response?.data?.message?.includes('token')) {
-      // Only clear token if it's actually an authentication error
-      localStorage.removeItem('token');
-      localStorage.removeItem('google_auth_token');
-      localStorage.removeItem('linkedin_auth_token');
-      window.location.href = '/login';
-    }
-    // For network errors or backend unavailability, don't clear tokens
-    return Promise.reject(new Error(error.message || 'Request failed'));
-  }
-);
-
 
 export const authService = {
   /**
@@ -45,7 +11,7 @@ export const authService = {
    * POST /api/auth/login
    */
   async login(email: string, password: string): Promise<AuthResponse> {
-    const response: AxiosResponse<AuthResponse> = await api.post('/auth/login', { email, password });
+    const response: AxiosResponse<AuthResponse> = await apiClient.post('/auth/login', { email, password });
     return response.data;
   },
 
@@ -54,7 +20,7 @@ export const authService = {
    * POST /api/auth/register
    */
   async register(email: string, password: string, firstName?: string, lastName?: string): Promise<AuthResponse> {
-    const response: AxiosResponse<AuthResponse> = await api.post('/auth/register', { 
+    const response: AxiosResponse<AuthResponse> = await apiClient.post('/auth/register', { 
       email, 
       password, 
       first_name: firstName, 
@@ -68,7 +34,7 @@ export const authService = {
    * GET /api/auth/me
    */
   async getCurrentUser(): Promise<AuthResponse> {
-    const response: AxiosResponse<AuthResponse> = await api.get('/auth/me');
+    const response: AxiosResponse<AuthResponse> = await apiClient.get('/auth/me');
     return response.data;
   },
 
@@ -77,7 +43,7 @@ export const authService = {
    * POST /api/auth/forgot-password
    */
   async forgotPassword(email: string): Promise<Record<string, any>> {
-    const response: AxiosResponse<Record<string, any>> = await api.post('/auth/forgot-password', { email });
+    const response: AxiosResponse<Record<string, any>> = await apiClient.post('/auth/forgot-password', { email });
     return response.data;
   },
 
@@ -86,7 +52,7 @@ export const authService = {
    * POST /api/auth/reset-password
    */
   async resetPassword(token: string, new_password: string, confirm_password: string): Promise<Record<string, any>> {
-    const response: AxiosResponse<Record<string, any>> = await api.post('/auth/reset-password', { 
+    const response: AxiosResponse<Record<string, any>> = await apiClient.post('/auth/reset-password', { 
       token, 
       new_password, 
       confirm_password 
@@ -99,7 +65,7 @@ export const authService = {
    * GET /health
    */
   async healthCheck(): Promise<Record<string, any>> {
-    const response: AxiosResponse<Record<string, any>> = await api.get('/health');
+    const response: AxiosResponse<Record<string, any>> = await apiClient.get('/health');
     return response.data;
   }
 };
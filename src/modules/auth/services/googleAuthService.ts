@@ -1,5 +1,3 @@
-import { GoogleAuth } from 'google-auth-library';
-
 export interface GoogleUser {
   id: string;
   email: string;
@@ -35,6 +33,7 @@ export interface GoogleAuthResponse {
 class GoogleAuthService {
   private clientId: string;
   private isInitialized: boolean = false;
+  private initializing: Promise<void> | null = null;
   private gapi: any;
 
   constructor() {
@@ -46,9 +45,11 @@ class GoogleAuthService {
 
   private async initializeGoogleAuth(): Promise<void> {
     if (this.isInitialized) return;
+    // Preload and sign-in share one script tag
+    if (this.initializing) return this.initializing;
 
     // Load Google Identity Services script
-    return new Promise((resolve, reject) => {
+    this.initializing = new Promise<void>((resolve, reject) => {
       if (window.google) {
         this.isInitialized = true;
         resolve();
@@ -64,10 +65,22 @@ class GoogleAuthService {
         resolve();
       };
       script.onerror = () => {
+        this.initializing = null;
+        script.remove();
         reject(new Error('Failed to load Google Identity Services'));
       };
       document.head.appendChild(script);
     });
+    return this.initializing;
+  }
+
+  /**
+   * Start loading the Identity Services script ahead of sign-in
+   */
+  preloadSdk(): void {
+    this.initializeGoogleAuth().catch(() => {
+      // Reported again by signIn if it still fails
+    });
   }
 
   async signIn(): Promise<GoogleAuthResponse> {
@@ -246,3 +259,6 @@ declare global {
 }
 
 export const googleAuthService = new GoogleAuthService();
+
+// Export the class for typing the on-demand loader
+export { GoogleAuthService };
@@ -1,5 +1,7 @@
 // Authentication services
 export * from './authService';
-export * from './googleAuthService';
-export * from './linkedinAuthService';
+// Social login services are loaded on demand, see socialAuth
+export * from './socialAuth';
+export type { GoogleAuthResponse, GoogleUser } from './googleAuthService';
+export type { LinkedInAuthResponse } from './linkedinAuthService';
 export * from './logoutService';
@@ -269,3 +269,6 @@ class LinkedInAuthService {
 
 // Create and export singleton instance
 export const linkedinAuthService = new LinkedInAuthService();
+
+// Export the class for typing the on-demand loader
+export { LinkedInAuthService };
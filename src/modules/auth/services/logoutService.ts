@@ -3,6 +3,9 @@
  * Handles logout for different authentication methods (Email, Google, LinkedIn)
  */
 
+import { tokenStore } from '@utils/tokenStore';
+import { loadLinkedInAuthService } from './socialAuth';
+
 export interface LogoutResult {
   success: boolean;
   message: string;
@@ -47,7 +50,7 @@ class LogoutService {
    */
   private clearAuthData(): void {
     // Clear localStorage
-    localStorage.removeItem('token');
+    tokenStore.clear();
     localStorage.removeItem('user');
     
     // Clear sessionStorage
@@ -89,7 +92,7 @@ class LogoutService {
   private async handleLinkedInLogout(): Promise<void> {
     try {
       // Use the graceful logout method from LinkedIn auth service
-      const { linkedinAuthService } = await import('./linkedinAuthService');
+      const linkedinAuthService = await loadLinkedInAuthService();
       const result = await linkedinAuthService.gracefulLogout();
       
       if (result.success) {
@@ -120,7 +123,7 @@ class LogoutService {
    */
   async checkLinkedInLogoutRequirement(): Promise<{ requiresUserAction: boolean; message?: string }> {
     try {
-      const { linkedinAuthService } = await import('./linkedinAuthService');
+      const linkedinAuthService = await loadLinkedInAuthService();
       const result = await linkedinAuthService.gracefulLogout();
       
       return {
@@ -214,7 +217,7 @@ class LogoutService {
    * Check if user is currently authenticated
    */
   isAuthenticated(): boolean {
-    const token = localStorage.getItem('token');
+    const token = tokenStore.get();
     const authMethod = this.getAuthMethod();
     return !!(token && authMethod);
   }
@@ -244,7 +247,7 @@ class LogoutService {
     }
     
     // If we have a token but no specific OAuth indicators, assume email/password
-    if (localStorage.getItem('token')) {
+    if (tokenStore.get()) {
       return 'email';
     }
     
@@ -0,0 +1,46 @@
+/**
+ * On-demand loaders for the social login services
+ * The Google and LinkedIn services (and the Google Identity Services SDK)
+ * live in their own chunks so pages that never show a social login button
+ * never download them. Loads are cached; call the loaders wherever the
+ * services are needed.
+ */
+
+import type { GoogleAuthService } from './googleAuthService';
+import type { LinkedInAuthService } from './linkedinAuthService';
+
+export type SocialProvider = 'google' | 'linkedin';
+
+let googleAuthService: Promise<GoogleAuthService> | null = null;
+let linkedinAuthService: Promise<LinkedInAuthService> | null = null;
+
+export const loadGoogleAuthService = (): Promise<GoogleAuthService> => {
+  googleAuthService ??= import('./googleAuthService').then((module) => module.googleAuthService);
+  // Allow a later retry if the chunk failed to download
+  googleAuthService.catch(() => {
+    googleAuthService = null;
+  });
+  return googleAuthService;
+};
+
+export const loadLinkedInAuthService = (): Promise<LinkedInAuthService> => {
+  linkedinAuthService ??= import('./linkedinAuthService').then((module) => module.linkedinAuthService);
+  linkedinAuthService.catch(() => {
+    linkedinAuthService = null;
+  });
+  return linkedinAuthService;
+};
+
+/**
+ * Warm up a provider before it is clicked: its chunk and, for Google, the
+ * Identity Services script
+ */
+export const preloadSocialAuth = (provider: SocialProvider): void => {
+  if (provider === 'google') {
+    loadGoogleAuthService()
+      .then((service) => service.preloadSdk())
+      .catch(() => {});
+  } else {
+    loadLinkedInAuthService().catch(() => {});
+  }
+};
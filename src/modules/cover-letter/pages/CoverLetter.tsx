@@ -1,42 +1,85 @@
-import React, { useState, useEffect, useCallback } from 'react';
+import React, { useState, useEffect, useMemo, useRef } from 'react';
 import { useNotification } from '@contexts/NotificationContext.js';
+import { useKeywordPreMatch, useResumeList } from '@hooks';
 import { resumeService } from '@resume/services';
 import { formatDateWithPrefix } from '@utils/dateUtils.js';
-import type { ResumeScan, ResumeListResponse, CoverLetterData } from '@types';
+import { getResumeKeywords } from '@utils/keywordMatcher';
+import KeywordPreMatch from '@components/KeywordPreMatch';
+import VirtualList from '@components/VirtualList';
+import type { CoverLetterData } from '@types';
 import {
   DocumentTextIcon,
   PencilSquareIcon,
   ArrowDownTrayIcon,
   EyeIcon,
   ArrowPathIcon,
-  CheckCircleIcon
+  CheckCircleIcon,
+  StopIcon
 } from '@heroicons/react/24/outline';
 
+const RESUME_ROW_HEIGHT = 62;
+const RESUME_LIST_HEIGHT = 320;
+
 const CoverLetter = () => {
   const [selectedResume, setSelectedResume] = useState<number | null>(null);
   const [jobDescription, setJobDescription] = useState<string>('');
-  const [userResumes, setUserResumes] = useState<ResumeScan[]>([]);
   const [generating, setGenerating] = useState<boolean>(false);
   const [coverLetter, setCoverLetter] = useState<CoverLetterData | null>(null);
   const [previewMode, setPreviewMode] = useState<boolean>(false);
-  const { success, error } = useNotification();
+  const { success, error, info } = useNotification();
+  const abortControllerRef = useRef<AbortController | null>(null);
+  const pendingTextRef = useRef<string>('');
+  const frameRef = useRef<number | null>(null);
+  const {
+    resumes: userResumes,
+    error: loadError,
+    fetchNextPage: loadMoreResumes,
+    isFetchingNextPage: loadingMoreResumes
+  } = useResumeList();
+  const resumeKeywords = useMemo(
+    () => getResumeKeywords(userResumes.find((resume) => parseInt(resume.id) === selectedResume)),
+    [userResumes, selectedResume]
+  );
+  const preMatch = useKeywordPreMatch(jobDescription, resumeKeywords);
 
   useEffect(() => {
-    loadUserResumes();
-  }, []);
+    if (selectedResume === null && userResumes.length > 0) {
+      setSelectedResume(parseInt(userResumes[0].id));
+    }
+  }, [userResumes, selectedResume]);
 
-  const loadUserResumes = useCallback(async (): Promise<void> => {
-    try {
-      const response: ResumeListResponse = await resumeService.getUserResumes();
-      const resumes = response.resumes;
-      setUserResumes(resumes);
-      if (resumes.length > 0) {
-        setSelectedResume(parseInt(resumes[0].id));
-      }
-    } catch (err: any) {
+  useEffect(() => {
+    if (loadError) {
       error('Failed to load resumes');
     }
-  }, [error]);
+  }, [loadError]);
+
+  // Stop any running generation when leaving the page
+  useEffect(() => {
+    return () => {
+      abortControllerRef.current?.abort();
+      if (frameRef.current !== null) {
+        cancelAnimationFrame(frameRef.current);
+      }
+    };
+  }, []);
+
+  // Append buffered tokens at most once per frame
+  const flushPendingText = (): void => {
+    frameRef.current = null;
+    const text = pendingTextRef.current;
+    pendingTextRef.current = '';
+    if (text) {
+      setCoverLetter(prev => prev ? { ...prev, content: prev.content + text } : prev);
+    }
+  };
+
+  const appendToken = (token: string): void => {
+    pendingTextRef.current += token;
+    if (frameRef.current === null) {
+      frameRef.current = requestAnimationFrame(flushPendingText);
+    }
+  };
 
   const generateCoverLetter = async (): Promise<void> => {
     if (!selectedResume || !jobDescription.trim()) {
@@ -44,16 +87,57 @@ const CoverLetter = () => {
       return;
     }
 
+    abortControllerRef.current?.abort();
+    const controller = new AbortController();
+    abortControllerRef.current = controller;
+    pendingTextRef.current = '';
+
     setGenerating(true);
+    setCoverLetter({
+      id: '',
+      resume_id: selectedResume.toString(),
+      job_description: jobDescription,
+      content: '',
+      generated_date: new Date().toISOString()
+    });
     try {
-      const result = await resumeService.generateCoverLetter(selectedResume, jobDescription);
-      setCoverLetter(result as CoverLetterData);
+      const { data } = await resumeService.streamCoverLetter(selectedResume, jobDescription, appendToken, controller.signal);
+      // The text arrived through appendToken; take the saved letter's id and analysis from the final payload
+      if (data && abortControllerRef.current === controller) {
+        setCoverLetter(prev => prev ? {
+          ...prev,
+          id: data.id != null ? String(data.id) : prev.id,
+          generated_date: data.generated_date ?? prev.generated_date,
+          analysis: data.analysis ?? prev.analysis
+        } : prev);
+      }
       success('Cover letter generated successfully!');
     } catch (err: any) {
-      error('Failed to generate cover letter');
+      if (!controller.signal.aborted) {
+        error('Failed to generate cover letter');
+      }
     } finally {
-      setGenerating(false);
+      if (abortControllerRef.current === controller) {
+        if (frameRef.current !== null) {
+          cancelAnimationFrame(frameRef.current);
+        }
+        flushPendingText();
+        abortControllerRef.current = null;
+        setGenerating(false);
+      }
+    }
+  };
+
+  const cancelGeneration = (): void => {
+    if (!abortControllerRef.current) return;
+    abortControllerRef.current.abort();
+    abortControllerRef.current = null;
+    if (frameRef.current !== null) {
+      cancelAnimationFrame(frameRef.current);
     }
+    flushPendingText();
+    setGenerating(false);
+    info('Cover letter generation cancelled');
   };
 
   const downloadCoverLetter = (): void => {
@@ -88,26 +172,37 @@ const CoverLetter = () => {
         <div className="card">
           <h3 className="text-lg font-medium text-gray-900 mb-4">Select Resume</h3>
           {userResumes.length > 0 ? (
-            <div className="space-y-3">
-              {userResumes.map((resume) => (
-                <label key={resume.id} className="flex items-center p-3 border border-gray-200 rounded-lg cursor-pointer hover:bg-gray-50">
+            <VirtualList
+              items={userResumes}
+              itemKey={(resume) => resume.id}
+              itemHeight={RESUME_ROW_HEIGHT}
+              height={RESUME_LIST_HEIGHT}
+              gap={12}
+              aria-label="Resumes"
+              onEndReached={loadMoreResumes}
+              loadingMore={loadingMoreResumes}
+              isSelected={(resume) => selectedResume === parseInt(resume.id)}
+              onSelect={(resume) => setSelectedResume(parseInt(resume.id))}
+              renderItem={(resume) => (
+                <label className="flex items-center h-full p-3 border border-gray-200 rounded-lg cursor-pointer hover:bg-gray-50">
                   <input
                     type="radio"
                     name="resume"
                     value={resume.id}
                     checked={selectedResume === parseInt(resume.id)}
                     onChange={(e) => setSelectedResume(parseInt(e.target.value))}
+                    tabIndex={-1}
                     className="h-4 w-4 text-blue-600 focus:ring-blue-500 border-gray-300"
                   />
-                  <div className="ml-3">
-                    <p className="text-sm font-medium text-gray-900">{resume.filename}</p>
+                  <div className="ml-3 min-w-0">
+                    <p className="text-sm font-medium text-gray-900 truncate">{resume.filename}</p>
                     <p className="text-xs text-gray-500">
                       {formatDateWithPrefix(resume.uploaded_at || resume.upload_date, 'Uploaded')}
                     </p>
                   </div>
                 </label>
-              ))}
-            </div>
+              )}
+            />
           ) : (
             <div className="text-center py-6">
               <DocumentTextIcon className="mx-auto h-12 w-12 text-gray-400" />
@@ -129,11 +224,12 @@ const CoverLetter = () => {
             rows={12}
             className="w-full px-3 py-2 border border-gray-300 rounded-lg focus:outline-none focus:ring-2 focus:ring-blue-500 focus:border-transparent resize-none"
           />
+          <KeywordPreMatch result={preMatch} />
         </div>
       </div>
 
       {/* Generate Button */}
-      <div className="flex justify-center">
+      <div className="flex justify-center space-x-2">
         <button
           onClick={generateCoverLetter}
           disabled={generating || !selectedResume || !jobDescription.trim()}
@@ -148,6 +244,15 @@ const CoverLetter = () => {
             'Generate Cover Letter'
           )}
         </button>
+        {generating && (
+          <button
+            onClick={cancelGeneration}
+            className="inline-flex items-center px-3 py-2 border border-gray-300 shadow-sm text-sm leading-4 font-medium rounded-md text-gray-700 bg-white hover:bg-gray-50 focus:outline-none focus:ring-2 focus:ring-offset-2 focus:ring-blue-500"
+          >
+            <StopIcon className="h-4 w-4 mr-2" />
+            Stop
+          </button>
+        )}
       </div>
 
       {/* Cover Letter Results */}
@@ -160,21 +265,24 @@ const CoverLetter = () => {
               <div className="flex space-x-2">
                 <button
                   onClick={() => setPreviewMode(!previewMode)}
-                  className="inline-flex items-center px-3 py-2 border border-gray-300 shadow-sm text-sm leading-4 font-medium rounded-md text-gray-700 bg-white hover:bg-gray-50 focus:outline-none focus:ring-2 focus:ring-offset-2 focus:ring-blue-500"
+                  disabled={generating}
+                  className="inline-flex items-center px-3 py-2 border border-gray-300 shadow-sm text-sm leading-4 font-medium rounded-md text-gray-700 bg-white hover:bg-gray-50 focus:outline-none focus:ring-2 focus:ring-offset-2 focus:ring-blue-500 disabled:opacity-50 disabled:cursor-not-allowed"
                 >
                   <EyeIcon className="h-4 w-4 mr-2" />
                   {previewMode ? 'Edit' : 'Preview'}
                 </button>
                 <button
                   onClick={regenerateCoverLetter}
-                  className="inline-flex items-center px-3 py-2 border border-gray-300 shadow-sm text-sm leading-4 font-medium rounded-md text-gray-700 bg-white hover:bg-gray-50 focus:outline-none focus:ring-2 focus:ring-offset-2 focus:ring-blue-500"
+                  disabled={generating}
+                  className="inline-flex items-center px-3 py-2 border border-gray-300 shadow-sm text-sm leading-4 font-medium rounded-md text-gray-700 bg-white hover:bg-gray-50 focus:outline-none focus:ring-2 focus:ring-offset-2 focus:ring-blue-500 disabled:opacity-50 disabled:cursor-not-allowed"
                 >
                   <ArrowPathIcon className="h-4 w-4 mr-2" />
                   Regenerate
                 </button>
                 <button
                   onClick={downloadCoverLetter}
-                  className="btn-primary"
+                  disabled={generating}
+                  className="btn-primary disabled:opacity-50 disabled:cursor-not-allowed"
                 >
                   <ArrowDownTrayIcon className="h-4 w-4 mr-2" />
                   Download
@@ -185,11 +293,17 @@ const CoverLetter = () => {
 
           {/* Cover Letter Content */}
           <div className="card">
-            {previewMode ? (
-              <div className="prose max-w-none">
+            {previewMode || generating ? (
+              <div className="prose max-w-none" aria-live="polite" aria-busy={generating}>
                 <div className="whitespace-pre-wrap text-gray-900 leading-relaxed">
                   {coverLetter.content}
+                  {generating && (
+                    <span className="inline-block w-2 h-4 ml-0.5 align-text-bottom bg-gray-400 animate-pulse"></span>
+                  )}
                 </div>
+                {generating && !coverLetter.content && (
+                  <p className="text-sm text-gray-500">Waiting for the first words...</p>
+                )}
               </div>
             ) : (
               <textarea
@@ -1,27 +1,10 @@
-import axios, { AxiosResponse } from 'axios';
+import type { AxiosResponse } from 'axios';
+import { apiClient, LLM_REQUEST_TIMEOUT } from '@utils/httpClient';
 import type { 
   CoverLetterRequest, 
   RegenerateCoverLetterRequest 
 } from '@types';
 
-const API_BASE_URL = import.meta.env.VITE_API_URL || '/api';
-
-const api = axios.create({
-  baseURL: API_BASE_URL,
-  headers: {
-    'Content-Type': 'application/json',
-  },
-});
-
-// Add token to requests
-api.interceptors.request.use((config) => {
-  const token = localStorage.getItem('token');
-  if (token) {
-    config.headers.Authorization = `Bearer ${token}`;
-  }
-  return config;
-});
-
 // Re-export types for convenience
 export type { 
   CoverLetterRequest, 
@@ -33,8 +16,8 @@ export const coverLetterService = {
    * Get Cover Letter Page
    * GET /cover-letter
    */
-  async getCoverLetterPage(): Promise<string> {
-    const response: AxiosResponse<string> = await api.get('/cover-letter');
+  async getCoverLetterPage(signal?: AbortSignal): Promise<string> {
+    const response: AxiosResponse<string> = await apiClient.get('/cover-letter', { signal });
     return response.data;
   },
 
@@ -42,7 +25,7 @@ export const coverLetterService = {
    * Generate Cover Letter
    * POST /cover-letter
    */
-  async generateCoverLetter(coverLetterData: CoverLetterRequest): Promise<string> {
+  async generateCoverLetter(coverLetterData: CoverLetterRequest, signal?: AbortSignal): Promise<string> {
     const formData = new FormData();
     formData.append('resume_id', coverLetterData.resume_id.toString());
     formData.append('jd_id', coverLetterData.jd_id?.toString() || '');
@@ -52,10 +35,12 @@ export const coverLetterService = {
       formData.append('your_phone', coverLetterData.your_phone);
     }
     
-    const response: AxiosResponse<string> = await api.post('/cover-letter', formData, {
+    const response: AxiosResponse<string> = await apiClient.post('/cover-letter', formData, {
       headers: {
         'Content-Type': 'application/x-www-form-urlencoded',
       },
+      timeout: LLM_REQUEST_TIMEOUT,
+      signal,
     });
     return response.data;
   },
@@ -64,7 +49,7 @@ export const coverLetterService = {
    * Regenerate Cover Letter
    * POST /cover-letter/regenerate
    */
-  async regenerateCoverLetter(regenerateData: RegenerateCoverLetterRequest): Promise<string> {
+  async regenerateCoverLetter(regenerateData: RegenerateCoverLetterRequest, signal?: AbortSignal): Promise<string> {
     const formData = new FormData();
     formData.append('resume_id', regenerateData.resume_id?.toString() || '');
     formData.append('jd_id', regenerateData.jd_id?.toString() || '');
@@ -78,10 +63,12 @@ export const coverLetterService = {
     formData.append('add_passion', (regenerateData.add_passion || false).toString());
     formData.append('professional_tone', (regenerateData.professional_tone || false).toString());
     
-    const response: AxiosResponse<string> = await api.post('/cover-letter/regenerate', formData, {
+    const response: AxiosResponse<string> = await apiClient.post('/cover-letter/regenerate', formData, {
       headers: {
         'Content-Type': 'application/x-www-form-urlencoded',
       },
+      timeout: LLM_REQUEST_TIMEOUT,
+      signal,
     });
     return response.data;
   },
@@ -90,9 +77,10 @@ export const coverLetterService = {
    * Download Cover Letter
    * GET /cover-letter/download/{format}
    */
-  async downloadCoverLetter(format: string): Promise<Blob> {
-    const response: AxiosResponse<Blob> = await api.get(`/cover-letter/download/${format}`, {
-      responseType: 'blob'
+  async downloadCoverLetter(format: string, signal?: AbortSignal): Promise<Blob> {
+    const response: AxiosResponse<Blob> = await apiClient.get(`/cover-letter/download/${format}`, {
+      responseType: 'blob',
+      signal
     });
     return response.data;
   }
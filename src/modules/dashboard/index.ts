@@ -1,2 +1,3 @@
 // Dashboard module exports
+export * from './services';
 export * from './pages';
@@ -1,9 +1,10 @@
-import React, { useState, useEffect } from 'react';
+import React, { useEffect, useMemo } from 'react';
 import { Link } from 'react-router-dom';
-import { useAuth } from '@contexts/AuthContext.js';
-import { resumeService } from '@resume/services';
+import { useAuthSelector } from '@contexts/AuthContext.js';
+import { useQuery } from '@hooks';
+import { dashboardService, DASHBOARD_SUMMARY_QUERY_KEY } from '@dashboard/services';
 import { formatDate } from '@utils/dateUtils.js';
-import type { ResumeScan, ResumeListResponse } from '@types';
+import type { ResumeScan } from '@types';
 import {
   DocumentArrowUpIcon,
   ChartBarIcon,
@@ -24,43 +25,31 @@ interface DashboardStats {
 }
 
 const Dashboard = () => {
-  const { user } = useAuth();
-  const [stats, setStats] = useState<DashboardStats>({
-    totalResumes: 0,
-    analyzedResumes: 0,
-    jobMatches: 0,
-    coverLetters: 0,
-    monthlyQuota: 50,
-    usedQuota: 0
-  });
-  const [recentResumes, setRecentResumes] = useState<ResumeScan[]>([]);
-  const [loading, setLoading] = useState<boolean>(true);
+  const firstName = useAuthSelector((state) => state.user?.first_name);
+  const { data: summary, error: loadError, isLoading: loading } = useQuery(
+    DASHBOARD_SUMMARY_QUERY_KEY,
+    dashboardService.getSummary
+  );
 
   useEffect(() => {
-    loadDashboardData();
-  }, []);
-
-  const loadDashboardData = async (): Promise<void> => {
-    try {
-      const response: ResumeListResponse = await resumeService.getUserResumes();
-      const resumes = response.resumes;
-      setRecentResumes(resumes.slice(0, 5));
-      
-      setStats(prev => ({
-        ...prev,
-        totalResumes: resumes.length,
-        analyzedResumes: resumes.filter((r: ResumeScan) => r.analysis_status === 'completed').length,
-        usedQuota: resumes.length
-      }));
-    } catch (error) {
-      console.error('Error loading dashboard data:', error);
-    } finally {
-      setLoading(false);
+    if (loadError) {
+      console.error('Error loading dashboard data:', loadError);
     }
-  };
+  }, [loadError]);
+
+  const recentResumes: ResumeScan[] = summary?.recent_resumes || [];
+
+  const stats: DashboardStats = useMemo(() => ({
+    totalResumes: summary?.total_resumes ?? 0,
+    analyzedResumes: summary?.analyzed_resumes ?? 0,
+    jobMatches: summary?.job_matches ?? 0,
+    coverLetters: summary?.cover_letters ?? 0,
+    monthlyQuota: summary?.monthly_quota ?? 0,
+    usedQuota: summary?.used_quota ?? 0
+  }), [summary]);
 
   const getQuotaPercentage = () => {
-    return (stats.usedQuota / stats.monthlyQuota) * 100;
+    return stats.monthlyQuota > 0 ? (stats.usedQuota / stats.monthlyQuota) * 100 : 0;
   };
 
   const getQuotaColor = () => {
@@ -115,7 +104,7 @@ const Dashboard = () => {
           <div className="absolute top-0 right-0 w-32 h-32 bg-gradient-to-br from-blue-400/20 to-purple-400/20 rounded-full -translate-y-16 translate-x-16"></div>
           <div className="relative z-10">
             <h1 className="text-4xl font-bold bg-gradient-to-r from-blue-600 via-purple-600 to-indigo-600 bg-clip-text text-transparent">
-              Welcome back, {user?.first_name || 'User'}! 👋
+              Welcome back, {firstName || 'User'}! 👋
             </h1>
             <p className="mt-4 text-lg text-gray-600 max-w-2xl">
               Here's what's happening with your resume analysis and job matching. Let's make your career dreams come true!
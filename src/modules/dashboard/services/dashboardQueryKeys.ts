@@ -0,0 +1,8 @@
+/**
+ * Dashboard query cache keys
+ * Kept apart from dashboardService, which depends on the resume services,
+ * so resume mutations can invalidate the dashboard without an import cycle.
+ */
+
+export const DASHBOARD_QUERY_PREFIX = 'dashboard';
+export const DASHBOARD_SUMMARY_QUERY_KEY = `${DASHBOARD_QUERY_PREFIX}:summary`;
@@ -0,0 +1,62 @@
+import type { AxiosResponse } from 'axios';
+import { apiClient } from '@utils/httpClient';
+import { queryCache } from '@utils/queryCache';
+import type { QueryFetchOptions } from '@utils/queryCache';
+import { resumeService } from '@resume/services';
+import type { DashboardSummary } from '@types';
+import { DASHBOARD_SUMMARY_QUERY_KEY } from './dashboardQueryKeys';
+
+/** Number of recent resumes included in the summary */
+export const RECENT_RESUME_COUNT = 5;
+
+/** Upload quota shown when the backend does not report one */
+const DEFAULT_MONTHLY_QUOTA = 50;
+
+// Set once the backend answers 404, so revalidations go straight to the fallback
+let summaryEndpointMissing = false;
+
+/**
+ * Build the summary from the full resume list, for backends without
+ * the summary endpoint
+ */
+const summarizeResumeList = async (): Promise<DashboardSummary> => {
+  const { resumes = [] } = await resumeService.getUserResumes();
+  return {
+    total_resumes: resumes.length,
+    analyzed_resumes: resumes.filter((resume) => resume.analysis_status === 'completed').length,
+    job_matches: 0,
+    cover_letters: 0,
+    monthly_quota: DEFAULT_MONTHLY_QUOTA,
+    used_quota: resumes.length,
+    recent_resumes: resumes.slice(0, RECENT_RESUME_COUNT),
+  };
+};
+
+export const dashboardService = {
+  /**
+   * Get Dashboard Summary
+   * GET /dashboard/summary?recent=5
+   * Precomputed counters plus the most recent resumes, served from the
+   * shared query cache and revalidated in the background.
+   */
+  async getSummary(options?: QueryFetchOptions): Promise<DashboardSummary> {
+    return queryCache.fetch(
+      DASHBOARD_SUMMARY_QUERY_KEY,
+      async (signal) => {
+        if (summaryEndpointMissing) return summarizeResumeList();
+        try {
+          const response: AxiosResponse<DashboardSummary> = await apiClient.get('/dashboard/summary', {
+            params: { recent: RECENT_RESUME_COUNT },
+            signal,
+          });
+          return response.data;
+        } catch (error: any) {
+          if (error.response?.status !== 404) throw error;
+          summaryEndpointMissing = true;
+          return summarizeResumeList();
+        }
+      },
+      options
+    );
+  },
+};
@@ -0,0 +1,3 @@
+// Dashboard services
+export * from './dashboardService';
+export * from './dashboardQueryKeys';
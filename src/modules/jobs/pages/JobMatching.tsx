@@ -1,8 +1,19 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useMemo, useRef } from 'react';
 import { useNotification } from '@contexts/NotificationContext.js';
+import { useDebouncedValue, useInfiniteQuery, useKeywordPreMatch, useResumeList } from '@hooks';
 import { resumeService } from '@resume/services';
+import {
+  batchMatchService,
+  jobService,
+  jobDescriptionPagesQueryKey,
+  rankBatchMatches
+} from '@jobs/services';
+import type { BatchMatchEntry } from '@jobs/services';
 import { formatDateWithPrefix } from '@utils/dateUtils.js';
-import type { ResumeScan, ResumeListResponse, JobMatchResult } from '@types';
+import { getResumeKeywords } from '@utils/keywordMatcher';
+import KeywordPreMatch from '@components/KeywordPreMatch';
+import VirtualList from '@components/VirtualList';
+import type { JobDescription, JobDescriptionListResponse, JobMatchResult } from '@types';
 import {
   CheckCircleIcon,
   XCircleIcon,
@@ -10,30 +21,87 @@ import {
   DocumentTextIcon
 } from '@heroicons/react/24/outline';
 
+type MatchMode = 'single' | 'batch';
+
+// Fixed heights of the resume and job description picker rows
+const PICKER_ROW_HEIGHT = 62;
+const PICKER_LIST_HEIGHT = 320;
+
+const BATCH_STATUS_LABELS: Record<BatchMatchEntry['status'], string> = {
+  queued: 'Queued',
+  running: 'Matching...',
+  done: 'Done',
+  failed: 'Failed',
+  cancelled: 'Cancelled'
+};
+
+const getNextJobCursor = (page: JobDescriptionListResponse) => page.next_cursor;
+
 const JobMatching = () => {
   const [jobDescription, setJobDescription] = useState<string>('');
   const [selectedResume, setSelectedResume] = useState<number | null>(null);
-  const [userResumes, setUserResumes] = useState<ResumeScan[]>([]);
   const [matching, setMatching] = useState<boolean>(false);
   const [matchResult, setMatchResult] = useState<JobMatchResult | null>(null);
-  const { success, error } = useNotification();
+  const [mode, setMode] = useState<MatchMode>('single');
+  // Kept by id so selections survive searching and paging
+  const [selectedJobs, setSelectedJobs] = useState<Map<string, JobDescription>>(new Map());
+  const [jobSearch, setJobSearch] = useState<string>('');
+  const debouncedJobSearch = useDebouncedValue(jobSearch);
+  const [batchEntries, setBatchEntries] = useState<Record<string, BatchMatchEntry>>({});
+  const [batchRunning, setBatchRunning] = useState<boolean>(false);
+  const batchControllerRef = useRef<AbortController | null>(null);
+  const matchControllerRef = useRef<AbortController | null>(null);
+  const { success, error, info } = useNotification();
+  const {
+    resumes: userResumes,
+    error: loadError,
+    fetchNextPage: loadMoreResumes,
+    isFetchingNextPage: loadingMoreResumes
+  } = useResumeList();
+  const resumeKeywords = useMemo(
+    () => getResumeKeywords(userResumes.find((resume) => parseInt(resume.id) === selectedResume)),
+    [userResumes, selectedResume]
+  );
+  const preMatch = useKeywordPreMatch(jobDescription, resumeKeywords);
+  const {
+    pages: jobPages,
+    error: jobsError,
+    isLoading: jobsLoading,
+    fetchNextPage: loadMoreJobs,
+    isFetchingNextPage: loadingMoreJobs
+  } = useInfiniteQuery(
+    jobDescriptionPagesQueryKey({ search: debouncedJobSearch }),
+    (cursor, options) => jobService.getJobDescriptionsPage({ search: debouncedJobSearch, cursor }, options),
+    { getNextCursor: getNextJobCursor, enabled: mode === 'batch' }
+  );
+  const savedJobs = useMemo(() => jobPages.flatMap((page) => page.job_descriptions || []), [jobPages]);
+  const allLoadedJobsSelected = savedJobs.length > 0 && savedJobs.every((job) => selectedJobs.has(String(job.id)));
+  const rankedEntries = useMemo(() => rankBatchMatches(Object.values(batchEntries)), [batchEntries]);
+  const batchFinished = rankedEntries.filter((entry) => entry.status !== 'queued' && entry.status !== 'running').length;
 
   useEffect(() => {
-    loadUserResumes();
-  }, []);
+    if (selectedResume === null && userResumes.length > 0) {
+      setSelectedResume(parseInt(userResumes[0].id));
+    }
+  }, [userResumes, selectedResume]);
 
-  const loadUserResumes = async (): Promise<void> => {
-    try {
-      const response: ResumeListResponse = await resumeService.getUserResumes();
-      const resumes = response.resumes;
-      setUserResumes(resumes);
-      if (resumes.length > 0) {
-        setSelectedResume(parseInt(resumes[0].id));
-      }
-    } catch (err: any) {
+  useEffect(() => {
+    if (loadError) {
       error('Failed to load resumes');
     }
-  };
+  }, [loadError]);
+
+  useEffect(() => {
+    if (jobsError) {
+      error('Failed to load saved job descriptions');
+    }
+  }, [jobsError]);
+
+  // Cancel outstanding matches when leaving the page
+  useEffect(() => () => {
+    batchControllerRef.current?.abort();
+    matchControllerRef.current?.abort();
+  }, []);
 
   const handleMatch = async (): Promise<void> => {
     if (!selectedResume || !jobDescription.trim()) {
@@ -41,18 +109,101 @@ const JobMatching = () => {
       return;
     }
 
+    // A new match supersedes any still in flight
+    matchControllerRef.current?.abort();
+    const controller = new AbortController();
+    matchControllerRef.current = controller;
+
     setMatching(true);
     try {
-      const result = await resumeService.matchJob(selectedResume, jobDescription);
+      const result = await resumeService.matchJob(selectedResume, jobDescription, controller.signal);
       setMatchResult(result as JobMatchResult);
       success('Job matching completed!');
     } catch (err: any) {
-      error('Job matching failed');
+      if (!controller.signal.aborted) {
+        error('Job matching failed');
+      }
     } finally {
-      setMatching(false);
+      if (matchControllerRef.current === controller) {
+        matchControllerRef.current = null;
+        setMatching(false);
+      }
     }
   };
 
+  const toggleJob = (job: JobDescription): void => {
+    setSelectedJobs((previous) => {
+      const next = new Map(previous);
+      if (next.has(String(job.id))) {
+        next.delete(String(job.id));
+      } else {
+        next.set(String(job.id), job);
+      }
+      return next;
+    });
+  };
+
+  const toggleAllJobs = (): void => {
+    setSelectedJobs((previous) => {
+      const next = new Map(previous);
+      savedJobs.forEach((job) => {
+        if (allLoadedJobsSelected) {
+          next.delete(String(job.id));
+        } else {
+          next.set(String(job.id), job);
+        }
+      });
+      return next;
+    });
+  };
+
+  const handleBatchMatch = async (): Promise<void> => {
+    const jobs = [...selectedJobs.values()];
+    if (!selectedResume || jobs.length === 0) {
+      error('Please select a resume and at least one job description');
+      return;
+    }
+
+    batchControllerRef.current?.abort();
+    const controller = new AbortController();
+    batchControllerRef.current = controller;
+
+    setBatchRunning(true);
+    setMatchResult(null);
+    setBatchEntries(Object.fromEntries(
+      jobs.map((job) => [String(job.id), { jobDescription: job, status: 'queued' as const }])
+    ));
+
+    try {
+      const entries = await batchMatchService.matchResumeAgainstJobs(selectedResume, jobs, {
+        signal: controller.signal,
+        onUpdate: (entry) => {
+          setBatchEntries((previous) => ({ ...previous, [String(entry.jobDescription.id)]: entry }));
+        }
+      });
+      if (controller.signal.aborted) return;
+
+      const failed = entries.filter((entry) => entry.status === 'failed').length;
+      if (failed > 0) {
+        error(`${failed} of ${entries.length} matches failed`);
+      } else {
+        success(`Matched against ${entries.length} job descriptions`);
+      }
+    } finally {
+      if (batchControllerRef.current === controller) {
+        batchControllerRef.current = null;
+        setBatchRunning(false);
+      }
+    }
+  };
+
+  const cancelBatchMatch = (): void => {
+    batchControllerRef.current?.abort();
+    batchControllerRef.current = null;
+    setBatchRunning(false);
+    info('Batch matching cancelled');
+  };
+
   const getMatchColor = (score: number): string => {
     if (score >= 80) return 'text-green-600 bg-green-100';
     if (score >= 60) return 'text-yellow-600 bg-yellow-100';
@@ -74,32 +225,62 @@ const JobMatching = () => {
         </p>
       </div>
 
+      {/* Mode */}
+      <div className="flex justify-center">
+        <div className="inline-flex rounded-lg border border-gray-200 p-1 bg-white">
+          {([['single', 'Paste a description'], ['batch', 'Saved job descriptions']] as const).map(([value, label]) => (
+            <button
+              key={value}
+              type="button"
+              onClick={() => setMode(value)}
+              disabled={batchRunning || matching}
+              className={`px-4 py-2 text-sm font-medium rounded-md disabled:cursor-not-allowed ${
+                mode === value ? 'bg-blue-600 text-white' : 'text-gray-700 hover:bg-gray-50'
+              }`}
+            >
+              {label}
+            </button>
+          ))}
+        </div>
+      </div>
+
       {/* Input Section */}
       <div className="grid grid-cols-1 lg:grid-cols-2 gap-6">
         {/* Resume Selection */}
         <div className="card">
           <h3 className="text-lg font-medium text-gray-900 mb-4">Select Resume</h3>
           {userResumes.length > 0 ? (
-            <div className="space-y-3">
-              {userResumes.map((resume) => (
-                <label key={resume.id} className="flex items-center p-3 border border-gray-200 rounded-lg cursor-pointer hover:bg-gray-50">
+            <VirtualList
+              items={userResumes}
+              itemKey={(resume) => resume.id}
+              itemHeight={PICKER_ROW_HEIGHT}
+              height={PICKER_LIST_HEIGHT}
+              gap={12}
+              aria-label="Resumes"
+              onEndReached={loadMoreResumes}
+              loadingMore={loadingMoreResumes}
+              isSelected={(resume) => selectedResume === parseInt(resume.id)}
+              onSelect={(resume) => setSelectedResume(parseInt(resume.id))}
+              renderItem={(resume) => (
+                <label className="flex items-center h-full p-3 border border-gray-200 rounded-lg cursor-pointer hover:bg-gray-50">
                   <input
                     type="radio"
                     name="resume"
                     value={resume.id}
                     checked={selectedResume === parseInt(resume.id)}
                     onChange={(e) => setSelectedResume(parseInt(e.target.value))}
+                    tabIndex={-1}
                     className="h-4 w-4 text-blue-600 focus:ring-blue-500 border-gray-300"
                   />
-                  <div className="ml-3">
-                    <p className="text-sm font-medium text-gray-900">{resume.filename}</p>
+                  <div className="ml-3 min-w-0">
+                    <p className="text-sm font-medium text-gray-900 truncate">{resume.filename}</p>
                     <p className="text-xs text-gray-500">
                       {formatDateWithPrefix(resume.uploaded_at, 'Uploaded')}
                     </p>
                   </div>
                 </label>
-              ))}
-            </div>
+              )}
+            />
           ) : (
             <div className="text-center py-6">
               <DocumentTextIcon className="mx-auto h-12 w-12 text-gray-400" />
@@ -112,36 +293,175 @@ const JobMatching = () => {
         </div>
 
         {/* Job Description */}
-        <div className="card">
-          <h3 className="text-lg font-medium text-gray-900 mb-4">Job Description</h3>
-          <textarea
-            value={jobDescription}
-            onChange={(e) => setJobDescription(e.target.value)}
-            placeholder="Paste the job description here..."
-            rows={12}
-            className="w-full px-3 py-2 border border-gray-300 rounded-lg focus:outline-none focus:ring-2 focus:ring-blue-500 focus:border-transparent resize-none"
-          />
-        </div>
+        {mode === 'single' ? (
+          <div className="card">
+            <h3 className="text-lg font-medium text-gray-900 mb-4">Job Description</h3>
+            <textarea
+              value={jobDescription}
+              onChange={(e) => setJobDescription(e.target.value)}
+              placeholder="Paste the job description here..."
+              rows={12}
+              className="w-full px-3 py-2 border border-gray-300 rounded-lg focus:outline-none focus:ring-2 focus:ring-blue-500 focus:border-transparent resize-none"
+            />
+            <KeywordPreMatch result={preMatch} />
+          </div>
+        ) : (
+          <div className="card">
+            <div className="flex items-center justify-between mb-4">
+              <h3 className="text-lg font-medium text-gray-900">Saved Job Descriptions</h3>
+              {savedJobs.length > 0 && (
+                <button
+                  type="button"
+                  onClick={toggleAllJobs}
+                  disabled={batchRunning}
+                  className="text-sm text-blue-600 hover:text-blue-500 disabled:opacity-50"
+                >
+                  {allLoadedJobsSelected ? 'Clear selection' : 'Select all'}
+                </button>
+              )}
+            </div>
+            <input
+              type="search"
+              value={jobSearch}
+              onChange={(e) => setJobSearch(e.target.value)}
+              placeholder="Search by title or company..."
+              className="w-full mb-3 px-3 py-2 border border-gray-300 rounded-lg focus:outline-none focus:ring-2 focus:ring-blue-500 focus:border-transparent"
+            />
+            {jobsLoading ? (
+              <div className="flex justify-center py-6">
+                <div className="animate-spin rounded-full h-8 w-8 border-b-2 border-blue-600"></div>
+              </div>
+            ) : savedJobs.length > 0 ? (
+              <VirtualList
+                items={savedJobs}
+                itemKey={(job) => job.id}
+                itemHeight={PICKER_ROW_HEIGHT}
+                height={PICKER_LIST_HEIGHT}
+                gap={8}
+                aria-label="Saved job descriptions"
+                isSelected={(job) => selectedJobs.has(String(job.id))}
+                onSelect={(job) => !batchRunning && toggleJob(job)}
+                onEndReached={loadMoreJobs}
+                loadingMore={loadingMoreJobs}
+                renderItem={(job) => (
+                  <label className="flex items-center h-full p-3 border border-gray-200 rounded-lg cursor-pointer hover:bg-gray-50">
+                    <input
+                      type="checkbox"
+                      checked={selectedJobs.has(String(job.id))}
+                      onChange={() => toggleJob(job)}
+                      disabled={batchRunning}
+                      tabIndex={-1}
+                      className="h-4 w-4 text-blue-600 focus:ring-blue-500 border-gray-300 rounded"
+                    />
+                    <div className="ml-3 min-w-0">
+                      <p className="text-sm font-medium text-gray-900 truncate">{job.title}</p>
+                      <p className="text-xs text-gray-500 truncate">{job.company}</p>
+                    </div>
+                  </label>
+                )}
+              />
+            ) : (
+              <div className="text-center py-6">
+                <DocumentTextIcon className="mx-auto h-12 w-12 text-gray-400" />
+                <p className="mt-2 text-sm text-gray-500">
+                  {debouncedJobSearch ? 'No job descriptions match your search' : 'No saved job descriptions yet'}
+                </p>
+              </div>
+            )}
+          </div>
+        )}
       </div>
 
       {/* Match Button */}
-      <div className="flex justify-center">
-        <button
-          onClick={handleMatch}
-          disabled={matching || !selectedResume || !jobDescription.trim()}
-          className="btn-primary disabled:opacity-50 disabled:cursor-not-allowed"
-        >
-          {matching ? (
-            <div className="flex items-center">
-              <div className="animate-spin rounded-full h-4 w-4 border-b-2 border-white mr-2"></div>
-              Matching...
-            </div>
-          ) : (
-            'Match Resume with Job'
-          )}
-        </button>
+      <div className="flex justify-center gap-4">
+        {mode === 'single' ? (
+          <button
+            onClick={handleMatch}
+            disabled={matching || !selectedResume || !jobDescription.trim()}
+            className="btn-primary disabled:opacity-50 disabled:cursor-not-allowed"
+          >
+            {matching ? (
+              <div className="flex items-center">
+                <div className="animate-spin rounded-full h-4 w-4 border-b-2 border-white mr-2"></div>
+                Matching...
+              </div>
+            ) : (
+              'Match Resume with Job'
+            )}
+          </button>
+        ) : batchRunning ? (
+          <>
+            <button disabled className="btn-primary opacity-50 cursor-not-allowed">
+              <div className="flex items-center">
+                <div className="animate-spin rounded-full h-4 w-4 border-b-2 border-white mr-2"></div>
+                Matching {batchFinished}/{rankedEntries.length}...
+              </div>
+            </button>
+            <button onClick={cancelBatchMatch} className="btn-secondary">
+              Cancel
+            </button>
+          </>
+        ) : (
+          <button
+            onClick={handleBatchMatch}
+            disabled={!selectedResume || selectedJobs.size === 0}
+            className="btn-primary disabled:opacity-50 disabled:cursor-not-allowed"
+          >
+            {`Match Against ${selectedJobs.size || ''} Job${selectedJobs.size === 1 ? '' : 's'}`}
+          </button>
+        )}
       </div>
 
+      {/* Batch Results */}
+      {mode === 'batch' && rankedEntries.length > 0 && (
+        <div className="card overflow-x-auto">
+          <h3 className="text-lg font-medium text-gray-900 mb-4">Ranked Matches</h3>
+          <table className="min-w-full divide-y divide-gray-200">
+            <thead>
+              <tr className="text-left text-xs font-medium text-gray-500 uppercase tracking-wider">
+                <th className="py-2 pr-4">#</th>
+                <th className="py-2 pr-4">Job</th>
+                <th className="py-2 pr-4">Status</th>
+                <th className="py-2 pr-4">Score</th>
+                <th className="py-2"></th>
+              </tr>
+            </thead>
+            <tbody className="divide-y divide-gray-100">
+              {rankedEntries.map((entry, index) => (
+                <tr key={entry.jobDescription.id} className="text-sm">
+                  <td className="py-3 pr-4 text-gray-500">{entry.status === 'done' ? index + 1 : '-'}</td>
+                  <td className="py-3 pr-4">
+                    <p className="font-medium text-gray-900">{entry.jobDescription.title}</p>
+                    <p className="text-xs text-gray-500">{entry.jobDescription.company}</p>
+                  </td>
+                  <td className="py-3 pr-4 text-gray-600" title={entry.error}>
+                    {BATCH_STATUS_LABELS[entry.status]}
+                  </td>
+                  <td className="py-3 pr-4">
+                    {entry.score !== undefined && (
+                      <span className={`inline-flex items-center px-2 py-1 rounded-full text-xs font-medium ${getMatchColor(entry.score)}`}>
+                        {entry.score}%
+                      </span>
+                    )}
+                  </td>
+                  <td className="py-3 text-right">
+                    {entry.result && (
+                      <button
+                        type="button"
+                        onClick={() => setMatchResult(entry.result!)}
+                        className="text-blue-600 hover:text-blue-500"
+                      >
+                        View details
+                      </button>
+                    )}
+                  </td>
+                </tr>
+              ))}
+            </tbody>
+          </table>
+        </div>
+      )}
+
       {/* Results */}
       {matchResult && (
         <div className="space-y-6">
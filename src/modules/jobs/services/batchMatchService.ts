@@ -0,0 +1,92 @@
+import { runWithConcurrency } from '@utils/concurrency';
+import { resumeService } from '@resume/services';
+import type { JobDescription, JobMatchResult } from '@types';
+
+/**
+ * Batch job matching
+ * Scores one resume against many saved job descriptions through POST /match,
+ * keeping a bounded number of LLM requests in flight.
+ */
+
+/** Matches running at once; each one is a long LLM call on the backend */
+export const BATCH_MATCH_CONCURRENCY = 4;
+
+export type BatchMatchStatus = 'queued' | 'running' | 'done' | 'failed' | 'cancelled';
+
+export interface BatchMatchEntry {
+  jobDescription: JobDescription;
+  status: BatchMatchStatus;
+  score?: number;
+  result?: JobMatchResult;
+  error?: string;
+}
+
+export interface BatchMatchOptions {
+  concurrency?: number;
+  signal?: AbortSignal;
+  /** Called whenever one entry changes state */
+  onUpdate?: (entry: BatchMatchEntry) => void;
+}
+
+/**
+ * Overall score of a match result, whichever field the backend filled in
+ */
+export const getMatchScore = (result: Partial<JobMatchResult>): number =>
+  result.overall_score || result.match_score || 0;
+
+/**
+ * Order entries by score, finished matches first
+ */
+export const rankBatchMatches = (entries: BatchMatchEntry[]): BatchMatchEntry[] =>
+  [...entries].sort((a, b) => {
+    if ((a.status === 'done') !== (b.status === 'done')) {
+      return a.status === 'done' ? -1 : 1;
+    }
+    return (b.score ?? -1) - (a.score ?? -1);
+  });
+
+export const batchMatchService = {
+  /**
+   * Match a resume against every given job description.
+   * Resolves with all entries once the batch has finished or was cancelled.
+   */
+  async matchResumeAgainstJobs(
+    resumeId: number,
+    jobDescriptions: JobDescription[],
+    { concurrency = BATCH_MATCH_CONCURRENCY, signal, onUpdate }: BatchMatchOptions = {}
+  ): Promise<BatchMatchEntry[]> {
+    const entries: BatchMatchEntry[] = jobDescriptions.map((jobDescription) => ({
+      jobDescription,
+      status: 'queued',
+    }));
+
+    const update = (index: number, patch: Partial<BatchMatchEntry>) => {
+      entries[index] = { ...entries[index], ...patch };
+      onUpdate?.(entries[index]);
+    };
+
+    await runWithConcurrency(
+      jobDescriptions,
+      async (jobDescription, index, taskSignal) => {
+        update(index, { status: 'running' });
+        return resumeService.matchJob(resumeId, jobDescription.description, taskSignal);
+      },
+      { limit: concurrency, signal },
+      (settled, _jobDescription, index) => {
+        if (settled.status === 'fulfilled') {
+          const result = settled.value as JobMatchResult;
+          update(index, { status: 'done', result, score: getMatchScore(result) });
+        } else if (signal?.aborted) {
+          update(index, { status: 'cancelled' });
+        } else {
+          update(index, {
+            status: 'failed',
+            error: settled.reason?.response?.data?.detail || settled.reason?.message || 'Matching failed',
+          });
+        }
+      }
+    );
+
+    return entries;
+  },
+};
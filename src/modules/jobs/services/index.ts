@@ -1,2 +1,3 @@
 // Job services
 export * from './jobService';
+export * from './batchMatchService';
@@ -1,38 +1,62 @@
-import axios, { AxiosResponse } from 'axios';
+import type { AxiosResponse } from 'axios';
+import { apiClient } from '@utils/httpClient';
+import { queryCache } from '@utils/queryCache';
+import type { QueryFetchOptions } from '@utils/queryCache';
+import { pageKey, pageQueryKey, toPageRequestParams } from '@utils/pagination';
 import type { 
   JobDescriptionListResponse, 
   JobDescriptionResponse, 
   CreateJobDescriptionRequest, 
-  BaseResponse 
+  BaseResponse,
+  PageParams,
+  PageQuery
 } from '@types';
 
-const API_BASE_URL = import.meta.env.VITE_API_URL || '/api';
-
-const api = axios.create({
-  baseURL: API_BASE_URL,
-  headers: {
-    'Content-Type': 'application/json',
-  },
-});
-
-// Add token to requests
-api.interceptors.request.use((config) => {
-  const token = localStorage.getItem('token');
-  if (token) {
-    config.headers.Authorization = `Bearer ${token}`;
-  }
-  return config;
-});
+// Query cache keys for job description data
+const JOB_DESCRIPTION_QUERY_PREFIX = 'job-descriptions';
+export const JOB_DESCRIPTION_LIST_QUERY_KEY = `${JOB_DESCRIPTION_QUERY_PREFIX}:list`;
+const JOB_DESCRIPTION_PAGES_QUERY_PREFIX = `${JOB_DESCRIPTION_QUERY_PREFIX}:pages`;
 
+/**
+ * Cache key shared by every page of a paginated job description query
+ */
+export const jobDescriptionPagesQueryKey = (query: PageQuery = {}): string =>
+  pageQueryKey(JOB_DESCRIPTION_PAGES_QUERY_PREFIX, query);
 
 export const jobService = {
   /**
    * Get Job Descriptions
    * GET /job-descriptions
+   * Served from the shared query cache; concurrent callers share one request.
    */
-  async getJobDescriptions(): Promise<JobDescriptionListResponse> {
-    const response: AxiosResponse<JobDescriptionListResponse> = await api.get('/job-descriptions');
-    return response.data;
+  async getJobDescriptions(options?: QueryFetchOptions): Promise<JobDescriptionListResponse> {
+    return queryCache.fetch(
+      JOB_DESCRIPTION_LIST_QUERY_KEY,
+      async (signal) => {
+        const response: AxiosResponse<JobDescriptionListResponse> = await apiClient.get('/job-descriptions', { signal });
+        return response.data;
+      },
+      options
+    );
+  },
+
+  /**
+   * Get Job Descriptions (paginated)
+   * GET /job-descriptions?cursor=&limit=&search=&sort=&order=
+   * Pass the previous page's `next_cursor` to continue.
+   */
+  async getJobDescriptionsPage(params: PageParams = {}, options?: QueryFetchOptions): Promise<JobDescriptionListResponse> {
+    return queryCache.fetch(
+      pageKey(JOB_DESCRIPTION_PAGES_QUERY_PREFIX, params),
+      async (signal) => {
+        const response: AxiosResponse<JobDescriptionListResponse> = await apiClient.get('/job-descriptions', {
+          params: toPageRequestParams(params),
+          signal
+        });
+        return response.data;
+      },
+      options
+    );
   },
 
   /**
@@ -45,11 +69,12 @@ export const jobService = {
     formData.append('company', jobData.company);
     formData.append('content', jobData.description);
     
-    const response: AxiosResponse<JobDescriptionResponse> = await api.post('/job-descriptions', formData, {
+    const response: AxiosResponse<JobDescriptionResponse> = await apiClient.post('/job-descriptions', formData, {
       headers: {
         'Content-Type': 'application/x-www-form-urlencoded',
       },
     });
+    queryCache.invalidate(JOB_DESCRIPTION_QUERY_PREFIX);
     return response.data;
   },
 
@@ -58,7 +83,8 @@ export const jobService = {
    * DELETE /job-descriptions/{jd_id}
    */
   async deleteJobDescription(jdId: number): Promise<BaseResponse> {
-    const response: AxiosResponse<BaseResponse> = await api.delete(`/job-descriptions/${jdId}`);
+    const response: AxiosResponse<BaseResponse> = await apiClient.delete(`/job-descriptions/${jdId}`);
+    queryCache.invalidate(JOB_DESCRIPTION_QUERY_PREFIX);
     return response.data;
   },
 
@@ -66,12 +92,12 @@ export const jobService = {
    * Get Job Description Page
    * GET /jd
    */
-  async getJdPage(success: string | null = null, error: string | null = null): Promise<string> {
+  async getJdPage(success: string | null = null, error: string | null = null, signal?: AbortSignal): Promise<string> {
     const params = new URLSearchParams();
     if (success) params.append('success', success);
     if (error) params.append('error', error);
     
-    const response: AxiosResponse<string> = await api.get(`/jd?${params.toString()}`);
+    const response: AxiosResponse<string> = await apiClient.get(`/jd?${params.toString()}`, { signal });
     return response.data;
   },
 
@@ -85,11 +111,12 @@ export const jobService = {
     formData.append('jd_company', jobData.company);
     formData.append('jd_content', jobData.description);
     
-    const response: AxiosResponse<string> = await api.post('/jd', formData, {
+    const response: AxiosResponse<string> = await apiClient.post('/jd', formData, {
       headers: {
         'Content-Type': 'application/x-www-form-urlencoded',
       },
     });
+    queryCache.invalidate(JOB_DESCRIPTION_QUERY_PREFIX);
     return response.data;
   },
 
@@ -98,7 +125,8 @@ export const jobService = {
    * DELETE /jd/{jd_id}
    */
   async deleteJdForm(jdId: number): Promise<Record<string, any>> {
-    const response: AxiosResponse<Record<string, any>> = await api.delete(`/jd/${jdId}`);
+    const response: AxiosResponse<Record<string, any>> = await apiClient.delete(`/jd/${jdId}`);
+    queryCache.invalidate(JOB_DESCRIPTION_QUERY_PREFIX);
     return response.data;
   },
 
@@ -106,8 +134,8 @@ export const jobService = {
    * Debug Job Description
    * GET /debug/jd/{jd_id}
    */
-  async debugJd(jdId: number): Promise<Record<string, any>> {
-    const response: AxiosResponse<Record<string, any>> = await api.get(`/debug/jd/${jdId}`);
+  async debugJd(jdId: number, signal?: AbortSignal): Promise<Record<string, any>> {
+    const response: AxiosResponse<Record<string, any>> = await apiClient.get(`/debug/jd/${jdId}`, { signal });
     return response.data;
   },
 
@@ -115,8 +143,8 @@ export const jobService = {
    * Debug All Job Descriptions
    * GET /debug/jds
    */
-  async debugAllJds(): Promise<Record<string, any>> {
-    const response: AxiosResponse<Record<string, any>> = await api.get('/debug/jds');
+  async debugAllJds(signal?: AbortSignal): Promise<Record<string, any>> {
+    const response: AxiosResponse<Record<string, any>> = await apiClient.get('/debug/jds', { signal });
     return response.data;
   }
 };
@@ -1,7 +1,9 @@
-import React, { useState, useEffect } from 'react';
-import { useAuth } from '@contexts/AuthContext.js';
+import React, { useState, useEffect, useRef } from 'react';
+import { useAuthActions, useAuthSelector } from '@contexts/AuthContext.js';
 import { useNotification } from '@contexts/NotificationContext.js';
-import { profileService } from '@profile/services';
+import { avatarCache, avatarVariantFor, profileService } from '@profile/services';
+import { useAvatar } from '@hooks';
+import { resizeImage } from '@utils/imageResize';
 import {
   UserIcon,
   PhotoIcon,
@@ -18,8 +20,12 @@ interface ProfileFormData {
   bio: string;
 }
 
+// Displayed size (px) of the profile photo
+const PROFILE_AVATAR_SIZE = 128;
+
 const Profile = () => {
-  const { user, updateUser } = useAuth();
+  const user = useAuthSelector((state) => state.user);
+  const { updateUser } = useAuthActions();
   const { success, error } = useNotification();
   const [editing, setEditing] = useState<boolean>(false);
   const [loading, setLoading] = useState<boolean>(false);
@@ -31,7 +37,24 @@ const Profile = () => {
     bio: ''
   });
   const [profileImage, setProfileImage] = useState<File | null>(null);
+  // Photo picked for upload; the saved photo comes from the shared avatar cache
   const [imagePreview, setImagePreview] = useState<string | null>(null);
+  const avatarUrl = useAvatar(user, PROFILE_AVATAR_SIZE);
+  const [processingImage, setProcessingImage] = useState<boolean>(false);
+  // Object URL of the photo picked for upload, revoked when replaced
+  const previewUrlRef = useRef<string | null>(null);
+
+  const showPreview = (url: string | null) => {
+    if (previewUrlRef.current) {
+      URL.revokeObjectURL(previewUrlRef.current);
+    }
+    previewUrlRef.current = url;
+    setImagePreview(url);
+  };
+
+  useEffect(() => () => {
+    if (previewUrlRef.current) URL.revokeObjectURL(previewUrlRef.current);
+  }, []);
 
   useEffect(() => {
     if (user) {
@@ -42,7 +65,7 @@ const Profile = () => {
         location: user.location ?? '',
         bio: user.bio ?? ''
       });
-      setImagePreview(user.profile_photo || null);
+      showPreview(null);
     }
   }, [user]);
 
@@ -62,16 +85,22 @@ const Profile = () => {
     });
   };
 
-  const handleImageChange = (e: React.ChangeEvent<HTMLInputElement>) => {
+  const handleImageChange = async (e: React.ChangeEvent<HTMLInputElement>) => {
     const file = e.target.files?.[0];
-    if (file) {
-      setProfileImage(file);
-      const reader = new FileReader();
-      reader.onloadend = () => {
-        setImagePreview(reader.result as string);
-      };
-      reader.readAsDataURL(file);
+    if (!file) return;
+
+    // Upload the photo at avatar size, without metadata
+    setProcessingImage(true);
+    let photo = file;
+    try {
+      photo = await resizeImage(file);
+    } catch {
+      // Formats the browser cannot decode are uploaded as picked
+    } finally {
+      setProcessingImage(false);
     }
+    setProfileImage(photo);
+    showPreview(URL.createObjectURL(photo));
   };
 
   const handleSubmit = async (e: React.FormEvent<HTMLFormElement>) => {
@@ -96,6 +125,8 @@ const Profile = () => {
       // Upload profile photo if selected
       if (profileImage) {
         await profileService.uploadProfilePhoto(profileImage);
+        // Replace the cached avatar everywhere it is shown
+        avatarCache.load(user.id, avatarVariantFor(PROFILE_AVATAR_SIZE), true).catch(() => {});
       }
 
       // Update profile data
@@ -115,9 +146,8 @@ const Profile = () => {
     } catch (err: any) {
       console.error('Profile update error:', err);
       if (err.response?.status === 401) {
+        // The session is cleared by httpClient; ProtectedRoute sends the user to /login
         error('Session expired. Please log in again.');
-        // Redirect to login
-        window.location.href = '/login';
       } else {
         error('Failed to update profile');
       }
@@ -135,7 +165,7 @@ const Profile = () => {
         location: user.location ?? '',
         bio: user.bio ?? ''
       });
-      setImagePreview(user.profile_photo || null);
+      showPreview(null);
     }
     setProfileImage(null);
     setEditing(false);
@@ -157,9 +187,9 @@ const Profile = () => {
           <div className="card text-center bg-white/80 backdrop-blur-sm shadow-lg border-0">
             <div className="relative inline-block">
               <div className="h-32 w-32 rounded-full bg-gray-200 flex items-center justify-center mx-auto mb-4">
-                {imagePreview ? (
+                {imagePreview || avatarUrl ? (
                   <img
-                    src={imagePreview}
+                    src={imagePreview || avatarUrl!}
                     alt="Profile"
                     className="h-32 w-32 rounded-full object-cover"
                   />
@@ -169,11 +199,16 @@ const Profile = () => {
               </div>
               {editing && (
                 <label className="absolute bottom-0 right-0 bg-blue-600 text-white rounded-full p-2 cursor-pointer hover:bg-blue-700">
-                  <PhotoIcon className="h-4 w-4" />
+                  {processingImage ? (
+                    <div className="animate-spin rounded-full h-4 w-4 border-b-2 border-white"></div>
+                  ) : (
+                    <PhotoIcon className="h-4 w-4" />
+                  )}
                   <input
                     type="file"
                     accept="image/*"
                     onChange={handleImageChange}
+                    disabled={processingImage}
                     className="hidden"
                   />
                 </label>
@@ -209,7 +244,7 @@ const Profile = () => {
                       <button
                       onClick={updateProfile}
                         type="button"
-                        disabled={loading}
+                        disabled={loading || processingImage}
                         className="btn-primary disabled:opacity-50 disabled:cursor-not-allowed"
                       >
                     {loading ? (
@@ -0,0 +1,158 @@
+import { profileService } from './profileService';
+
+/** Users whose avatars are kept decoded; older ones are revoked */
+const MAX_CACHED_AVATARS = 20;
+
+/** Age (ms) after which a cached avatar is revalidated with its ETag */
+const AVATAR_REVALIDATE_AFTER = 10 * 60 * 1000;
+
+/** Variants served by the backend, in px */
+export const AVATAR_SIZES = [64, 128, 256];
+
+interface AvatarEntry {
+  url: string;
+  size: number;
+  etag: string | null;
+  checkedAt: number;
+}
+
+type AvatarListener = () => void;
+
+/**
+ * Smallest variant covering `displaySize` CSS px at the screen's pixel density
+ */
+export const avatarVariantFor = (displaySize: number): number => {
+  const pixels = displaySize * (typeof window !== 'undefined' ? window.devicePixelRatio || 1 : 1);
+  return AVATAR_SIZES.find((size) => size >= pixels) ?? AVATAR_SIZES[AVATAR_SIZES.length - 1];
+};
+
+/**
+ * Avatar loader
+ * Keeps one decoded photo per user as an object URL, shared by every
+ * component showing that user. A request for a size the cached variant
+ * already covers is served from it; a larger size replaces it. Entries are
+ * evicted least recently used and their object URLs revoked.
+ */
+class AvatarCache {
+  // Map order doubles as recency order
+  private entries = new Map<string, AvatarEntry>();
+  private inflight = new Map<string, { size: number; request: Promise<string | null> }>();
+  private listeners = new Set<AvatarListener>();
+
+  /**
+   * Object URL of the user's cached avatar, if any
+   */
+  getUrl(userId: number | string): string | null {
+    return this.entries.get(String(userId))?.url ?? null;
+  }
+
+  subscribe(listener: AvatarListener): () => void {
+    this.listeners.add(listener);
+    return () => {
+      this.listeners.delete(listener);
+    };
+  }
+
+  /**
+   * Load (or revalidate) a user's avatar of at least `size` px.
+   * Resolves to an object URL, or null if the user has no photo.
+   */
+  load(userId: number | string, size: number, force = false): Promise<string | null> {
+    const key = String(userId);
+    const entry = this.entries.get(key);
+    if (entry) {
+      this.touch(key, entry);
+      const fresh = Date.now() - entry.checkedAt < AVATAR_REVALIDATE_AFTER;
+      if (entry.size >= size && fresh && !force) return Promise.resolve(entry.url);
+    }
+
+    // Join a download that covers this request; otherwise queue behind it so
+    // a larger variant or a forced reload is not answered by a stale response
+    const existing = this.inflight.get(key);
+    if (existing && existing.size >= size && !force) return existing.request;
+
+    const requestSize = Math.max(size, entry?.size ?? 0);
+    const previous = existing ? existing.request.catch(() => null) : Promise.resolve(null);
+    const request: Promise<string | null> = previous
+      .then(() => this.download(key, userId, requestSize))
+      .finally(() => {
+        if (this.inflight.get(key)?.request === request) this.inflight.delete(key);
+      });
+
+    this.inflight.set(key, { size: requestSize, request });
+    return request;
+  }
+
+  /**
+   * Forget a user's avatar, e.g. after uploading or deleting a photo
+   */
+  delete(userId: number | string): void {
+    const key = String(userId);
+    const entry = this.entries.get(key);
+    if (!entry) return;
+    URL.revokeObjectURL(entry.url);
+    this.entries.delete(key);
+    this.notify();
+  }
+
+  /**
+   * Revoke every avatar, e.g. on logout
+   */
+  clear(): void {
+    this.entries.forEach((entry) => URL.revokeObjectURL(entry.url));
+    this.entries.clear();
+    this.notify();
+  }
+
+  private download(key: string, userId: number | string, size: number): Promise<string | null> {
+    const entry = this.entries.get(key);
+    return profileService
+      .getProfilePhoto(userId, { size, etag: entry?.size === size ? entry.etag : null })
+      .then(({ blob, etag, notModified }) => {
+        const current = this.entries.get(key);
+        if (notModified && current) {
+          current.checkedAt = Date.now();
+          return current.url;
+        }
+        if (!blob) return current?.url ?? null;
+        this.set(key, { url: URL.createObjectURL(blob), size, etag, checkedAt: Date.now() });
+        return this.getUrl(key);
+      })
+      .catch((error) => {
+        if (error?.response?.status === 404) {
+          this.delete(key);
+          return null;
+        }
+        throw error;
+      });
+  }
+
+  private set(key: string, entry: AvatarEntry): void {
+    const previous = this.entries.get(key);
+    if (previous) URL.revokeObjectURL(previous.url);
+    this.entries.delete(key);
+    this.entries.set(key, entry);
+
+    while (this.entries.size > MAX_CACHED_AVATARS) {
+      const [oldestKey, oldest] = this.entries.entries().next().value as [string, AvatarEntry];
+      URL.revokeObjectURL(oldest.url);
+      this.entries.delete(oldestKey);
+    }
+    this.notify();
+  }
+
+  private touch(key: string, entry: AvatarEntry): void {
+    this.entries.delete(key);
+    this.entries.set(key, entry);
+  }
+
+  private notify(): void {
+    this.listeners.forEach((listener) => listener());
+  }
+}
+
+// Create and export singleton instance
+export const avatarCache = new AvatarCache();
+
+// Export the class for testing
+export { AvatarCache };
@@ -1,2 +1,3 @@
 // Profile services
 export * from './profileService';
+export * from './avatarCache';
@@ -1,4 +1,5 @@
-import axios, { AxiosResponse } from 'axios';
+import type { AxiosResponse } from 'axios';
+import { apiClient, UPLOAD_REQUEST_TIMEOUT } from '@utils/httpClient';
 import type { 
   ProfileUpdateRequest, 
   SocialLinksRequest, 
@@ -7,34 +8,20 @@ import type {
   BaseResponse 
 } from '@types';
 
-const API_BASE_URL = import.meta.env.VITE_API_URL || '/api';
-
-const api = axios.create({
-  baseURL: API_BASE_URL,
-  headers: {
-    'Content-Type': 'application/json',
-  },
-});
-
-// Create a separate axios instance for profile endpoints that don't use /api prefix
-const profileApi = axios.create({
-  baseURL: '', // No base URL prefix for profile endpoints
-  headers: {
-    'Content-Type': 'application/json',
-  },
-});
-
-// Add token to requests for both instances
-const addTokenInterceptor = (config: any) => {
-  const token = localStorage.getItem('token');
-  if (token) {
-    config.headers.Authorization = `Bearer ${token}`;
-  }
-  return config;
-};
-
-api.interceptors.request.use(addTokenInterceptor);
-profileApi.interceptors.request.use(addTokenInterceptor);
+export interface ProfilePhotoRequest {
+  /** Requested edge length in px; the server picks the closest variant */
+  size?: number;
+  /** ETag of the copy already held */
+  etag?: string | null;
+  signal?: AbortSignal;
+}
+
+export interface ProfilePhotoResponse {
+  /** Null when the held copy is still current */
+  blob: Blob | null;
+  etag: string | null;
+  notModified: boolean;
+}
 
 // Re-export types for convenience
 export type { 
@@ -51,8 +38,8 @@ export const profileService = {
    * Get User Profile
    * GET /api/profile
    */
-  async getProfile(): Promise<AuthResponse> {
-    const response: AxiosResponse<AuthResponse> = await api.get('/profile');
+  async getProfile(signal?: AbortSignal): Promise<AuthResponse> {
+    const response: AxiosResponse<AuthResponse> = await apiClient.get('/profile', { signal });
     return response.data;
   },
 
@@ -61,7 +48,7 @@ export const profileService = {
    * PUT /api/profile
    */
   async updateProfile(profileData: ProfileUpdateRequest): Promise<BaseResponse> {
-    const response: AxiosResponse<BaseResponse> = await api.put('/profile', profileData);
+    const response: AxiosResponse<BaseResponse> = await apiClient.put('/profile', profileData);
     return response.data;
   },
 
@@ -70,7 +57,7 @@ export const profileService = {
    * PUT /profile
    */
   async updateProfileCompat(profileData: ProfileUpdateRequest): Promise<BaseResponse> {
-    const response: AxiosResponse<BaseResponse> = await profileApi.put('/profile', profileData);
+    const response: AxiosResponse<BaseResponse> = await apiClient.put('/profile', profileData);
     return response.data;
   },
 
@@ -88,7 +75,7 @@ export const profileService = {
     if (profileData.location) formData.append('location', profileData.location);
     if (profileData.bio) formData.append('bio', profileData.bio);
     
-    const response: AxiosResponse<Record<string, any>> = await profileApi.post('/profile/update', formData, {
+    const response: AxiosResponse<Record<string, any>> = await apiClient.post('/profile/update', formData, {
       headers: {
         'Content-Type': 'application/x-www-form-urlencoded',
       },
@@ -106,7 +93,7 @@ export const profileService = {
     if (socialData.github_url) formData.append('github_url', socialData.github_url);
     if (socialData.website_url) formData.append('website_url', socialData.website_url);
     
-    const response: AxiosResponse<Record<string, any>> = await profileApi.post('/profile/social', formData, {
+    const response: AxiosResponse<Record<string, any>> = await apiClient.post('/profile/social', formData, {
       headers: {
         'Content-Type': 'application/x-www-form-urlencoded',
       },
@@ -124,7 +111,7 @@ export const profileService = {
     formData.append('new_password', passwordData.new_password);
     formData.append('confirm_password', passwordData.confirm_password);
     
-    const response: AxiosResponse<Record<string, any>> = await profileApi.post('/profile/password', formData, {
+    const response: AxiosResponse<Record<string, any>> = await apiClient.post('/profile/password', formData, {
       headers: {
         'Content-Type': 'application/x-www-form-urlencoded',
       },
@@ -140,10 +127,11 @@ export const profileService = {
     const formData = new FormData();
     formData.append('photo', photo);
     
-    const response: AxiosResponse<Record<string, any>> = await profileApi.post('/profile/photo', formData, {
+    const response: AxiosResponse<Record<string, any>> = await apiClient.post('/profile/photo', formData, {
       headers: {
         'Content-Type': 'multipart/form-data',
       },
+      timeout: UPLOAD_REQUEST_TIMEOUT,
     });
     return response.data;
   },
@@ -153,19 +141,30 @@ export const profileService = {
    * DELETE /profile/photo
    */
   async deleteProfilePhoto(): Promise<Record<string, any>> {
-    const response: AxiosResponse<Record<string, any>> = await profileApi.delete('/profile/photo');
+    const response: AxiosResponse<Record<string, any>> = await apiClient.delete('/profile/photo');
     return response.data;
   },
 
   /**
    * Get Profile Photo
-   * GET /profile-photo/{user_id}
+   * GET /profile-photo/{user_id}?size=
+   * Pass the ETag of a copy already held to get `notModified` instead of
+   * downloading it again. Use avatarCache rather than calling this directly.
    */
-  async getProfilePhoto(userId: number): Promise<Blob> {
-    const response: AxiosResponse<Blob> = await api.get(`/profile-photo/${userId}`, {
-      responseType: 'blob'
+  async getProfilePhoto(userId: number | string, options: ProfilePhotoRequest = {}): Promise<ProfilePhotoResponse> {
+    const { size, etag, signal } = options;
+    const response: AxiosResponse<Blob> = await apiClient.get(`/profile-photo/${userId}`, {
+      params: size ? { size } : undefined,
+      headers: etag ? { 'If-None-Match': etag } : undefined,
+      responseType: 'blob',
+      validateStatus: (status) => (status >= 200 && status < 300) || status === 304,
+      signal
     });
-    return response.data;
+    return {
+      blob: response.status === 304 ? null : response.data,
+      etag: (response.headers.etag as string | undefined) ?? etag ?? null,
+      notModified: response.status === 304
+    };
   },
 
   /**
@@ -176,7 +175,7 @@ export const profileService = {
     const formData = new FormData();
     formData.append('email', email);
     
-    const response: AxiosResponse<string> = await api.post('/forgot-password', formData, {
+    const response: AxiosResponse<string> = await apiClient.post('/forgot-password', formData, {
       headers: {
         'Content-Type': 'application/x-www-form-urlencoded',
       },
@@ -194,7 +193,7 @@ export const profileService = {
     formData.append('new_password', newPassword);
     formData.append('confirm_password', confirmPassword);
     
-    const response: AxiosResponse<string> = await api.post('/reset-password', formData, {
+    const response: AxiosResponse<string> = await apiClient.post('/reset-password', formData, {
       headers: {
         'Content-Type': 'application/x-www-form-urlencoded',
       },
@@ -11,113 +11,73 @@ import {
 } from "@heroicons/react/24/outline";
 import React, { useEffect, useState } from "react";
 import { Link, useNavigate, useSearchParams } from "react-router-dom";
-import { useAuth } from "@contexts/AuthContext.js";
+import { useAuthSelector } from "@contexts/AuthContext.js";
 import { useNotification } from "@contexts/NotificationContext.js";
-import { resumeService } from "@resume/services";
+import { useDebouncedValue, useQuery, useResumeList } from "@hooks";
+import VirtualList, { columnsForWidth } from "@components/VirtualList";
+import {
+  analysisStatusTracker,
+  resumeAnalysisQueryKey,
+  resumeService,
+} from "@resume/services";
 import type {
   ResumeAnalysisData as ResumeAnalysisType,
-  ResumeScan,
+  SortOrder,
 } from "@types";
 
 const ResumeAnalysis = () => {
   const [searchParams] = useSearchParams();
   const navigate = useNavigate();
   const resumeId = searchParams.get("resumeId");
-  const [analysis, setAnalysis] = useState<ResumeAnalysisType | null>(null);
-  const [loading, setLoading] = useState<boolean>(true);
-  const [userResumes, setUserResumes] = useState<ResumeScan[]>([]);
-  const [showDefaultPage, setShowDefaultPage] = useState<boolean>(false);
   const { error } = useNotification();
-  const { user, loading: authLoading } = useAuth();
+  const signedIn = useAuthSelector((state) => !!state.user);
+  const authLoading = useAuthSelector((state) => state.loading);
+  const showDefaultPage = !resumeId;
+  // Served from the persistent result cache when available, then revalidated
+  const {
+    data: analysis,
+    error: analysisError,
+    isLoading: loading,
+    refetch: reloadAnalysis,
+  } = useQuery<ResumeAnalysisType>(
+    resumeId ? resumeAnalysisQueryKey(resumeId) : null,
+    (options) =>
+      resumeService.getResumeAnalysis(parseInt(resumeId!), options) as Promise<ResumeAnalysisType>,
+    { enabled: signedIn }
+  );
 
   // Force re-render when resumeId changes by using it as a key
   const componentKey = resumeId || "default";
 
-  // Separate effect to handle URL parameter changes
   useEffect(() => {
-    console.log("URL parameter changed:", { resumeId });
-
-    // Reset states when resumeId changes
-    setAnalysis(null);
-    setLoading(true);
-    setShowDefaultPage(false);
-  }, [resumeId]);
-
-  useEffect(() => {
-    console.log("ResumeAnalysis useEffect triggered:", {
-      resumeId,
-      user: !!user,
-      authLoading,
-    });
-
     // Check if user is authenticated
-    if (!authLoading && !user) {
+    if (!authLoading && !signedIn) {
       navigate("/login");
-      return;
     }
+  }, [signedIn, authLoading, navigate]);
 
-    if (resumeId) {
-      console.log("Loading analysis for resume ID:", resumeId);
-      loadAnalysis();
-    } else {
-      console.log("Loading user resumes (no resumeId)");
-      loadUserResumes();
-    }
-  }, [resumeId, user, authLoading, navigate]);
-
-  const loadAnalysis = async (): Promise<void> => {
-    if (!resumeId) {
-      console.log("No resumeId, skipping loadAnalysis");
-      return;
-    }
-
-    console.log("loadAnalysis called with resumeId:", resumeId);
-    const currentResumeId = resumeId; // Capture the current resumeId to prevent race conditions
-
-    try {
-      const data = await resumeService.getResumeAnalysis(parseInt(resumeId));
-      console.log("Analysis data received:", data);
-
-      // Only update state if this is still the current resumeId
-      if (currentResumeId === resumeId) {
-        setAnalysis(data as ResumeAnalysisType);
-      }
-    } catch (err: any) {
-      console.error("Failed to load analysis:", err);
-      if (err.response?.status === 401) {
-        error("Please log in to view analysis results");
-        navigate("/login");
-      } else if (err.response?.status === 404) {
-        error("Resume not found");
-      } else {
-        error("Failed to load analysis results");
-      }
-    } finally {
-      // Only update loading state if this is still the current resumeId
-      if (currentResumeId === resumeId) {
-        setLoading(false);
+  // Reload the open analysis when its background processing finishes
+  useEffect(() => {
+    if (!resumeId) return;
+    return analysisStatusTracker.onComplete((resume) => {
+      if (String(resume.id) === resumeId) {
+        reloadAnalysis().catch(() => {});
       }
-    }
-  };
+    });
+  }, [resumeId, reloadAnalysis]);
 
-  const loadUserResumes = async (): Promise<void> => {
-    try {
-      const data = await resumeService.getUserResumes();
-      setUserResumes(data.resumes || []);
-      setShowDefaultPage(true);
-    } catch (err: any) {
-      console.error("Failed to load resumes:", err);
-      if (err.response?.status === 401) {
-        error("Please log in to view your resumes");
-        navigate("/login");
-      } else {
-        error("Failed to load resumes");
-      }
-      setShowDefaultPage(true);
-    } finally {
-      setLoading(false);
+  useEffect(() => {
+    if (!analysisError) return;
+    console.error("Failed to load analysis:", analysisError);
+    if (analysisError.response?.status === 401) {
+      error("Please log in to view analysis results");
+      navigate("/login");
+    } else if (analysisError.response?.status === 404) {
+      error("Resume not found");
+    } else {
+      error("Failed to load analysis results");
     }
-  };
+  }, [analysisError]);
 
   const getScoreColor = (score: number): string => {
     if (score >= 80) return "text-green-600 bg-green-100";
@@ -131,7 +91,7 @@ const ResumeAnalysis = () => {
     return <XCircleIcon className="h-5 w-5" />;
   };
 
-  if (authLoading || loading) {
+  if (authLoading || (!showDefaultPage && loading)) {
     return (
       <div className="flex items-center justify-center h-64">
         <div className="animate-spin rounded-full h-12 w-12 border-b-2 border-blue-600"></div>
@@ -140,7 +100,7 @@ const ResumeAnalysis = () => {
   }
 
   if (showDefaultPage) {
-    return <DefaultAnalysisPage userResumes={userResumes} />;
+    return <DefaultAnalysisPage enabled={signedIn} />;
   }
 
   if (!analysis) {
@@ -355,12 +315,48 @@ const ResumeAnalysis = () => {
   );
 };
 
+// Resume cards are measured after render; this is only the first guess
+const estimateResumeCardHeight = (): number => 212;
+const RESUME_GRID_GAP = 24;
+const resumeGridColumns = columnsForWidth(300, 3, RESUME_GRID_GAP);
+
+const RESUME_SORT_OPTIONS: Array<{ label: string; sort: string; order: SortOrder }> = [
+  { label: "Newest first", sort: "uploaded_at", order: "desc" },
+  { label: "Oldest first", sort: "uploaded_at", order: "asc" },
+  { label: "Highest ATS score", sort: "ats_score", order: "desc" },
+  { label: "Lowest ATS score", sort: "ats_score", order: "asc" },
+  { label: "Name", sort: "filename", order: "asc" },
+];
+
 // Default Analysis Page Component
-const DefaultAnalysisPage = ({
-  userResumes,
-}: {
-  userResumes: ResumeScan[];
-}) => {
+const DefaultAnalysisPage = ({ enabled }: { enabled: boolean }) => {
+  const navigate = useNavigate();
+  const { error } = useNotification();
+  const [search, setSearch] = useState<string>("");
+  const [sortIndex, setSortIndex] = useState<number>(0);
+  const debouncedSearch = useDebouncedValue(search);
+  const { sort, order } = RESUME_SORT_OPTIONS[sortIndex];
+  const {
+    resumes: userResumes,
+    total,
+    error: resumesError,
+    isLoading: resumesLoading,
+    fetchNextPage,
+    isFetchingNextPage,
+  } = useResumeList({ search: debouncedSearch, sort, order }, { enabled });
+  const hasFilters = !!debouncedSearch;
+
+  useEffect(() => {
+    if (!resumesError) return;
+    console.error("Failed to load resumes:", resumesError);
+    if (resumesError.response?.status === 401) {
+      error("Please log in to view your resumes");
+      navigate("/login");
+    } else {
+      error("Failed to load resumes");
+    }
+  }, [resumesError]);
+
   const getScoreColor = (score: number): string => {
     if (score >= 80) return "text-green-600 bg-green-100";
     if (score >= 60) return "text-yellow-600 bg-yellow-100";
@@ -389,7 +385,11 @@ const DefaultAnalysisPage = ({
         </p>
       </div>
 
-      {userResumes.length === 0 ? (
+      {resumesLoading && !hasFilters ? (
+        <div className="flex items-center justify-center h-64">
+          <div className="animate-spin rounded-full h-12 w-12 border-b-2 border-blue-600"></div>
+        </div>
+      ) : userResumes.length === 0 && !hasFilters ? (
         /* No Resumes Uploaded */
         <div className="text-center py-12">
           <div className="mx-auto w-32 h-32 bg-gray-100 rounded-full flex items-center justify-center mb-8">
@@ -424,74 +424,118 @@ const DefaultAnalysisPage = ({
             </p>
           </div>
 
-          <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-6">
-            {userResumes.map((resume) => (
-              <div
-                key={resume.id}
-                className="card hover:shadow-lg transition-shadow duration-200"
+          <div className="flex flex-col sm:flex-row gap-3 sm:items-center sm:justify-between">
+            <input
+              type="search"
+              value={search}
+              onChange={(e) => setSearch(e.target.value)}
+              placeholder="Search resumes..."
+              className="w-full sm:max-w-xs px-3 py-2 border border-gray-300 rounded-lg focus:outline-none focus:ring-2 focus:ring-blue-500 focus:border-transparent"
+            />
+            <div className="flex items-center gap-3">
+              <span className="text-sm text-gray-500">
+                {total} resume{total === 1 ? "" : "s"}
+              </span>
+              <select
+                value={sortIndex}
+                onChange={(e) => setSortIndex(Number(e.target.value))}
+                aria-label="Sort resumes"
+                className="px-3 py-2 border border-gray-300 rounded-lg text-sm focus:outline-none focus:ring-2 focus:ring-blue-500"
               >
-                <div className="flex items-start justify-between mb-4">
-                  <div className="flex items-center">
-                    <DocumentTextIcon className="h-8 w-8 text-blue-600 mr-3" />
-                    <div>
-                      <h3 className="font-medium text-gray-900 truncate">
-                        {resume.original_filename || resume.filename}
-                      </h3>
-                      <p className="text-sm text-gray-500">
-                        {resume.timestamp
-                          ? new Date(resume.timestamp).toLocaleDateString()
-                          : "Recently uploaded"}
-                      </p>
+                {RESUME_SORT_OPTIONS.map((option, index) => (
+                  <option key={option.label} value={index}>
+                    {option.label}
+                  </option>
+                ))}
+              </select>
+            </div>
+          </div>
+
+          {resumesLoading ? (
+            <div className="flex items-center justify-center h-32">
+              <div className="animate-spin rounded-full h-8 w-8 border-b-2 border-blue-600"></div>
+            </div>
+          ) : userResumes.length === 0 ? (
+            <p className="text-center text-gray-500 py-8">
+              No resumes match your search
+            </p>
+          ) : (
+            <VirtualList
+              items={userResumes}
+              itemKey={(resume) => resume.id}
+              itemHeight={estimateResumeCardHeight}
+              height={720}
+              columns={resumeGridColumns}
+              gap={RESUME_GRID_GAP}
+              aria-label="Your resumes"
+              onEndReached={fetchNextPage}
+              loadingMore={isFetchingNextPage}
+              onSelect={(resume) => navigate(`/analysis?resumeId=${resume.id}`)}
+              renderItem={(resume) => (
+                <div className="card h-full hover:shadow-lg transition-shadow duration-200">
+                  <div className="flex items-start justify-between mb-4">
+                    <div className="flex items-center">
+                      <DocumentTextIcon className="h-8 w-8 text-blue-600 mr-3" />
+                      <div>
+                        <h3 className="font-medium text-gray-900 truncate">
+                          {resume.original_filename || resume.filename}
+                        </h3>
+                        <p className="text-sm text-gray-500">
+                          {resume.timestamp
+                            ? new Date(resume.timestamp).toLocaleDateString()
+                            : "Recently uploaded"}
+                        </p>
+                      </div>
+                    </div>
+                    <div
+                      className={`flex items-center px-2 py-1 rounded-full text-xs font-medium ${getScoreColor(
+                        resume.ats_score || 0
+                      )}`}
+                    >
+                      {getScoreIcon(resume.ats_score || 0)}
+                      <span className="ml-1">{resume.ats_score || 0}/100</span>
                     </div>
                   </div>
-                  <div
-                    className={`flex items-center px-2 py-1 rounded-full text-xs font-medium ${getScoreColor(
-                      resume.ats_score || 0
-                    )}`}
-                  >
-                    {getScoreIcon(resume.ats_score || 0)}
-                    <span className="ml-1">{resume.ats_score || 0}/100</span>
-                  </div>
-                </div>
 
-                <div className="mb-4">
-                  <div className="w-full bg-gray-200 rounded-full h-2 mb-2">
-                    <div
-                      className="bg-blue-600 h-2 rounded-full transition-all duration-1000"
-                      style={{ width: `${resume.ats_score || 0}%` }}
-                    ></div>
+                  <div className="mb-4">
+                    <div className="w-full bg-gray-200 rounded-full h-2 mb-2">
+                      <div
+                        className="bg-blue-600 h-2 rounded-full transition-all duration-1000"
+                        style={{ width: `${resume.ats_score || 0}%` }}
+                      ></div>
+                    </div>
+                    <p className="text-xs text-gray-600">
+                      ATS Score:{" "}
+                      {(resume.ats_score || 0) >= 80
+                        ? "Excellent"
+                        : (resume.ats_score || 0) >= 60
+                        ? "Good"
+                        : "Needs Improvement"}
+                    </p>
                   </div>
-                  <p className="text-xs text-gray-600">
-                    ATS Score:{" "}
-                    {(resume.ats_score || 0) >= 80
-                      ? "Excellent"
-                      : (resume.ats_score || 0) >= 60
-                      ? "Good"
-                      : "Needs Improvement"}
-                  </p>
-                </div>
 
-                <div className="flex items-center justify-between">
-                  <span className="text-sm text-gray-500">
-                    {((resume.file_size || 0) / 1024).toFixed(1)} KB
-                  </span>
-                  <Link
-                    to={`/analysis?resumeId=${resume.id}`}
-                    className="btn-primary text-sm px-4 py-2"
-                    onClick={() => {
-                      console.log(
-                        "View Analysis clicked for resume ID:",
-                        resume.id
-                      );
-                    }}
-                  >
-                    View Analysis
-                    <ArrowRightIcon className="h-4 w-4 ml-1" />
-                  </Link>
+                  <div className="flex items-center justify-between">
+                    <span className="text-sm text-gray-500">
+                      {((resume.file_size || 0) / 1024).toFixed(1)} KB
+                    </span>
+                    <Link
+                      to={`/analysis?resumeId=${resume.id}`}
+                      className="btn-primary text-sm px-4 py-2"
+                      onClick={() => {
+                        console.log(
+                          "View Analysis clicked for resume ID:",
+                          resume.id
+                        );
+                      }}
+                    >
+                      View Analysis
+                      <ArrowRightIcon className="h-4 w-4 ml-1" />
+                    </Link>
+                  </div>
                 </div>
-              </div>
-            ))}
-          </div>
+              )}
+            />
+          )}
 
           <div className="text-center pt-6">
             <Link to="/upload" className="btn-secondary">
@@ -1,8 +1,10 @@
 import React, { useState, useEffect } from 'react';
 import { useNotification } from '@contexts/NotificationContext.js';
-import { resumeService } from '@resume/services';
+import { useQuery, useResumeList } from '@hooks';
+import { resumeService, resumeImprovementsQueryKey } from '@resume/services';
 import { formatDate } from '@utils/dateUtils.js';
-import type { ResumeScan, ResumeListResponse, ResumeImprovements } from '@types';
+import VirtualList, { columnsForWidth } from '@components/VirtualList';
+import type { ResumeImprovements } from '@types';
 import {
   CheckCircleIcon,
   ExclamationTriangleIcon,
@@ -11,46 +13,49 @@ import {
   XCircleIcon
 } from '@heroicons/react/24/outline';
 
+const RESUME_CARD_HEIGHT = 80;
+const RESUME_GRID_GAP = 16;
+const resumeGridColumns = columnsForWidth(240, 3, RESUME_GRID_GAP);
+
 const ResumeImprovement = () => {
   const [selectedResume, setSelectedResume] = useState<number | null>(null);
-  const [userResumes, setUserResumes] = useState<ResumeScan[]>([]);
-  const [improvements, setImprovements] = useState<ResumeImprovements | null>(null);
-  const [loading, setLoading] = useState<boolean>(false);
   const { success, error } = useNotification();
+  const {
+    resumes: userResumes,
+    error: loadError,
+    fetchNextPage: loadMoreResumes,
+    isFetchingNextPage: loadingMoreResumes
+  } = useResumeList();
+
+  const {
+    data: improvements,
+    error: improvementsError,
+    isLoading: loading
+  } = useQuery<ResumeImprovements>(
+    selectedResume !== null ? resumeImprovementsQueryKey(selectedResume) : null,
+    (options) => resumeService.getResumeImprovements(selectedResume!, options) as Promise<ResumeImprovements>
+  );
 
   useEffect(() => {
-    loadUserResumes();
-  }, []);
+    if (selectedResume === null && userResumes.length > 0) {
+      handleResumeChange(parseInt(userResumes[0].id));
+    }
+  }, [userResumes, selectedResume]);
 
-  const loadUserResumes = async (): Promise<void> => {
-    try {
-      const response: ResumeListResponse = await resumeService.getUserResumes();
-      const resumes = response.resumes;
-      setUserResumes(resumes);
-      if (resumes.length > 0) {
-        setSelectedResume(parseInt(resumes[0].id));
-        loadImprovements(parseInt(resumes[0].id));
-      }
-    } catch (err: any) {
+  useEffect(() => {
+    if (loadError) {
       error('Failed to load resumes');
     }
-  };
+  }, [loadError]);
 
-  const loadImprovements = async (resumeId: number): Promise<void> => {
-    setLoading(true);
-    try {
-      const data = await resumeService.getResumeImprovements(resumeId);
-      setImprovements(data as ResumeImprovements);
-    } catch (err: any) {
+  useEffect(() => {
+    if (improvementsError) {
       error('Failed to load improvement suggestions');
-    } finally {
-      setLoading(false);
     }
-  };
+  }, [improvementsError]);
 
   const handleResumeChange = (resumeId: number): void => {
     setSelectedResume(resumeId);
-    loadImprovements(resumeId);
   };
 
   const getPriorityColor = (priority: string): string => {
@@ -92,12 +97,23 @@ const ResumeImprovement = () => {
       <div className="card">
         <h3 className="text-lg font-medium text-gray-900 mb-4">Select Resume to Improve</h3>
         {userResumes.length > 0 ? (
-          <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-4">
-            {userResumes.map((resume) => (
+          <VirtualList
+            items={userResumes}
+            itemKey={(resume) => resume.id}
+            itemHeight={RESUME_CARD_HEIGHT}
+            height={RESUME_CARD_HEIGHT * 3 + RESUME_GRID_GAP * 2}
+            columns={resumeGridColumns}
+            gap={RESUME_GRID_GAP}
+            aria-label="Resumes"
+            onEndReached={loadMoreResumes}
+            loadingMore={loadingMoreResumes}
+            isSelected={(resume) => selectedResume === parseInt(resume.id)}
+            onSelect={(resume) => handleResumeChange(parseInt(resume.id))}
+            renderItem={(resume) => (
               <button
-                key={resume.id}
                 onClick={() => handleResumeChange(parseInt(resume.id))}
-                className={`p-4 border rounded-lg text-left transition-colors w-full min-h-[80px] ${
+                tabIndex={-1}
+                className={`p-4 border rounded-lg text-left transition-colors w-full h-full ${
                   selectedResume === parseInt(resume.id)
                     ? 'border-blue-500 bg-blue-50'
                     : 'border-gray-200 hover:border-gray-300 hover:bg-gray-50'
@@ -115,8 +131,8 @@ const ResumeImprovement = () => {
                   </div>
                 </div>
               </button>
-            ))}
-          </div>
+            )}
+          />
         ) : (
           <div className="text-center py-6">
             <DocumentTextIcon className="mx-auto h-12 w-12 text-gray-400" />
@@ -1,7 +1,8 @@
-import React, { useState, useRef } from 'react';
+import React, { useState, useRef, useEffect } from 'react';
 import { useNavigate } from 'react-router-dom';
 import { useNotification } from '@contexts/NotificationContext.js';
 import { resumeService } from '@resume/services';
+import type { UploadProgress } from '@resume/services';
 import type { ResumeAnalysisData } from '@types';
 import {
   CloudArrowUpIcon,
@@ -14,9 +15,16 @@ const ResumeUpload = () => {
   const [uploading, setUploading] = useState<boolean>(false);
   const [uploadedFile, setUploadedFile] = useState<File | null>(null);
   const [analysisResult, setAnalysisResult] = useState<ResumeAnalysisData | null>(null);
+  const [uploadProgress, setUploadProgress] = useState<UploadProgress | null>(null);
   const fileInputRef = useRef<HTMLInputElement>(null);
+  const abortControllerRef = useRef<AbortController | null>(null);
   const navigate = useNavigate();
-  const { success, error } = useNotification();
+  const { success, error, info } = useNotification();
+
+  // Cancel an in-progress upload when leaving the page
+  useEffect(() => {
+    return () => abortControllerRef.current?.abort();
+  }, []);
 
   const handleDrag = (e: React.DragEvent<HTMLDivElement>): void => {
     e.preventDefault();
@@ -62,6 +70,7 @@ const ResumeUpload = () => {
   };
 
   const removeFile = (): void => {
+    abortControllerRef.current?.abort();
     setUploadedFile(null);
     setAnalysisResult(null);
     if (fileInputRef.current) {
@@ -72,13 +81,10 @@ const ResumeUpload = () => {
   const uploadFile = async (): Promise<void> => {
     if (!uploadedFile) return;
 
+    const controller = new AbortController();
+    abortControllerRef.current = controller;
     setUploading(true);
-    
-    // Add timeout to prevent hanging
-    const uploadTimeout = setTimeout(() => {
-      setUploading(false);
-      error('Upload timed out. Please try again.');
-    }, 30000); // 30 second timeout
+    setUploadProgress(null);
 
     try {
       console.log('Starting resume upload...');
@@ -88,16 +94,19 @@ const ResumeUpload = () => {
         type: uploadedFile.type
       });
       
-      const response = await resumeService.uploadResume(uploadedFile);
+      const response = await resumeService.uploadResume(uploadedFile, {
+        onProgress: setUploadProgress,
+        signal: controller.signal
+      });
       console.log('Upload response:', response);
       
-      // Clear timeout since upload succeeded
-      clearTimeout(uploadTimeout);
-      setUploading(false);
-      
       // Check if response has resume_id
       if (response && response.resume_id) {
-        success('Resume uploaded successfully!');
+        if (response.duplicate) {
+          info('This resume was already uploaded - opening the existing analysis');
+        } else {
+          success('Resume uploaded successfully!');
+        }
         
         // Navigate to analysis page after a short delay
         setTimeout(() => {
@@ -110,13 +119,35 @@ const ResumeUpload = () => {
       }
       
     } catch (err: any) {
+      if (controller.signal.aborted) {
+        return;
+      }
       console.error('Upload failed:', err);
-      clearTimeout(uploadTimeout);
-      setUploading(false);
       
       // More detailed error message
       const errorMessage = err.response?.data?.message || err.message || 'Upload failed';
       error(`Upload failed: ${errorMessage}`);
+    } finally {
+      if (abortControllerRef.current === controller) {
+        abortControllerRef.current = null;
+        setUploading(false);
+        setUploadProgress(null);
+      }
+    }
+  };
+
+  const getProgressLabel = (progress: UploadProgress | null): string => {
+    switch (progress?.phase) {
+      case 'hashing':
+        return 'Preparing...';
+      case 'retrying':
+        return 'Connection lost, resuming...';
+      case 'finalizing':
+        return 'Finishing upload...';
+      case 'uploading':
+        return `Uploading ${progress.percent}%`;
+      default:
+        return 'Uploading...';
     }
   };
 
@@ -195,7 +226,7 @@ const ResumeUpload = () => {
               {uploading ? (
                 <div className="flex items-center">
                   <div className="animate-spin rounded-full h-4 w-4 border-b-2 border-white mr-2"></div>
-                  Uploading...
+                  {getProgressLabel(uploadProgress)}
                 </div>
               ) : (
                 'Upload & Analyze Resume'
@@ -203,6 +234,26 @@ const ResumeUpload = () => {
             </button>
           </div>
         )}
+
+        {uploading && uploadProgress && (
+          <div className="mt-4">
+            <div
+              className="w-full bg-gray-200 rounded-full h-2"
+              role="progressbar"
+              aria-valuemin={0}
+              aria-valuemax={100}
+              aria-valuenow={uploadProgress.percent}
+            >
+              <div
+                className="bg-blue-600 h-2 rounded-full transition-all duration-300"
+                style={{ width: `${uploadProgress.percent}%` }}
+              ></div>
+            </div>
+            <p className="mt-1 text-xs text-gray-500 text-center">
+              {(uploadProgress.loaded / 1024 / 1024).toFixed(2)} MB of {(uploadProgress.total / 1024 / 1024).toFixed(2)} MB
+            </p>
+          </div>
+        )}
       </div>
 
       {/* Analysis Preview */}
@@ -0,0 +1,291 @@
+import { API_BASE_URL } from '@utils/httpClient';
+import { queryCache } from '@utils/queryCache';
+import { tokenStore } from '@utils/tokenStore';
+import type {
+  AnalysisStatusUpdate,
+  DashboardSummary,
+  InfiniteData,
+  ResumeListResponse,
+  ResumeScan
+} from '@types';
+import { DASHBOARD_SUMMARY_QUERY_KEY } from '@dashboard/services/dashboardQueryKeys';
+import { resumeService, RESUME_QUERY_PREFIX } from './resumeService';
+
+/**
+ * Analysis Status Tracker
+ * Watches resumes whose analysis is still running and patches the cached
+ * resume lists (full and paginated) and dashboard summary in place when
+ * they finish. Uses a WebSocket push channel
+ * (GET /resume/ws/status) and falls back to exponential-backoff polling of
+ * GET /resume/{resume_id}/status when the socket is unavailable. The
+ * session token is sent as the first socket message, never in the URL,
+ * where proxies and server logs would record it.
+ */
+
+type CompletionListener = (resume: ResumeScan) => void;
+
+const PENDING_STATUSES = ['processing', 'pending', 'queued'];
+const POLL_INITIAL_DELAY = 2000;
+const POLL_MAX_DELAY = 30000;
+// Keep the channel open across route changes, which remount the app shell
+const STOP_GRACE_PERIOD = 5000;
+
+const isPending = (resume: ResumeScan): boolean =>
+  PENDING_STATUSES.includes(resume.analysis_status || '');
+
+type CachedResumes = ResumeListResponse | InfiniteData<ResumeListResponse>;
+
+/**
+ * Every resume in a cached list, single page or accumulated pages
+ */
+const resumesOf = (data: CachedResumes | undefined): ResumeScan[] => {
+  if (!data) return [];
+  if ('pages' in data) return data.pages.flatMap((page) => page.resumes || []);
+  return data.resumes || [];
+};
+
+class AnalysisStatusTracker {
+  private tracked = new Set<string>();
+  private listeners = new Set<CompletionListener>();
+  private socket: WebSocket | null = null;
+  private socketUnavailable = false;
+  private pollTimer: ReturnType<typeof setTimeout> | null = null;
+  private pollDelay = POLL_INITIAL_DELAY;
+  private unsubscribeCache: Array<() => void> = [];
+  private stopTimer: ReturnType<typeof setTimeout> | null = null;
+  private users = 0;
+
+  /**
+   * Start tracking; returns a function that stops it.
+   * Reference counted so several components can share one tracker.
+   */
+  start(): () => void {
+    this.users += 1;
+    if (this.stopTimer) {
+      clearTimeout(this.stopTimer);
+      this.stopTimer = null;
+    }
+    if (this.users === 1 && this.unsubscribeCache.length === 0) {
+      this.unsubscribeCache = [
+        queryCache.subscribePrefix(RESUME_QUERY_PREFIX, () => this.reconcile()),
+        queryCache.subscribe(DASHBOARD_SUMMARY_QUERY_KEY, () => this.reconcile()),
+        tokenStore.subscribe((token) => this.handleToken(token)),
+      ];
+      this.reconcile();
+    }
+    return () => {
+      this.users -= 1;
+      if (this.users === 0) {
+        this.stopTimer = setTimeout(() => this.stop(), STOP_GRACE_PERIOD);
+      }
+    };
+  }
+
+  /**
+   * Listen for analyses that finish while tracked
+   */
+  onComplete(listener: CompletionListener): () => void {
+    this.listeners.add(listener);
+    return () => {
+      this.listeners.delete(listener);
+    };
+  }
+
+  private stop(): void {
+    this.stopTimer = null;
+    this.unsubscribeCache.forEach((unsubscribe) => unsubscribe());
+    this.unsubscribeCache = [];
+    this.tracked.clear();
+    this.disconnect();
+  }
+
+  /**
+   * Sync the tracked set with the pending resumes in the cached queries
+   */
+  private reconcile(): void {
+    const lists = queryCache.keys(RESUME_QUERY_PREFIX)
+      .flatMap((key) => resumesOf(queryCache.getData<CachedResumes>(key)));
+    const summary = queryCache.getData<DashboardSummary>(DASHBOARD_SUMMARY_QUERY_KEY);
+    const pendingIds = [...lists, ...(summary?.recent_resumes || [])]
+      .filter(isPending)
+      .map((resume) => String(resume.id));
+
+    this.tracked = new Set(pendingIds);
+    if (this.tracked.size === 0) {
+      this.disconnect();
+      return;
+    }
+
+    if (!this.socketUnavailable && 'WebSocket' in window) {
+      this.connect();
+    } else if (!this.pollTimer) {
+      this.schedulePoll();
+    }
+  }
+
+  /**
+   * A new login gives the socket another chance; a refreshed token is
+   * passed on to the open socket, a logout closes it
+   */
+  private handleToken(token: string | null): void {
+    if (!token) {
+      this.disconnect();
+      return;
+    }
+    if (this.socket?.readyState === WebSocket.OPEN) {
+      this.authenticate();
+      return;
+    }
+    this.socketUnavailable = false;
+    this.reconcile();
+  }
+
+  private connect(): void {
+    if (this.socket) {
+      this.subscribeIds();
+      return;
+    }
+
+    const base = new URL(API_BASE_URL, window.location.origin);
+    base.protocol = base.protocol === 'https:' ? 'wss:' : 'ws:';
+    base.pathname = `${base.pathname.replace(/\/$/, '')}/resume/ws/status`;
+
+    const socket = new WebSocket(base.toString());
+    this.socket = socket;
+
+    socket.onopen = () => {
+      // Push works (again): stop polling
+      this.socketUnavailable = false;
+      if (this.pollTimer) {
+        clearTimeout(this.pollTimer);
+        this.pollTimer = null;
+      }
+      this.pollDelay = POLL_INITIAL_DELAY;
+      this.authenticate();
+      this.subscribeIds();
+    };
+    socket.onmessage = (event) => {
+      try {
+        this.applyUpdate(JSON.parse(event.data));
+      } catch {
+        // Ignore malformed frames
+      }
+    };
+    socket.onerror = () => {
+      this.socketUnavailable = true;
+    };
+    socket.onclose = () => {
+      if (this.socket !== socket) return;
+      this.socket = null;
+      if (this.tracked.size > 0) {
+        // Socket dropped or never opened: keep going by polling
+        this.socketUnavailable = true;
+        this.schedulePoll();
+      }
+    };
+  }
+
+  private authenticate(): void {
+    const token = tokenStore.get();
+    if (token && this.socket?.readyState === WebSocket.OPEN) {
+      this.socket.send(JSON.stringify({ action: 'auth', token }));
+    }
+  }
+
+  private subscribeIds(): void {
+    if (this.socket?.readyState === WebSocket.OPEN) {
+      this.socket.send(JSON.stringify({ action: 'subscribe', resume_ids: [...this.tracked] }));
+    }
+  }
+
+  private disconnect(): void {
+    const socket = this.socket;
+    this.socket = null;
+    socket?.close();
+    if (this.pollTimer) {
+      clearTimeout(this.pollTimer);
+      this.pollTimer = null;
+    }
+    this.pollDelay = POLL_INITIAL_DELAY;
+  }
+
+  private schedulePoll(): void {
+    if (this.pollTimer) clearTimeout(this.pollTimer);
+    this.pollTimer = setTimeout(() => this.poll(), this.pollDelay);
+  }
+
+  private async poll(): Promise<void> {
+    this.pollTimer = null;
+    if (this.tracked.size === 0) return;
+
+    // Skip work while the tab is hidden; check again later
+    if (document.visibilityState !== 'hidden') {
+      const updates = await Promise.all(
+        [...this.tracked].map((id) => resumeService.getResumeStatus(Number(id)).catch(() => null))
+      );
+      let changed = false;
+      updates.forEach((update) => {
+        if (update && this.applyUpdate(update)) changed = true;
+      });
+      this.pollDelay = changed ? POLL_INITIAL_DELAY : Math.min(this.pollDelay * 2, POLL_MAX_DELAY);
+    }
+
+    // Polling has backed off all the way: try the socket again, in case it
+    // was only down for a while. A failure falls back to polling.
+    if (this.tracked.size > 0 && this.pollDelay === POLL_MAX_DELAY && this.socketUnavailable && !this.socket && 'WebSocket' in window) {
+      this.socketUnavailable = false;
+      this.connect();
+    }
+
+    if (this.tracked.size > 0 && !this.pollTimer) {
+      this.schedulePoll();
+    }
+  }
+
+  /**
+   * Patch the cached queries with a status update; returns true if it changed
+   */
+  private applyUpdate(update: AnalysisStatusUpdate): boolean {
+    const id = String(update.resume_id);
+    if (!this.tracked.has(id) || PENDING_STATUSES.includes(update.analysis_status)) {
+      return false;
+    }
+
+    let finished: ResumeScan | undefined;
+    const patch = (resumes: ResumeScan[] = []) =>
+      resumes.map((resume) => {
+        if (String(resume.id) !== id) return resume;
+        finished = {
+          ...resume,
+          analysis_status: update.analysis_status,
+          ats_score: update.ats_score ?? resume.ats_score,
+        };
+        return finished;
+      });
+
+    queryCache.keys(RESUME_QUERY_PREFIX).forEach((key) => {
+      const data = queryCache.getData<CachedResumes>(key);
+      if (!data || !resumesOf(data).some((resume) => String(resume.id) === id)) return;
+      queryCache.setData<CachedResumes>(key, 'pages' in data
+        ? { ...data, pages: data.pages.map((page) => ({ ...page, resumes: patch(page.resumes) })) }
+        : { ...data, resumes: patch(data.resumes) });
+    });
+    const summary = queryCache.getData<DashboardSummary>(DASHBOARD_SUMMARY_QUERY_KEY);
+    if (summary) {
+      queryCache.setData<DashboardSummary>(DASHBOARD_SUMMARY_QUERY_KEY, {
+        ...summary,
+        recent_resumes: patch(summary.recent_resumes),
+        analyzed_resumes: summary.analyzed_resumes + (update.analysis_status === 'completed' ? 1 : 0),
+      });
+    }
+
+    // setData triggers reconcile(), which drops the finished id
+    if (finished) {
+      this.listeners.forEach((listener) => listener(finished!));
+    }
+    return true;
+  }
+}
+
+// Create and export singleton instance
+export const analysisStatusTracker = new AnalysisStatusTracker();
@@ -0,0 +1,221 @@
+import axios from 'axios';
+import type { AxiosResponse } from 'axios';
+import { apiClient, UPLOAD_REQUEST_TIMEOUT } from '@utils/httpClient';
+
+/**
+ * Chunked, resumable resume upload
+ *
+ * Protocol:
+ *   POST /upload/sessions                       -> { upload_id, received_chunks, resume_id? }
+ *   PUT  /upload/sessions/{upload_id}/chunks/{n} (raw bytes, Content-Range)
+ *   POST /upload/sessions/{upload_id}/complete  -> { resume_id, ... }
+ *
+ * The session is keyed by the file's SHA-256, so an interrupted upload picks
+ * up from the chunks the server already has, and a file the server already
+ * stores is not sent again (the session answers with its resume_id).
+ */
+
+export const UPLOAD_CHUNK_SIZE = 1024 * 1024;
+const MAX_CHUNK_ATTEMPTS = 5;
+const RETRY_BASE_DELAY = 1000;
+const SESSION_STORAGE_PREFIX = 'resume_upload_session:';
+
+export type UploadPhase = 'hashing' | 'uploading' | 'finalizing' | 'retrying';
+
+export interface UploadProgress {
+  phase: UploadPhase;
+  loaded: number;
+  total: number;
+  percent: number;
+}
+
+export interface UploadOptions {
+  onProgress?: (progress: UploadProgress) => void;
+  signal?: AbortSignal;
+}
+
+// Set once the backend answers the session request with 404/405
+let sessionsUnsupported = false;
+
+/**
+ * Whether the resumable protocol can be used: hashing needs Web Crypto,
+ * which browsers only expose on secure origins, and the backend must
+ * support upload sessions
+ */
+export const canUploadInChunks = (): boolean =>
+  !sessionsUnsupported && typeof crypto !== 'undefined' && !!crypto.subtle;
+
+interface UploadSession {
+  upload_id: string;
+  received_chunks?: number[];
+  resume_id?: number | string;
+  duplicate?: boolean;
+}
+
+/**
+ * SHA-256 of the file contents as a hex string
+ */
+export const computeFileHash = async (file: Blob): Promise<string> => {
+  const digest = await crypto.subtle.digest('SHA-256', await file.arrayBuffer());
+  return Array.from(new Uint8Array(digest))
+    .map((byte) => byte.toString(16).padStart(2, '0'))
+    .join('');
+};
+
+const abortError = () => new DOMException('Upload cancelled', 'AbortError');
+
+const wait = (ms: number, signal?: AbortSignal) =>
+  new Promise<void>((resolve, reject) => {
+    const handleAbort = () => {
+      clearTimeout(timer);
+      reject(abortError());
+    };
+    const timer = setTimeout(() => {
+      signal?.removeEventListener('abort', handleAbort);
+      resolve();
+    }, ms);
+    signal?.addEventListener('abort', handleAbort, { once: true });
+  });
+
+/**
+ * Resolve once the browser reports a network connection again
+ */
+const waitForOnline = (signal?: AbortSignal) =>
+  new Promise<void>((resolve, reject) => {
+    if (navigator.onLine) {
+      resolve();
+      return;
+    }
+    const handleOnline = () => {
+      signal?.removeEventListener('abort', handleAbort);
+      resolve();
+    };
+    const handleAbort = () => {
+      window.removeEventListener('online', handleOnline);
+      reject(abortError());
+    };
+    window.addEventListener('online', handleOnline, { once: true });
+    signal?.addEventListener('abort', handleAbort, { once: true });
+  });
+
+const isRetryable = (error: any): boolean => {
+  if (axios.isCancel(error)) return false;
+  const status = error.response?.status;
+  return !status || status === 408 || status === 429 || status >= 500;
+};
+
+/** The server no longer knows the session (expired or cleaned up) */
+const isSessionGone = (error: any): boolean => [404, 410].includes(error.response?.status);
+
+/**
+ * Upload a file through the chunked upload protocol
+ */
+export const uploadInChunks = async (
+  file: File,
+  { onProgress, signal }: UploadOptions = {}
+): Promise<Record<string, any>> => {
+  const total = file.size;
+  const report = (phase: UploadPhase, loaded: number) =>
+    onProgress?.({ phase, loaded, total, percent: total ? Math.round((loaded / total) * 100) : 100 });
+
+  report('hashing', 0);
+  const sha256 = await computeFileHash(file);
+  const storageKey = `${SESSION_STORAGE_PREFIX}${sha256}`;
+  if (signal?.aborted) throw abortError();
+
+  const openSession = async (): Promise<UploadSession> => {
+    const uploadId = localStorage.getItem(storageKey);
+    try {
+      const response: AxiosResponse<UploadSession> = await apiClient.post('/upload/sessions', {
+        filename: file.name,
+        content_type: file.type,
+        size: total,
+        sha256,
+        chunk_size: UPLOAD_CHUNK_SIZE,
+        upload_id: uploadId || undefined,
+      }, { signal });
+      return response.data;
+    } catch (error: any) {
+      // A stored session the server has dropped: forget it and start a new one
+      if (uploadId && isSessionGone(error)) {
+        localStorage.removeItem(storageKey);
+        return openSession();
+      }
+      // No session endpoint: don't ask again for later uploads
+      if ([404, 405].includes(error.response?.status)) sessionsUnsupported = true;
+      throw error;
+    }
+  };
+
+  const sendChunks = async (session: UploadSession): Promise<Record<string, any>> => {
+    const chunkCount = Math.max(1, Math.ceil(total / UPLOAD_CHUNK_SIZE));
+    const received = new Set(session.received_chunks || []);
+    const chunkSize = (index: number) => Math.min(UPLOAD_CHUNK_SIZE, total - index * UPLOAD_CHUNK_SIZE);
+    let confirmedBytes = [...received].reduce((sum, index) => sum + chunkSize(index), 0);
+    report('uploading', confirmedBytes);
+
+    for (let index = 0; index < chunkCount; index++) {
+      if (received.has(index)) continue;
+
+      const start = index * UPLOAD_CHUNK_SIZE;
+      const end = Math.min(start + UPLOAD_CHUNK_SIZE, total);
+      const chunk = file.slice(start, end);
+
+      for (let attempt = 1; ; attempt++) {
+        try {
+          await apiClient.put(`/upload/sessions/${session.upload_id}/chunks/${index}`, chunk, {
+            headers: {
+              'Content-Type': 'application/octet-stream',
+              'Content-Range': `bytes ${start}-${end - 1}/${total}`,
+            },
+            retry: 0, // Retries are handled here, with resume semantics
+            timeout: UPLOAD_REQUEST_TIMEOUT,
+            signal,
+            onUploadProgress: (event) => report('uploading', confirmedBytes + (event.loaded || 0)),
+          });
+          break;
+        } catch (error: any) {
+          if (signal?.aborted) throw abortError();
+          if (attempt >= MAX_CHUNK_ATTEMPTS || !isRetryable(error)) throw error;
+          report('retrying', confirmedBytes);
+          await waitForOnline(signal);
+          await wait(RETRY_BASE_DELAY * 2 ** (attempt - 1), signal);
+        }
+      }
+
+      confirmedBytes += end - start;
+      report('uploading', confirmedBytes);
+    }
+
+    report('finalizing', total);
+    const completeResponse: AxiosResponse<Record<string, any>> = await apiClient.post(
+      `/upload/sessions/${session.upload_id}/complete`,
+      { sha256 },
+      { signal, timeout: UPLOAD_REQUEST_TIMEOUT }
+    );
+    return completeResponse.data;
+  };
+
+  for (let attempt = 1; ; attempt++) {
+    const session = await openSession();
+
+    // Identical file already stored on the server
+    if (session.duplicate && session.resume_id) {
+      localStorage.removeItem(storageKey);
+      report('finalizing', total);
+      return { resume_id: session.resume_id, duplicate: true };
+    }
+
+    localStorage.setItem(storageKey, session.upload_id);
+    try {
+      const result = await sendChunks(session);
+      localStorage.removeItem(storageKey);
+      return result;
+    } catch (error: any) {
+      if (!isSessionGone(error)) throw error;
+      // Session expired mid-upload: never resume it again, and start over once
+      localStorage.removeItem(storageKey);
+      if (attempt >= 2) throw error;
+    }
+  }
+};
@@ -1,2 +1,3 @@
 // Resume services
 export * from './resumeService';
+export * from './analysisStatusTracker';
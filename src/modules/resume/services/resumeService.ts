@@ -1,39 +1,121 @@
-import axios, { AxiosResponse } from "axios";
-import type { CompareRequest, ResumeListResponse } from "@types";
+import type { AxiosResponse } from "axios";
+import {
+  apiClient,
+  streamRequest,
+  LLM_REQUEST_TIMEOUT,
+  UPLOAD_REQUEST_TIMEOUT,
+} from "@utils/httpClient";
+import type { StreamResult } from "@utils/httpClient";
+import { queryCache } from "@utils/queryCache";
+import { hashString, persistentCache } from "@utils/persistentCache";
+import type { QueryFetchOptions } from "@utils/queryCache";
+import { pageKey, pageQueryKey, toPageRequestParams } from "@utils/pagination";
+import type {
+  AnalysisStatusUpdate,
+  CompareRequest,
+  PageParams,
+  PageQuery,
+  ResumeListResponse,
+} from "@types";
+import { DASHBOARD_QUERY_PREFIX } from "@dashboard/services/dashboardQueryKeys";
+import { canUploadInChunks, uploadInChunks } from "./chunkedUpload";
+import type { UploadOptions } from "./chunkedUpload";
 
-const API_BASE_URL = import.meta.env.VITE_API_URL || "/api";
+// Query cache keys for resume data
+export const RESUME_QUERY_PREFIX = "resumes";
+export const RESUME_LIST_QUERY_KEY = `${RESUME_QUERY_PREFIX}:list`;
+const RESUME_PAGES_QUERY_PREFIX = `${RESUME_QUERY_PREFIX}:pages`;
 
-const api = axios.create({
-  baseURL: API_BASE_URL,
-  headers: {
-    "Content-Type": "application/json",
-  },
-});
+/**
+ * Cache key shared by every page of a paginated resume list query
+ */
+export const resumePagesQueryKey = (query: PageQuery = {}): string =>
+  pageQueryKey(RESUME_PAGES_QUERY_PREFIX, query);
 
-// Create a separate axios instance for resume endpoints that don't use /api prefix
-const resumeApi = axios.create({
-  baseURL: "http://localhost:8000", // Direct connection to backend
-  headers: {
-    "Content-Type": "application/json",
-  },
-});
-
-// Add token to requests for both instances
-const addTokenInterceptor = (config: any) => {
-  const token = localStorage.getItem("token");
-  if (token) {
-    config.headers.Authorization = `Bearer ${token}`;
-  }
-  return config;
+// Dashboard counters are derived from resumes and go stale with them
+const invalidateResumeQueries = (): void => {
+  queryCache.invalidate(RESUME_QUERY_PREFIX);
+  queryCache.invalidate(DASHBOARD_QUERY_PREFIX);
+};
+
+export const resumeAnalysisQueryKey = (resumeId: number | string): string =>
+  `${RESUME_QUERY_PREFIX}:analysis:${resumeId}`;
+export const resumeImprovementsQueryKey = (resumeId: number | string): string =>
+  `${RESUME_QUERY_PREFIX}:improvements:${resumeId}`;
+
+// Persistent result cache keys; matches are keyed by the job description's hash
+const analysisResultKey = (resumeId: number | string) => `analysis:${resumeId}`;
+const improvementsResultKey = (resumeId: number | string) => `improvements:${resumeId}`;
+const matchResultPrefix = (resumeId: number | string) => `match:${resumeId}`;
+
+/**
+ * Forget every stored result derived from a resume
+ */
+const forgetResumeResults = (resumeId: number | string): void => {
+  persistentCache.delete(analysisResultKey(resumeId));
+  persistentCache.delete(improvementsResultKey(resumeId));
+  persistentCache.delete(matchResultPrefix(resumeId));
 };
 
-api.interceptors.request.use(addTokenInterceptor);
-resumeApi.interceptors.request.use(addTokenInterceptor);
+/**
+ * GET /resume/{resume_id}, transformed to the frontend analysis format
+ */
+const fetchResumeAnalysis = async (
+  resumeId: number,
+  signal?: AbortSignal
+): Promise<Record<string, any>> => {
+  const response: AxiosResponse<Record<string, any>> = await apiClient.get(
+    `/resume/${resumeId}`,
+    { signal }
+  );
+  const { analysis, analysis_status } = response.data.resume;
+
+  // Transform the backend analysis format to match frontend expectations
+  return {
+    analysis_status: analysis_status || "completed",
+    overall_score: analysis.score || 0,
+    category_scores: [
+      {
+        name: "ATS Compatibility",
+        category: "ats",
+        score: analysis.score || 0,
+        max_score: 100,
+      },
+      {
+        name: "Content Quality",
+        category: "content",
+        score: Math.max(0, (analysis.score || 0) - 10),
+        max_score: 100,
+      },
+      {
+        name: "Keywords",
+        category: "keywords",
+        score: Math.max(0, (analysis.score || 0) - 5),
+        max_score: 100,
+      },
+      {
+        name: "Formatting",
+        category: "formatting",
+        score: Math.max(0, (analysis.score || 0) - 15),
+        max_score: 100,
+      },
+    ],
+    strengths: analysis.strengths || [],
+    weaknesses: analysis.weaknesses || [],
+    found_keywords: [], // Not provided by backend
+    missing_keywords: [], // Not provided by backend
+    recommendations: analysis.suggestions || [],
+  };
+};
 
 // Re-export types for convenience
+export type { UploadOptions, UploadProgress, UploadPhase } from "./chunkedUpload";
 export type {
+  AnalysisStatusUpdate,
   CompareRequest,
   ImproveRequest,
+  PageParams,
+  PageQuery,
   ResumeListResponse,
   ResumeScan,
   UpdateResumeNameRequest,
@@ -42,19 +124,59 @@ export type {
 export const resumeService = {
   /**
    * Upload Resume
+   * POST /upload/sessions (chunked, resumable)
+   * Falls back to a single multipart POST /api/upload when the backend
+   * does not support upload sessions or the page cannot hash the file
+   * (Web Crypto is missing on insecure origins).
+   */
+  async uploadResume(
+    file: File,
+    options: UploadOptions = {}
+  ): Promise<Record<string, any>> {
+    let result: Record<string, any>;
+    if (!canUploadInChunks()) {
+      result = await resumeService.uploadResumeMultipart(file, options);
+    } else {
+      try {
+        result = await uploadInChunks(file, options);
+      } catch (error: any) {
+        if (![404, 405, 410].includes(error.response?.status)) throw error;
+        result = await resumeService.uploadResumeMultipart(file, options);
+      }
+    }
+    invalidateResumeQueries();
+    return result;
+  },
+
+  /**
+   * Upload Resume (single request)
    * POST /api/upload
    */
-  async uploadResume(file: File): Promise<Record<string, any>> {
+  async uploadResumeMultipart(
+    file: File,
+    { onProgress, signal }: UploadOptions = {}
+  ): Promise<Record<string, any>> {
     const formData = new FormData();
     formData.append("file", file);
 
-    const response: AxiosResponse<Record<string, any>> = await resumeApi.post(
+    const response: AxiosResponse<Record<string, any>> = await apiClient.post(
       "/api/upload",
       formData,
       {
         headers: {
           "Content-Type": "multipart/form-data",
         },
+        timeout: UPLOAD_REQUEST_TIMEOUT,
+        signal,
+        onUploadProgress: (event) => {
+          const total = event.total || file.size;
+          onProgress?.({
+            phase: event.loaded >= total ? "finalizing" : "uploading",
+            loaded: event.loaded,
+            total,
+            percent: total ? Math.round((event.loaded / total) * 100) : 100,
+          });
+        },
       }
     );
     return response.data;
@@ -63,23 +185,55 @@ export const resumeService = {
   /**
    * Get User Resumes
    * GET /resume/user-resumes
+   * Served from the shared query cache; concurrent callers share one request.
    */
-  async getUserResumes(): Promise<ResumeListResponse> {
-    const response: AxiosResponse<ResumeListResponse> = await resumeApi.get(
-      "/resume/user-resumes"
+  async getUserResumes(options?: QueryFetchOptions): Promise<ResumeListResponse> {
+    return queryCache.fetch(
+      RESUME_LIST_QUERY_KEY,
+      async (signal) => {
+        const response: AxiosResponse<ResumeListResponse> = await apiClient.get(
+          "/resume/user-resumes",
+          { signal }
+        );
+        return response.data;
+      },
+      options
+    );
+  },
+
+  /**
+   * Get User Resumes (paginated)
+   * GET /resume/user-resumes?cursor=&limit=&search=&sort=&order=
+   * Pass the previous page's `next_cursor` to continue. Backends without
+   * pagination return the full list and no cursor, i.e. a single page.
+   */
+  async getUserResumesPage(
+    params: PageParams = {},
+    options?: QueryFetchOptions
+  ): Promise<ResumeListResponse> {
+    return queryCache.fetch(
+      pageKey(RESUME_PAGES_QUERY_PREFIX, params),
+      async (signal) => {
+        const response: AxiosResponse<ResumeListResponse> = await apiClient.get(
+          "/resume/user-resumes",
+          { params: toPageRequestParams(params), signal }
+        );
+        return response.data;
+      },
+      options
     );
-    return response.data;
   },
 
   /**
    * Download Resume
    * GET /resume/{resume_id}
    */
-  async downloadResume(resumeId: number): Promise<Blob> {
-    const response: AxiosResponse<Blob> = await resumeApi.get(
+  async downloadResume(resumeId: number, signal?: AbortSignal): Promise<Blob> {
+    const response: AxiosResponse<Blob> = await apiClient.get(
       `/resume/${resumeId}`,
       {
         responseType: "blob",
+        signal,
       }
     );
     return response.data;
@@ -89,10 +243,16 @@ export const resumeService = {
    * Delete Resume
    * DELETE /resume/{resume_id}
    */
-  async deleteResume(resumeId: number): Promise<Record<string, any>> {
-    const response: AxiosResponse<Record<string, any>> = await resumeApi.delete(
-      `/resume/${resumeId}`
+  async deleteResume(
+    resumeId: number,
+    signal?: AbortSignal
+  ): Promise<Record<string, any>> {
+    const response: AxiosResponse<Record<string, any>> = await apiClient.delete(
+      `/resume/${resumeId}`,
+      { signal }
     );
+    forgetResumeResults(resumeId);
+    invalidateResumeQueries();
     return response.data;
   },
 
@@ -102,20 +262,23 @@ export const resumeService = {
    */
   async updateResumeName(
     resumeId: number,
-    newName: string
+    newName: string,
+    signal?: AbortSignal
   ): Promise<Record<string, any>> {
     const formData = new FormData();
     formData.append("new_name", newName);
 
-    const response: AxiosResponse<Record<string, any>> = await resumeApi.put(
+    const response: AxiosResponse<Record<string, any>> = await apiClient.put(
       `/resume/${resumeId}/name`,
       formData,
       {
         headers: {
           "Content-Type": "application/x-www-form-urlencoded",
         },
+        signal,
       }
     );
+    invalidateResumeQueries();
     return response.data;
   },
 
@@ -124,7 +287,8 @@ export const resumeService = {
    * POST /compare
    */
   async compareResume(
-    compareData: CompareRequest
+    compareData: CompareRequest,
+    signal?: AbortSignal
   ): Promise<Record<string, any>> {
     const formData = new FormData();
     formData.append("resume_id", compareData.resume_id.toString());
@@ -136,13 +300,15 @@ export const resumeService = {
     if (compareData.jd_content)
       formData.append("jd_content", compareData.jd_content);
 
-    const response: AxiosResponse<Record<string, any>> = await resumeApi.post(
+    const response: AxiosResponse<Record<string, any>> = await apiClient.post(
       "/compare",
       formData,
       {
         headers: {
           "Content-Type": "application/x-www-form-urlencoded",
         },
+        timeout: LLM_REQUEST_TIMEOUT,
+        signal,
       }
     );
     return response.data;
@@ -152,9 +318,10 @@ export const resumeService = {
    * Get Job Description Compare Page
    * GET /jd/{jd_id}/compare
    */
-  async getJdCompare(jdId: number): Promise<string> {
-    const response: AxiosResponse<string> = await resumeApi.get(
-      `/jd/${jdId}/compare`
+  async getJdCompare(jdId: number, signal?: AbortSignal): Promise<string> {
+    const response: AxiosResponse<string> = await apiClient.get(
+      `/jd/${jdId}/compare`,
+      { signal }
     );
     return response.data;
   },
@@ -164,7 +331,8 @@ export const resumeService = {
    * POST /debug/compare
    */
   async debugCompare(
-    compareData: CompareRequest
+    compareData: CompareRequest,
+    signal?: AbortSignal
   ): Promise<Record<string, any>> {
     const formData = new FormData();
     formData.append("resume_id", compareData.resume_id.toString());
@@ -176,13 +344,15 @@ export const resumeService = {
     if (compareData.jd_content)
       formData.append("jd_content", compareData.jd_content);
 
-    const response: AxiosResponse<Record<string, any>> = await resumeApi.post(
+    const response: AxiosResponse<Record<string, any>> = await apiClient.post(
       "/debug/compare",
       formData,
       {
         headers: {
           "Content-Type": "application/x-www-form-urlencoded",
         },
+        timeout: LLM_REQUEST_TIMEOUT,
+        signal,
       }
     );
     return response.data;
@@ -194,21 +364,26 @@ export const resumeService = {
    */
   async improveResume(
     resumeId: number,
-    improvementType: string
+    improvementType: string,
+    signal?: AbortSignal
   ): Promise<Record<string, any>> {
     const formData = new FormData();
     formData.append("resume_id", resumeId.toString());
     formData.append("improvement_type", improvementType);
 
-    const response: AxiosResponse<Record<string, any>> = await resumeApi.post(
+    const response: AxiosResponse<Record<string, any>> = await apiClient.post(
       "/improve",
       formData,
       {
         headers: {
           "Content-Type": "application/x-www-form-urlencoded",
         },
+        timeout: LLM_REQUEST_TIMEOUT,
+        signal,
       }
     );
+    persistentCache.delete(improvementsResultKey(resumeId));
+    queryCache.invalidate(resumeImprovementsQueryKey(resumeId));
     return response.data;
   },
 
@@ -216,78 +391,100 @@ export const resumeService = {
    * Analyze Resume
    * POST /analyze
    */
-  async analyzeResume(resumeId: number): Promise<Record<string, any>> {
+  async analyzeResume(
+    resumeId: number,
+    signal?: AbortSignal
+  ): Promise<Record<string, any>> {
     const formData = new FormData();
     formData.append("resume_id", resumeId.toString());
 
-    const response: AxiosResponse<Record<string, any>> = await resumeApi.post(
+    const response: AxiosResponse<Record<string, any>> = await apiClient.post(
       "/analyze",
       formData,
       {
         headers: {
           "Content-Type": "application/x-www-form-urlencoded",
         },
+        timeout: LLM_REQUEST_TIMEOUT,
+        signal,
       }
     );
+    forgetResumeResults(resumeId);
+    invalidateResumeQueries();
     return response.data;
   },
 
   /**
    * Get Resume Analysis
    * GET /resume/{resume_id}
+   * Completed analyses never change, so they are served from the persistent
+   * result cache without revalidation; others are revalidated in the background.
    */
-  async getResumeAnalysis(resumeId: number): Promise<Record<string, any>> {
-    const response: AxiosResponse<Record<string, any>> = await resumeApi.get(
-      `/resume/${resumeId}`
+  async getResumeAnalysis(
+    resumeId: number,
+    options?: QueryFetchOptions
+  ): Promise<Record<string, any>> {
+    const key = resumeAnalysisQueryKey(resumeId);
+    return queryCache.fetch(
+      key,
+      (signal) =>
+        persistentCache.readThrough(
+          analysisResultKey(resumeId),
+          () => fetchResumeAnalysis(resumeId, signal),
+          {
+            isFinal: (analysis) => analysis.analysis_status === "completed",
+            onRevalidate: (analysis) => queryCache.setData(key, analysis),
+            force: options?.force,
+          }
+        ),
+      options
     );
-    const analysis = response.data.resume.analysis;
-
-    // Transform the backend analysis format to match frontend expectations
-    return {
-      overall_score: analysis.score || 0,
-      category_scores: [
-        {
-          name: "ATS Compatibility",
-          category: "ats",
-          score: analysis.score || 0,
-          max_score: 100,
-        },
-        {
-          name: "Content Quality",
-          category: "content",
-          score: Math.max(0, (analysis.score || 0) - 10),
-          max_score: 100,
-        },
-        {
-          name: "Keywords",
-          category: "keywords",
-          score: Math.max(0, (analysis.score || 0) - 5),
-          max_score: 100,
-        },
-        {
-          name: "Formatting",
-          category: "formatting",
-          score: Math.max(0, (analysis.score || 0) - 15),
-          max_score: 100,
-        },
-      ],
-      strengths: analysis.strengths || [],
-      weaknesses: analysis.weaknesses || [],
-      found_keywords: [], // Not provided by backend
-      missing_keywords: [], // Not provided by backend
-      recommendations: analysis.suggestions || [],
-    };
   },
 
   /**
    * Get Resume Improvements
    * GET /resume/{resume_id}/improvements
+   * Served from the persistent result cache and revalidated in the background.
    */
-  async getResumeImprovements(resumeId: number): Promise<Record<string, any>> {
-    const response: AxiosResponse<Record<string, any>> = await resumeApi.get(
-      `/resume/${resumeId}/improvements`
+  async getResumeImprovements(
+    resumeId: number,
+    options?: QueryFetchOptions
+  ): Promise<Record<string, any>> {
+    const key = resumeImprovementsQueryKey(resumeId);
+    return queryCache.fetch(
+      key,
+      (signal) =>
+        persistentCache.readThrough(
+          improvementsResultKey(resumeId),
+          async () => {
+            const response: AxiosResponse<Record<string, any>> = await apiClient.get(
+              `/resume/${resumeId}/improvements`,
+              { signal }
+            );
+            return response.data;
+          },
+          {
+            onRevalidate: (improvements) => queryCache.setData(key, improvements),
+            force: options?.force,
+          }
+        ),
+      options
     );
-    return response.data;
+  },
+
+  /**
+   * Get Resume Analysis Status
+   * GET /resume/{resume_id}/status
+   */
+  async getResumeStatus(
+    resumeId: number,
+    signal?: AbortSignal
+  ): Promise<AnalysisStatusUpdate> {
+    const response: AxiosResponse<AnalysisStatusUpdate> = await apiClient.get(
+      `/resume/${resumeId}/status`,
+      { retry: 0, signal } // The tracker polls again with its own backoff
+    );
+    return { ...response.data, resume_id: response.data.resume_id ?? resumeId };
   },
 
   /**
@@ -296,45 +493,83 @@ export const resumeService = {
    */
   async generateCoverLetter(
     resumeId: number,
-    jobDescription: string
+    jobDescription: string,
+    signal?: AbortSignal
   ): Promise<Record<string, any>> {
     const formData = new FormData();
     formData.append("resume_id", resumeId.toString());
     formData.append("job_description", jobDescription);
 
-    const response: AxiosResponse<Record<string, any>> = await resumeApi.post(
+    const response: AxiosResponse<Record<string, any>> = await apiClient.post(
       "/cover-letter/generate",
       formData,
       {
         headers: {
           "Content-Type": "application/x-www-form-urlencoded",
         },
+        timeout: LLM_REQUEST_TIMEOUT,
+        signal,
       }
     );
     return response.data;
   },
 
+  /**
+   * Stream Cover Letter Generation
+   * POST /cover-letter/generate (stream=true, text/event-stream)
+   * Calls onToken for every chunk as it is generated and resolves with the
+   * full letter plus the saved record's fields (`id`, `analysis`) sent with
+   * it. Pass an AbortSignal to cancel generation.
+   */
+  async streamCoverLetter(
+    resumeId: number,
+    jobDescription: string,
+    onToken: (token: string) => void,
+    signal?: AbortSignal
+  ): Promise<StreamResult> {
+    const formData = new FormData();
+    formData.append("resume_id", resumeId.toString());
+    formData.append("job_description", jobDescription);
+    formData.append("stream", "true");
+
+    return streamRequest("/cover-letter/generate", formData, {
+      onChunk: onToken,
+      signal,
+    });
+  },
+
   /**
    * Match Resume with Job
    * POST /match
+   * Results are stored per resume and job description text, so matching
+   * the same pair again is instant.
    */
   async matchJob(
     resumeId: number,
-    jobDescription: string
+    jobDescription: string,
+    signal?: AbortSignal
   ): Promise<Record<string, any>> {
-    const formData = new FormData();
-    formData.append("resume_id", resumeId.toString());
-    formData.append("job_description", jobDescription);
+    return persistentCache.readThrough(
+      `${matchResultPrefix(resumeId)}:${hashString(jobDescription.trim())}`,
+      async () => {
+        const formData = new FormData();
+        formData.append("resume_id", resumeId.toString());
+        formData.append("job_description", jobDescription);
 
-    const response: AxiosResponse<Record<string, any>> = await resumeApi.post(
-      "/match",
-      formData,
-      {
-        headers: {
-          "Content-Type": "application/x-www-form-urlencoded",
-        },
-      }
+        const response: AxiosResponse<Record<string, any>> = await apiClient.post(
+          "/match",
+          formData,
+          {
+            headers: {
+              "Content-Type": "application/x-www-form-urlencoded",
+            },
+            timeout: LLM_REQUEST_TIMEOUT,
+            signal,
+          }
+        );
+        return response.data;
+      },
+      { isFinal: () => true }
     );
-    return response.data;
   },
 };
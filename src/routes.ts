@@ -0,0 +1,51 @@
+/**
+ * Route-level code splitting
+ * Every page is loaded on demand; loaders are shared between React.lazy
+ * and sidebar prefetching so a prefetched chunk is reused on navigation.
+ */
+
+import { lazy } from 'react';
+
+const routeLoaders = {
+  '/login': () => import('@auth/pages/Login'),
+  '/register': () => import('@auth/pages/Register'),
+  '/dashboard': () => import('@dashboard/pages/Dashboard'),
+  '/upload': () => import('@resume/pages/ResumeUpload'),
+  '/analysis': () => import('@resume/pages/ResumeAnalysis'),
+  '/improvement': () => import('@resume/pages/ResumeImprovement'),
+  '/matching': () => import('@jobs/pages/JobMatching'),
+  '/cover-letter': () => import('@cover-letter/pages/CoverLetter'),
+  '/profile': () => import('@profile/pages/Profile'),
+};
+
+export type RoutePath = keyof typeof routeLoaders;
+
+export const Login = lazy(routeLoaders['/login']);
+export const Register = lazy(routeLoaders['/register']);
+export const Dashboard = lazy(routeLoaders['/dashboard']);
+export const ResumeUpload = lazy(routeLoaders['/upload']);
+export const ResumeAnalysis = lazy(routeLoaders['/analysis']);
+export const ResumeImprovement = lazy(routeLoaders['/improvement']);
+export const JobMatching = lazy(routeLoaders['/matching']);
+export const CoverLetter = lazy(routeLoaders['/cover-letter']);
+export const Profile = lazy(routeLoaders['/profile']);
+
+const prefetched = new Set<string>();
+
+/**
+ * Start downloading the chunk for a route without rendering it.
+ * Repeated calls are free; failures are ignored and retried on navigation.
+ */
+export const prefetchRoute = (path: string): void => {
+  const pathname = path.split('?')[0];
+  if (prefetched.has(pathname) || !(pathname in routeLoaders)) return;
+
+  // Respect data-saver mode
+  const connection = (navigator as any).connection;
+  if (connection?.saveData) return;
+
+  prefetched.add(pathname);
+  routeLoaders[pathname as RoutePath]().catch(() => {
+    prefetched.delete(pathname);
+  });
+};
@@ -16,9 +16,12 @@ export interface User {
   updated_at?: string | null;
 }
 
-export interface AuthContextType {
+export interface AuthState {
   user: User | null;
   loading: boolean;
+}
+
+export interface AuthActions {
   login: (email: string, password: string) => Promise<{ success: boolean; message?: string; error?: string }>;
   register: (email: string, password: string, firstName?: string, lastName?: string) => Promise<{ success: boolean; message?: string; error?: string }>;
   logout: () => Promise<{ success: boolean; message?: string; error?: string }>;
@@ -27,6 +30,8 @@ export interface AuthContextType {
   linkedinLogin: () => Promise<{ success: boolean; message?: string; error?: string }>;
 }
 
+export type AuthContextType = AuthState & AuthActions;
+
 // Resume types
 export interface ResumeScan {
   id: string;
@@ -74,6 +79,25 @@ export interface ResumeImprovements {
 export interface ResumeListResponse {
   resumes: ResumeScan[];
   total: number;
+  /** Cursor for the next page; absent on the last page or unpaginated responses */
+  next_cursor?: string | null;
+}
+
+export interface AnalysisStatusUpdate {
+  resume_id: number | string;
+  analysis_status: string;
+  ats_score?: number;
+}
+
+// Dashboard types
+export interface DashboardSummary {
+  total_resumes: number;
+  analyzed_resumes: number;
+  job_matches: number;
+  cover_letters: number;
+  monthly_quota: number;
+  used_quota: number;
+  recent_resumes: ResumeScan[];
 }
 
 // Job types
@@ -125,9 +149,11 @@ export interface CoverLetterData {
 }
 
 // Notification types
+export type NotificationType = 'info' | 'success' | 'warning' | 'error';
+
+/** Stable toast actions; the toasts themselves come from useNotifications() */
 export interface NotificationContextType {
-  notifications: Notification[];
-  addNotification: (message: string, type?: 'info' | 'success' | 'warning' | 'error', duration?: number) => number;
+  addNotification: (message: string, type?: NotificationType, duration?: number) => number;
   removeNotification: (id: number) => void;
   success: (message: string, duration?: number) => number;
   error: (message: string, duration?: number) => number;
@@ -149,6 +175,28 @@ export interface AuthResponse {
   error?: string;
   user?: User;
   token?: string;
+  /** Issued when the backend supports silent refresh without a cookie */
+  refresh_token?: string;
+}
+
+// Pagination types
+export type SortOrder = 'asc' | 'desc';
+
+export interface PageQuery {
+  search?: string;
+  sort?: string;
+  order?: SortOrder;
+  limit?: number;
+}
+
+export interface PageParams extends PageQuery {
+  cursor?: string | null;
+}
+
+/** Pages loaded so far for one list query, as kept in the query cache */
+export interface InfiniteData<P> {
+  pages: P[];
+  nextCursor: string | null;
 }
 
 // Profile types
@@ -201,6 +249,7 @@ export interface ResumeImprovementsExtended extends ResumeImprovements {
 export interface JobDescriptionListResponse {
   job_descriptions: JobDescription[];
   total: number;
+  next_cursor?: string | null;
 }
 
 export interface JobDescriptionResponse {
@@ -289,12 +338,7 @@ export interface CoverLetterExtended extends CoverLetterData {
 // Notification types (extended)
 export interface Notification {
   id: number;
-  type: 'success' | 'error' | 'info' | 'warning';
+  type: NotificationType;
   message: string;
   duration?: number;
-}
-
-export interface NotificationContextTypeExtended extends NotificationContextType {
-  notifications: Notification[];
-  removeNotification: (id: number) => void;
 }
\ No newline at end of file
@@ -0,0 +1,57 @@
+/**
+ * Concurrency utilities
+ * Bounded-concurrency task scheduling for batches of API calls
+ */
+
+export interface ConcurrencyOptions {
+  /** Maximum number of tasks running at once */
+  limit: number;
+  /** Stop scheduling new tasks and abort running ones */
+  signal?: AbortSignal;
+}
+
+export type SettledTask<R> =
+  | { status: 'fulfilled'; value: R }
+  | { status: 'rejected'; reason: any };
+
+/**
+ * Run `worker` over every item with at most `limit` tasks in flight.
+ * `onSettled` is called as each task finishes, in completion order, so
+ * callers can render results before the whole batch is done. Resolves with
+ * the settled results in input order; tasks not started before an abort are
+ * reported as rejected with an AbortError.
+ */
+export const runWithConcurrency = async <T, R>(
+  items: T[],
+  worker: (item: T, index: number, signal?: AbortSignal) => Promise<R>,
+  { limit, signal }: ConcurrencyOptions,
+  onSettled?: (result: SettledTask<R>, item: T, index: number) => void
+): Promise<SettledTask<R>[]> => {
+  const results: SettledTask<R>[] = new Array(items.length);
+  let nextIndex = 0;
+
+  const runNext = async (): Promise<void> => {
+    while (nextIndex < items.length) {
+      const index = nextIndex++;
+      const item = items[index];
+
+      let result: SettledTask<R>;
+      if (signal?.aborted) {
+        result = { status: 'rejected', reason: new DOMException('Aborted', 'AbortError') };
+      } else {
+        try {
+          result = { status: 'fulfilled', value: await worker(item, index, signal) };
+        } catch (reason) {
+          result = { status: 'rejected', reason };
+        }
+      }
+
+      results[index] = result;
+      onSettled?.(result, item, index);
+    }
+  };
+
+  const workerCount = Math.max(1, Math.min(limit, items.length));
+  await Promise.all(Array.from({ length: workerCount }, runNext));
+  return results;
+};
@@ -1,8 +1,12 @@
 /**
  * Debug utilities for development
- * These functions are only available in development mode
+ * These functions are only available in development mode; timers and
+ * network timings are also forwarded to production telemetry when the
+ * session is sampled (see telemetry.ts)
  */
 
+import { isTelemetryEnabled, recordApiTiming, recordTiming } from './telemetry';
+
 // Type guard to check if we're in development mode
 const isDev = import.meta.env.DEV;
 
@@ -61,6 +65,10 @@ export const debugTimer = (label: string): (() => void) => {
     console.time(`[DEBUG TIMER] ${label}`);
     return () => console.timeEnd(`[DEBUG TIMER] ${label}`);
   }
+  if (isTelemetryEnabled()) {
+    const start = performance.now();
+    return () => recordTiming(label, performance.now() - start);
+  }
   return () => {}; // No-op in production
 };
 
@@ -179,6 +187,7 @@ export const debugPerformance = (operation: string, duration: number): void => {
   if (isDev) {
     debugLog(`Performance: ${operation} took ${duration}ms`);
   }
+  recordTiming(operation, duration);
 };
 
 /**
@@ -188,6 +197,7 @@ export const debugNetwork = (url: string, method: string, status: number, durati
   if (isDev) {
     debugLog(`Network: ${method} ${url} - ${status} (${duration}ms)`);
   }
+  recordApiTiming(url, method, status, duration);
 };
 
 /**
@@ -0,0 +1,377 @@
+/**
+ * Shared HTTP client
+ * Single axios instance used by every service: one base URL, one
+ * interceptor chain (auth token, timing, retries, session expiry)
+ */
+
+import axios, { AxiosError } from 'axios';
+import type { InternalAxiosRequestConfig } from 'axios';
+import { debugNetwork } from './debug';
+import { tokenStore } from './tokenStore';
+
+/**
+ * All API traffic goes through the `/api/` proxy (nginx in production,
+ * Vite in development) unless VITE_API_URL points elsewhere
+ */
+export const API_BASE_URL = import.meta.env.VITE_API_URL || '/api';
+
+/** Default timeout for regular API calls */
+export const DEFAULT_REQUEST_TIMEOUT = 30 * 1000;
+
+/** Timeout for LLM-backed endpoints (analysis, matching, generation) */
+export const LLM_REQUEST_TIMEOUT = 2 * 60 * 1000;
+
+/** Timeout for file uploads */
+export const UPLOAD_REQUEST_TIMEOUT = 2 * 60 * 1000;
+
+/** Number of automatic retries for idempotent requests */
+export const DEFAULT_RETRY_COUNT = 2;
+
+/**
+ * Whether a request failed because its AbortSignal fired
+ */
+export const isAbortError = (error: any): boolean =>
+  axios.isCancel(error) || error?.name === 'AbortError';
+
+const RETRY_BASE_DELAY = 300;
+const RETRYABLE_METHODS = ['get', 'head', 'options'];
+const RETRYABLE_STATUS_CODES = [502, 503, 504];
+
+/** Requests that must never trigger a token refresh */
+const AUTH_ENDPOINTS = ['/auth/login', '/auth/register', '/auth/refresh'];
+
+/** Message of the error raised for changes attempted while offline */
+export const OFFLINE_ERROR_MESSAGE = 'You are offline. Changes are disabled until the connection is back.';
+
+declare module 'axios' {
+  interface AxiosRequestConfig {
+    /** Retries allowed for this request, defaults to DEFAULT_RETRY_COUNT for idempotent methods */
+    retry?: number;
+    /** Internal: retries already performed */
+    retryAttempt?: number;
+    /** Internal: request start time for latency tracking */
+    startTime?: number;
+    /** Internal: already replayed after a token refresh */
+    authRetried?: boolean;
+  }
+}
+
+export const apiClient = axios.create({
+  baseURL: API_BASE_URL,
+  timeout: DEFAULT_REQUEST_TIMEOUT,
+  headers: {
+    'Content-Type': 'application/json',
+  },
+});
+
+/** Web Lock held while refreshing, so tabs never refresh at the same time */
+const REFRESH_LOCK_NAME = 'resume-scanner-auth-refresh';
+
+let refreshRequest: Promise<string> | null = null;
+
+/**
+ * Exchange the refresh token (body or HttpOnly cookie) for a new access
+ * token. Single flight: concurrent callers share one request, and other
+ * tabs wait for it through a Web Lock where supported.
+ */
+export const refreshAccessToken = (): Promise<string> => {
+  if (refreshRequest) return refreshRequest;
+
+  const staleToken = tokenStore.get();
+  const refresh = async (): Promise<string> => {
+    // Another tab refreshed while this one waited for the lock
+    const current = tokenStore.reload();
+    if (current && current !== staleToken) return current;
+
+    const refreshToken = tokenStore.getRefreshToken();
+    const { data } = await axios.post(`${API_BASE_URL}/auth/refresh`, refreshToken ? { refresh_token: refreshToken } : {}, {
+      timeout: DEFAULT_REQUEST_TIMEOUT,
+      withCredentials: true,
+    });
+    const token: string | undefined = data?.token ?? data?.access_token;
+    if (!token) throw new Error('Refresh response did not include a token');
+    tokenStore.setRefreshToken(data.refresh_token);
+    tokenStore.set(token);
+    return token;
+  };
+
+  const locks = typeof navigator !== 'undefined' ? navigator.locks : undefined;
+  refreshRequest = (locks ? locks.request(REFRESH_LOCK_NAME, refresh) : refresh())
+    .finally(() => {
+      refreshRequest = null;
+    });
+  return refreshRequest;
+};
+
+const isAuthEndpoint = (url: string | undefined): boolean =>
+  AUTH_ENDPOINTS.some((endpoint) => url?.endsWith(endpoint));
+
+/**
+ * Token to replay a request rejected with 401, or null if the session is
+ * over. A token another tab obtained since `sentToken` went out is reused
+ * instead of refreshing again.
+ */
+const renewToken = async (sentToken: string | null): Promise<string | null> => {
+  const current = tokenStore.get();
+  if (current && current !== sentToken) return current;
+
+  try {
+    return await refreshAccessToken();
+  } catch (refreshError: any) {
+    // A refresh that failed on the network keeps the session
+    if (!refreshError?.response) return null;
+
+    // Another tab may have refreshed while this one's refresh was rejected
+    const latest = tokenStore.reload();
+    if (latest && latest !== sentToken) return latest;
+
+    // Refresh rejected: sign out. AuthContext clears the user and
+    // ProtectedRoute navigates to /login without reloading the app.
+    tokenStore.clear();
+    localStorage.removeItem('google_auth_token');
+    localStorage.removeItem('linkedin_auth_token');
+    return null;
+  }
+};
+
+const isOffline = (): boolean => typeof navigator !== 'undefined' && !navigator.onLine;
+
+// Add token to requests
+apiClient.interceptors.request.use(async (config: InternalAxiosRequestConfig) => {
+  // Requests made during a refresh wait for the new token instead of failing with the old one
+  if (refreshRequest && !isAuthEndpoint(config.url)) {
+    await refreshRequest.catch(() => {});
+  }
+  const token = tokenStore.get();
+  if (token) {
+    config.headers.Authorization = `Bearer ${token}`;
+  }
+  // Offline the app is read-only: reads may be served by the service
+  // worker, anything else would only fail after the timeout
+  const method = (config.method || 'get').toLowerCase();
+  if (!RETRYABLE_METHODS.includes(method) && isOffline()) {
+    throw new AxiosError(OFFLINE_ERROR_MESSAGE, AxiosError.ERR_NETWORK, config);
+  }
+  config.startTime = Date.now();
+  return config;
+});
+
+const reportTiming = (config: InternalAxiosRequestConfig | undefined, status: number): void => {
+  if (!config?.startTime) return;
+  debugNetwork(config.url || '', (config.method || 'get').toUpperCase(), status, Date.now() - config.startTime);
+};
+
+const shouldRetry = (error: AxiosError): boolean => {
+  const config = error.config;
+  if (!config || axios.isCancel(error)) return false;
+
+  const method = (config.method || 'get').toLowerCase();
+  const maxRetries = config.retry ?? (RETRYABLE_METHODS.includes(method) ? DEFAULT_RETRY_COUNT : 0);
+  if ((config.retryAttempt || 0) >= maxRetries) return false;
+
+  // Network failures and gateway errors are transient, everything else is final
+  return !error.response || RETRYABLE_STATUS_CODES.includes(error.response.status);
+};
+
+const wait = (ms: number) => new Promise((resolve) => setTimeout(resolve, ms));
+
+// Timing, retries and session expiry handling
+apiClient.interceptors.response.use(
+  (response) => {
+    reportTiming(response.config, response.status);
+    return response;
+  },
+  async (error: AxiosError<any>) => {
+    reportTiming(error.config, error.response?.status || 0);
+
+    if (shouldRetry(error)) {
+      const config = error.config!;
+      config.retryAttempt = (config.retryAttempt || 0) + 1;
+      await wait(RETRY_BASE_DELAY * 2 ** (config.retryAttempt - 1));
+      return apiClient(config);
+    }
+
+    // Expired session: refresh once and replay the request. Concurrent 401s
+    // share the refresh and are replayed in turn.
+    const config = error.config;
+    if (error.response?.status === 401 && config && !config.authRetried && !isAuthEndpoint(config.url) && tokenStore.get()) {
+      config.authRetried = true;
+      const sentToken = String(config.headers.Authorization ?? '').replace(/^Bearer /, '') || null;
+      const token = await renewToken(sentToken);
+      if (token) {
+        config.headers.Authorization = `Bearer ${token}`;
+        return apiClient(config);
+      }
+    }
+
+    // For network errors or backend unavailability, don't clear tokens
+    return Promise.reject(error);
+  }
+);
+
+export interface StreamRequestOptions {
+  /** Called with every text chunk as it arrives */
+  onChunk: (chunk: string) => void;
+  /** Abort the request and stop reading the stream */
+  signal?: AbortSignal;
+}
+
+export interface StreamResult {
+  /** Full concatenated text */
+  text: string;
+  /**
+   * Structured fields sent with the text: the whole body of a non-streaming
+   * JSON response, or the merged non-text fields of JSON events (`id`,
+   * `analysis`, ...), usually carried by the final event
+   */
+  data: Record<string, any> | null;
+}
+
+const TEXT_FIELDS = ['token', 'content', 'text'];
+
+/**
+ * Split one server-sent event payload into its text and any other fields.
+ * Accepts plain text or JSON objects with a `token`, `content` or `text` field.
+ */
+const parseEventData = (data: string): { text: string; fields: Record<string, any> | null } => {
+  let parsed: any;
+  try {
+    parsed = JSON.parse(data);
+  } catch {
+    return { text: data, fields: null };
+  }
+  if (typeof parsed === 'string') return { text: parsed, fields: null };
+  if (!parsed || typeof parsed !== 'object') return { text: '', fields: null };
+
+  const fields = Object.fromEntries(Object.entries(parsed).filter(([key]) => !TEXT_FIELDS.includes(key)));
+  return {
+    text: parsed.token ?? parsed.content ?? parsed.text ?? '',
+    fields: Object.keys(fields).length > 0 ? fields : null,
+  };
+};
+
+/**
+ * POST form data and consume the response incrementally.
+ * Handles `text/event-stream` (SSE framing, `[DONE]` terminator), chunked
+ * plain text, and falls back to a single chunk for non-streaming JSON
+ * responses. axios cannot expose a response stream in the browser, so this
+ * uses fetch with the same base URL and auth header as `apiClient`.
+ * Resolves with the full text and any structured fields sent alongside it.
+ */
+export const streamRequest = async (
+  url: string,
+  body: FormData | URLSearchParams,
+  { onChunk, signal }: StreamRequestOptions
+): Promise<StreamResult> => {
+  // Same rules as the apiClient interceptors: wait for a running refresh,
+  // refuse to start while offline, refresh once on 401
+  if (refreshRequest) {
+    await refreshRequest.catch(() => {});
+  }
+  if (isOffline()) {
+    throw new Error(OFFLINE_ERROR_MESSAGE);
+  }
+
+  const send = async (token: string | null): Promise<Response> => {
+    const headers: Record<string, string> = {
+      Accept: 'text/event-stream, text/plain, application/json',
+    };
+    if (token) {
+      headers.Authorization = `Bearer ${token}`;
+    }
+    const startTime = Date.now();
+    const result = await fetch(`${API_BASE_URL}${url}`, {
+      method: 'POST',
+      headers,
+      body,
+      signal,
+    });
+    debugNetwork(url, 'POST', result.status, Date.now() - startTime);
+    return result;
+  };
+
+  const sentToken = tokenStore.get();
+  let response = await send(sentToken);
+  if (response.status === 401 && sentToken && !isAuthEndpoint(url)) {
+    const token = await renewToken(sentToken);
+    if (token) {
+      response = await send(token);
+    }
+  }
+
+  if (!response.ok) {
+    throw new Error(`Request failed with status code ${response.status}`);
+  }
+
+  const contentType = response.headers.get('content-type') || '';
+  let fullText = '';
+  let metadata: Record<string, any> | null = null;
+  const emit = (chunk: string) => {
+    if (!chunk) return;
+    fullText += chunk;
+    onChunk(chunk);
+  };
+
+  // Server answered without streaming: deliver the whole result at once
+  if (contentType.includes('application/json') || !response.body) {
+    const data = contentType.includes('application/json') ? await response.json() : await response.text();
+    if (typeof data === 'string') {
+      emit(data);
+      return { text: fullText, data: null };
+    }
+    emit(data?.content ?? data?.cover_letter ?? '');
+    return { text: fullText, data: data ?? null };
+  }
+
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  const isEventStream = contentType.includes('text/event-stream');
+  let buffer = '';
+
+  // SSE: payload lines start with "data:"; returns false on the `[DONE]` terminator
+  const handleEvent = (event: string): boolean => {
+    const data = event
+      .split(/\r?\n/)
+      .filter((line) => line.startsWith('data:'))
+      .map((line) => line.slice(5).replace(/^ /, ''))
+      .join('\n');
+    if (data === '[DONE]') return false;
+    const { text, fields } = parseEventData(data);
+    emit(text);
+    if (fields) metadata = { ...metadata, ...fields };
+    return true;
+  };
+
+  while (true) {
+    const { done, value } = await reader.read();
+    if (done) break;
+    const text = decoder.decode(value, { stream: true });
+
+    if (!isEventStream) {
+      emit(text);
+      continue;
+    }
+
+    // Events are separated by a blank line; keep the incomplete tail
+    buffer += text;
+    const events = buffer.split(/\r?\n\r?\n/);
+    buffer = events.pop() || '';
+    for (const event of events) {
+      if (!handleEvent(event)) {
+        await reader.cancel();
+        return { text: fullText, data: metadata };
+      }
+    }
+  }
+
+  // Flush bytes held back by the decoder and a final event sent without
+  // the trailing blank line
+  const rest = decoder.decode();
+  if (!isEventStream) {
+    emit(rest);
+  } else if ((buffer + rest).trim()) {
+    handleEvent(buffer + rest);
+  }
+
+  return { text: fullText, data: metadata };
+};
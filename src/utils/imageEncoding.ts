@@ -0,0 +1,44 @@
+/**
+ * Image encoding helpers
+ * Pure sizing and encoding steps shared by the resize worker and the
+ * main-thread fallback. Kept free of DOM and worker setup so the worker
+ * bundle does not pull in the code that spawns it.
+ */
+
+export interface ImageResizeOptions {
+  /** Largest side of the result in px; smaller images keep their size */
+  maxSize?: number;
+  types?: string[];
+  quality?: number;
+}
+
+export interface ImageResizeRequest extends Required<ImageResizeOptions> {
+  id: number;
+  file: Blob;
+}
+
+/**
+ * Dimensions of an image scaled down to fit `maxSize`, preserving aspect ratio
+ */
+export const scaledSize = (width: number, height: number, maxSize: number): { width: number; height: number } => {
+  const scale = Math.min(1, maxSize / Math.max(width, height));
+  return {
+    width: Math.max(1, Math.round(width * scale)),
+    height: Math.max(1, Math.round(height * scale))
+  };
+};
+
+/**
+ * Encode with the first supported type. Browsers silently fall back to PNG
+ * for types they cannot encode, so the result type is checked.
+ */
+export const encodeCanvas = async (
+  encode: (type: string) => Promise<Blob | null>,
+  types: string[]
+): Promise<Blob> => {
+  for (const type of types) {
+    const blob = await encode(type);
+    if (blob && blob.type === type) return blob;
+  }
+  throw new Error('No supported output format');
+};
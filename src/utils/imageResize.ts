@@ -0,0 +1,129 @@
+/**
+ * Client-side image resizing
+ * Shrinks photos to the size they are displayed at and re-encodes them
+ * (AVIF or WebP where the browser can encode them) before upload. Runs in
+ * a worker with OffscreenCanvas when available, on a regular canvas otherwise.
+ */
+
+import { encodeCanvas, scaledSize } from './imageEncoding';
+import type { ImageResizeOptions, ImageResizeRequest } from './imageEncoding';
+import type { ImageResizeResponse } from '../workers/imageResize.worker';
+
+export { encodeCanvas, scaledSize };
+export type { ImageResizeOptions, ImageResizeRequest };
+
+/**
+ * Largest side (px) of uploaded profile photos: the biggest avatar
+ * (128px on the Profile page) at 2x pixel density
+ */
+export const PROFILE_PHOTO_SIZE = 256;
+
+/** Output formats in order of preference; JPEG is always encodable */
+export const IMAGE_OUTPUT_TYPES = ['image/avif', 'image/webp', 'image/jpeg'];
+
+const DEFAULT_QUALITY = 0.85;
+
+const EXTENSIONS: Record<string, string> = {
+  'image/avif': 'avif',
+  'image/webp': 'webp',
+  'image/jpeg': 'jpg'
+};
+
+let worker: Worker | null = null;
+// Set once the worker failed to load or crashed; later resizes stay on the main thread
+let workerFailed = false;
+let nextRequestId = 0;
+const pending = new Map<number, { resolve: (blob: Blob) => void; reject: (error: Error) => void }>();
+
+/** Error of a resize the worker never finished, worth retrying on the main thread */
+class WorkerUnavailableError extends Error {}
+
+/**
+ * Drop a broken worker and fail whatever it was still working on
+ */
+const discardWorker = (message: string): void => {
+  worker?.terminate();
+  worker = null;
+  workerFailed = true;
+  pending.forEach(({ reject }) => reject(new WorkerUnavailableError(message)));
+  pending.clear();
+};
+
+/**
+ * Shared worker, created on first use; null where OffscreenCanvas is missing
+ * or the worker could not run
+ */
+const getWorker = (): Worker | null => {
+  if (worker || workerFailed || typeof Worker === 'undefined' || typeof OffscreenCanvas === 'undefined') return worker;
+  worker = new Worker(new URL('../workers/imageResize.worker.ts', import.meta.url), {
+    type: 'module'
+  });
+  worker.addEventListener('message', (event: MessageEvent<ImageResizeResponse>) => {
+    const { id, blob, error } = event.data;
+    const request = pending.get(id);
+    pending.delete(id);
+    if (blob) request?.resolve(blob);
+    else request?.reject(new Error(error));
+  });
+  // Script failed to load or threw at top level, or a message could not be deserialized
+  worker.addEventListener('error', (event) => {
+    event.preventDefault();
+    discardWorker(event.message || 'Image worker failed');
+  });
+  worker.addEventListener('messageerror', () => discardWorker('Image worker message could not be read'));
+  return worker;
+};
+
+const resizeInWorker = (resizeWorker: Worker, request: Omit<ImageResizeRequest, 'id'>): Promise<Blob> => {
+  const id = ++nextRequestId;
+  return new Promise((resolve, reject) => {
+    pending.set(id, { resolve, reject });
+    resizeWorker.postMessage({ id, ...request });
+  });
+};
+
+const resizeOnMainThread = async ({ file, maxSize, types, quality }: Omit<ImageResizeRequest, 'id'>): Promise<Blob> => {
+  const bitmap = await createImageBitmap(file, { imageOrientation: 'from-image' });
+  const { width, height } = scaledSize(bitmap.width, bitmap.height, maxSize);
+  const canvas = document.createElement('canvas');
+  canvas.width = width;
+  canvas.height = height;
+  const context = canvas.getContext('2d');
+  if (!context) throw new Error('2D canvas is not available');
+  context.imageSmoothingQuality = 'high';
+  context.drawImage(bitmap, 0, 0, width, height);
+  bitmap.close();
+
+  return encodeCanvas(
+    (type) => new Promise((resolve) => canvas.toBlob(resolve, type, quality)),
+    types
+  );
+};
+
+/**
+ * Downscale and re-encode an image file. Metadata such as EXIF location is
+ * not carried over. Rejects if the browser cannot decode the file.
+ */
+export const resizeImage = async (file: File, options: ImageResizeOptions = {}): Promise<File> => {
+  const request = {
+    file,
+    maxSize: options.maxSize ?? PROFILE_PHOTO_SIZE,
+    types: options.types ?? IMAGE_OUTPUT_TYPES,
+    quality: options.quality ?? DEFAULT_QUALITY
+  };
+
+  const resizeWorker = getWorker();
+  let blob: Blob;
+  try {
+    blob = resizeWorker ? await resizeInWorker(resizeWorker, request) : await resizeOnMainThread(request);
+  } catch (error) {
+    if (!(error instanceof WorkerUnavailableError)) throw error;
+    blob = await resizeOnMainThread(request);
+  }
+
+  const baseName = file.name.replace(/\.[^.]+$/, '') || 'image';
+  return new File([blob], `${baseName}.${EXTENSIONS[blob.type] || 'img'}`, {
+    type: blob.type,
+    lastModified: Date.now()
+  });
+};
@@ -1,3 +1,12 @@
 // Core utilities
 export * from './dateUtils';
 export * from './debug';
+export * from './telemetry';
+export * from './queryCache';
+export * from './httpClient';
+export * from './concurrency';
+export * from './pagination';
+export * from './persistentCache';
+export * from './serviceWorker';
+export * from './imageResize';
+export * from './tokenStore';
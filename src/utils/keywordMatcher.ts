@@ -0,0 +1,131 @@
+/**
+ * Keyword matcher
+ * Aho-Corasick multi-pattern search over a skills dictionary: one pass over
+ * the text finds every known skill, however many patterns there are.
+ */
+
+import { SKILLS_DICTIONARY } from './skillsDictionary';
+import type { SkillEntry } from './skillsDictionary';
+
+export interface PreMatchResult {
+  /** Skills found in the job description, in order of first appearance */
+  keywords: string[];
+  /** Job description skills also present on the resume */
+  matched: string[];
+  /** Job description skills missing from the resume */
+  missing: string[];
+  /** Keyword overlap in percent, null when either side has no keywords */
+  score: number | null;
+}
+
+interface AutomatonNode {
+  next: Map<string, number>;
+  fail: number;
+  /** Patterns ending here: [canonical name, pattern length] */
+  outputs: Array<[string, number]>;
+}
+
+const isWordChar = (char: string | undefined): boolean => !!char && /[a-z0-9]/.test(char);
+
+/**
+ * Aho-Corasick automaton built once per dictionary
+ */
+export class KeywordMatcher {
+  private nodes: AutomatonNode[] = [{ next: new Map(), fail: 0, outputs: [] }];
+
+  constructor(dictionary: SkillEntry[] = SKILLS_DICTIONARY) {
+    dictionary.forEach(({ name, aliases = [] }) => {
+      [name, ...aliases].forEach((pattern) => this.addPattern(pattern.toLowerCase(), name));
+    });
+    this.buildFailureLinks();
+  }
+
+  /**
+   * Canonical skill names found in the text, in order of first appearance
+   */
+  extract(text: string): string[] {
+    const lower = text.toLowerCase();
+    const found = new Set<string>();
+    let state = 0;
+
+    for (let i = 0; i < lower.length; i++) {
+      const char = lower[i];
+      while (state > 0 && !this.nodes[state].next.has(char)) {
+        state = this.nodes[state].fail;
+      }
+      state = this.nodes[state].next.get(char) ?? 0;
+
+      for (const [name, length] of this.nodes[state].outputs) {
+        const start = i - length + 1;
+        // Only whole words: "java" must not match inside "javascript"
+        if (!isWordChar(lower[start - 1]) && !isWordChar(lower[i + 1])) {
+          found.add(name);
+        }
+      }
+    }
+    return [...found];
+  }
+
+  /**
+   * Compare the skills of a job description with the resume's keywords
+   */
+  preMatch(jobDescription: string, resumeKeywords: string[]): PreMatchResult {
+    const keywords = this.extract(jobDescription);
+    // Canonicalize resume keywords through the same dictionary ("JS" -> "JavaScript")
+    const resumeSkills = new Set(
+      resumeKeywords.flatMap((keyword) => {
+        const canonical = this.extract(keyword);
+        return canonical.length > 0 ? canonical : [keyword];
+      }).map((keyword) => keyword.toLowerCase())
+    );
+
+    const matched = keywords.filter((keyword) => resumeSkills.has(keyword.toLowerCase()));
+    const missing = keywords.filter((keyword) => !resumeSkills.has(keyword.toLowerCase()));
+    const score = keywords.length > 0 && resumeSkills.size > 0
+      ? Math.round((matched.length / keywords.length) * 100)
+      : null;
+
+    return { keywords, matched, missing, score };
+  }
+
+  private addPattern(pattern: string, name: string): void {
+    let state = 0;
+    for (const char of pattern) {
+      let next = this.nodes[state].next.get(char);
+      if (next === undefined) {
+        next = this.nodes.length;
+        this.nodes.push({ next: new Map(), fail: 0, outputs: [] });
+        this.nodes[state].next.set(char, next);
+      }
+      state = next;
+    }
+    this.nodes[state].outputs.push([name, pattern.length]);
+  }
+
+  private buildFailureLinks(): void {
+    const queue: number[] = [...this.nodes[0].next.values()];
+    while (queue.length > 0) {
+      const state = queue.shift()!;
+      for (const [char, child] of this.nodes[state].next) {
+        let fail = this.nodes[state].fail;
+        while (fail > 0 && !this.nodes[fail].next.has(char)) {
+          fail = this.nodes[fail].fail;
+        }
+        const target = this.nodes[fail].next.get(char);
+        this.nodes[child].fail = target !== undefined && target !== child ? target : 0;
+        this.nodes[child].outputs.push(...this.nodes[this.nodes[child].fail].outputs);
+        queue.push(child);
+      }
+    }
+  }
+}
+
+/**
+ * Keywords already known for a resume from its cached analysis
+ */
+export const getResumeKeywords = (resume?: {
+  analysis?: { skills?: string[]; found_keywords?: string[] };
+} | null): string[] => [
+  ...(resume?.analysis?.skills || []),
+  ...(resume?.analysis?.found_keywords || []),
+];
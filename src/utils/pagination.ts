@@ -0,0 +1,36 @@
+/**
+ * Cursor pagination helpers
+ * Shared by the paginated list endpoints and their query cache keys
+ */
+
+import type { PageParams, PageQuery } from '@types';
+
+/**
+ * Default number of items per page
+ */
+export const DEFAULT_PAGE_SIZE = Number(import.meta.env.VITE_PAGE_SIZE) || 20;
+
+/**
+ * Stable cache key for a list query. The cursor is not part of the key:
+ * every page of one query shares it as a prefix.
+ */
+export const pageQueryKey = (prefix: string, { search = '', sort = '', order = 'desc', limit = DEFAULT_PAGE_SIZE }: PageQuery = {}): string =>
+  `${prefix}:${[search.trim().toLowerCase(), sort, order, limit].map(encodeURIComponent).join('&')}`;
+
+/**
+ * Cache key of one page of a list query
+ */
+export const pageKey = (prefix: string, params: PageParams = {}): string =>
+  `${pageQueryKey(prefix, params)}:${params.cursor || 'first'}`;
+
+/**
+ * Query string parameters for a paginated request, without empty values
+ */
+export const toPageRequestParams = ({ cursor, limit = DEFAULT_PAGE_SIZE, search, sort, order }: PageParams = {}): Record<string, string | number> => {
+  const params: Record<string, string | number> = { limit };
+  if (cursor) params.cursor = cursor;
+  if (search?.trim()) params.search = search.trim();
+  if (sort) params.sort = sort;
+  if (order) params.order = order;
+  return params;
+};
@@ -0,0 +1,227 @@
+/**
+ * Persistent result cache
+ * IndexedDB-backed store for expensive, rarely changing API results
+ * (resume analyses, improvements, job match results). Survives navigation
+ * and reloads, evicts least recently used entries above a size cap, and
+ * degrades to a no-op where IndexedDB is unavailable (e.g. private mode).
+ */
+
+const DB_NAME = 'resume-scanner-cache';
+const STORE_NAME = 'results';
+// Bump when stored shapes change; older databases are dropped on upgrade
+const DB_VERSION = 1;
+
+/**
+ * Approximate size cap (bytes) for all stored results
+ */
+export const PERSISTENT_CACHE_MAX_BYTES =
+  (Number(import.meta.env.VITE_PERSISTENT_CACHE_MAX_MB) || 10) * 1024 * 1024;
+
+interface StoredEntry<T = any> {
+  key: string;
+  data: T;
+  /** Content hash of the data, used to detect changes on revalidation */
+  hash: string;
+  size: number;
+  storedAt: number;
+  accessedAt: number;
+}
+
+export interface ReadThroughOptions<T> {
+  /** Stored copies for which this returns true never change and are not revalidated */
+  isFinal?: (data: T) => boolean;
+  /** Called when a background revalidation returns different data */
+  onRevalidate?: (data: T) => void;
+  /** Skip the stored copy and wait for the network */
+  force?: boolean;
+}
+
+/**
+ * 53-bit string hash (cyrb53). Not cryptographic; used for cache keys and
+ * change detection only.
+ */
+export const hashString = (value: string, seed = 0): string => {
+  let h1 = 0xdeadbeef ^ seed;
+  let h2 = 0x41c6ce57 ^ seed;
+  for (let i = 0; i < value.length; i++) {
+    const char = value.charCodeAt(i);
+    h1 = Math.imul(h1 ^ char, 2654435761);
+    h2 = Math.imul(h2 ^ char, 1597334677);
+  }
+  h1 = Math.imul(h1 ^ (h1 >>> 16), 2246822507) ^ Math.imul(h2 ^ (h2 >>> 13), 3266489909);
+  h2 = Math.imul(h2 ^ (h2 >>> 16), 2246822507) ^ Math.imul(h1 ^ (h1 >>> 13), 3266489909);
+  return (4294967296 * (2097151 & h2) + (h1 >>> 0)).toString(36);
+};
+
+const promisify = <T>(request: IDBRequest<T>): Promise<T> =>
+  new Promise((resolve, reject) => {
+    request.onsuccess = () => resolve(request.result);
+    request.onerror = () => reject(request.error);
+  });
+
+class PersistentCache {
+  private db: Promise<IDBDatabase | null> | null = null;
+  private maxBytes: number;
+  // Running total of stored sizes; null until the first eviction pass
+  private totalBytes: number | null = null;
+
+  constructor(maxBytes: number = PERSISTENT_CACHE_MAX_BYTES) {
+    this.maxBytes = maxBytes;
+  }
+
+  private open(): Promise<IDBDatabase | null> {
+    if (this.db) return this.db;
+
+    this.db = new Promise<IDBDatabase | null>((resolve) => {
+      if (typeof indexedDB === 'undefined') {
+        resolve(null);
+        return;
+      }
+      const request = indexedDB.open(DB_NAME, DB_VERSION);
+      request.onupgradeneeded = () => {
+        const db = request.result;
+        if (db.objectStoreNames.contains(STORE_NAME)) {
+          db.deleteObjectStore(STORE_NAME);
+        }
+        db.createObjectStore(STORE_NAME, { keyPath: 'key' }).createIndex('accessedAt', 'accessedAt');
+      };
+      request.onsuccess = () => {
+        const db = request.result;
+        // Let a newer tab upgrade the schema
+        db.onversionchange = () => {
+          db.close();
+          this.db = null;
+        };
+        resolve(db);
+      };
+      request.onerror = () => resolve(null);
+      request.onblocked = () => resolve(null);
+    });
+    return this.db;
+  }
+
+  private async store(mode: IDBTransactionMode): Promise<IDBObjectStore | null> {
+    const db = await this.open();
+    return db ? db.transaction(STORE_NAME, mode).objectStore(STORE_NAME) : null;
+  }
+
+  /**
+   * Read a stored result; marks it as recently used
+   */
+  async get<T>(key: string): Promise<T | undefined> {
+    try {
+      const store = await this.store('readwrite');
+      if (!store) return undefined;
+      const entry = await promisify<StoredEntry<T> | undefined>(store.get(key));
+      if (!entry) return undefined;
+      store.put({ ...entry, accessedAt: Date.now() });
+      return entry.data;
+    } catch {
+      return undefined;
+    }
+  }
+
+  /**
+   * Store a result, evicting least recently used entries over the size cap.
+   * Returns false if the data is unchanged.
+   */
+  async set<T>(key: string, data: T): Promise<boolean> {
+    try {
+      const serialized = JSON.stringify(data);
+      const hash = hashString(serialized);
+      const store = await this.store('readwrite');
+      if (!store) return true;
+
+      const previous = await promisify<StoredEntry | undefined>(store.get(key));
+      const now = Date.now();
+      const size = serialized.length * 2;
+      store.put({ key, data, hash, size, storedAt: now, accessedAt: now });
+      if (previous?.hash === hash) return false;
+
+      if (this.totalBytes !== null) {
+        this.totalBytes += size - (previous?.size ?? 0);
+      }
+      if (this.totalBytes === null || this.totalBytes > this.maxBytes) {
+        this.evict().catch(() => {});
+      }
+      return true;
+    } catch {
+      return true;
+    }
+  }
+
+  /**
+   * Remove a key and every key under it (`prefix:*`)
+   */
+  async delete(keyOrPrefix: string): Promise<void> {
+    try {
+      const store = await this.store('readwrite');
+      if (!store) return;
+      store.delete(keyOrPrefix);
+      store.delete(IDBKeyRange.bound(`${keyOrPrefix}:`, `${keyOrPrefix}:\uffff`));
+      this.totalBytes = null;
+    } catch {
+      // Nothing to remove
+    }
+  }
+
+  /**
+   * Drop everything, e.g. on logout
+   */
+  async clear(): Promise<void> {
+    try {
+      const store = await this.store('readwrite');
+      if (store) await promisify(store.clear());
+      this.totalBytes = 0;
+    } catch {
+      // Nothing to clear
+    }
+  }
+
+  /**
+   * Serve a stored copy immediately and refresh it in the background;
+   * without a stored copy, wait for `fetcher` and store its result.
+   */
+  async readThrough<T>(key: string, fetcher: () => Promise<T>, options: ReadThroughOptions<T> = {}): Promise<T> {
+    const { isFinal, onRevalidate, force = false } = options;
+    const stored = force ? undefined : await this.get<T>(key);
+
+    if (stored === undefined) {
+      const data = await fetcher();
+      this.set(key, data);
+      return data;
+    }
+
+    if (!isFinal?.(stored)) {
+      fetcher()
+        .then(async (data) => {
+          if (await this.set(key, data)) onRevalidate?.(data);
+        })
+        .catch(() => {}); // Keep serving the stored copy
+    }
+    return stored;
+  }
+
+  /**
+   * Delete least recently used entries until the store fits the size cap
+   */
+  private async evict(): Promise<void> {
+    const store = await this.store('readwrite');
+    if (!store) return;
+
+    const entries = await promisify<StoredEntry[]>(store.index('accessedAt').getAll());
+    let total = entries.reduce((sum, entry) => sum + entry.size, 0);
+    for (const entry of entries) {
+      if (total <= this.maxBytes) break;
+      store.delete(entry.key);
+      total -= entry.size;
+    }
+    this.totalBytes = total;
+  }
+}
+
+// Create and export singleton instance
+export const persistentCache = new PersistentCache();
+
+// Export the class for testing
+export { PersistentCache };
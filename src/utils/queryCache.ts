@@ -0,0 +1,271 @@
+/**
+ * Client-side query cache
+ * Deduplicates in-flight requests and serves cached data with
+ * stale-while-revalidate semantics. Each request gets an AbortSignal that
+ * fires once no subscriber is left to receive the response.
+ */
+
+/**
+ * Default time (ms) a cached entry is considered fresh
+ */
+export const DEFAULT_QUERY_TTL = Number(import.meta.env.VITE_QUERY_CACHE_TTL) || 30 * 1000;
+
+export interface QueryEntry<T = any> {
+  data?: T;
+  error?: any;
+  updatedAt: number;
+  isFetching: boolean;
+  isInvalidated: boolean;
+  /** Bumped by every invalidate(), so repeated invalidations are observable */
+  invalidations: number;
+}
+
+export interface QueryFetchOptions {
+  /** Freshness window for this call, overrides the cache default */
+  ttl?: number;
+  /** Skip the cache and wait for a fresh response */
+  force?: boolean;
+}
+
+type QueryListener = () => void;
+
+export type QueryFetcher<T> = (signal: AbortSignal) => Promise<T>;
+
+const matchesPrefix = (key: string, prefix: string): boolean =>
+  key === prefix || key.startsWith(`${prefix}:`);
+
+const EMPTY_ENTRY: QueryEntry = {
+  updatedAt: 0,
+  isFetching: false,
+  isInvalidated: false,
+  invalidations: 0
+};
+
+class QueryCache {
+  private entries = new Map<string, QueryEntry>();
+  private inflight = new Map<string, Promise<any>>();
+  private controllers = new Map<string, AbortController>();
+  private listeners = new Map<string, Set<QueryListener>>();
+  private prefixListeners = new Map<string, Set<QueryListener>>();
+  private defaultTtl: number = DEFAULT_QUERY_TTL;
+
+  /**
+   * Configure cache-wide defaults
+   */
+  configure({ ttl }: { ttl?: number }): void {
+    if (ttl !== undefined) {
+      this.defaultTtl = ttl;
+    }
+  }
+
+  /**
+   * Get the current entry for a key
+   */
+  getEntry<T>(key: string): QueryEntry<T> | undefined {
+    return this.entries.get(key);
+  }
+
+  /**
+   * Get cached data for a key, if any
+   */
+  getData<T>(key: string): T | undefined {
+    return this.entries.get(key)?.data;
+  }
+
+  /**
+   * List cached keys, optionally only those under a prefix (`prefix:*`)
+   */
+  keys(prefix?: string): string[] {
+    const keys = [...this.entries.keys()];
+    return prefix ? keys.filter((key) => matchesPrefix(key, prefix)) : keys;
+  }
+
+  /**
+   * Check whether a key needs to be refetched
+   */
+  isStale(key: string, ttl: number = this.defaultTtl): boolean {
+    const entry = this.entries.get(key);
+    if (!entry || entry.updatedAt === 0) return true;
+    return entry.isInvalidated || Date.now() - entry.updatedAt > ttl;
+  }
+
+  /**
+   * Fetch through the cache.
+   * Fresh data resolves immediately, stale data resolves immediately and is
+   * revalidated in the background, missing data waits for the network.
+   */
+  async fetch<T>(key: string, fetcher: QueryFetcher<T>, options: QueryFetchOptions = {}): Promise<T> {
+    const { ttl = this.defaultTtl, force = false } = options;
+    const entry = this.entries.get(key) as QueryEntry<T> | undefined;
+    const hasData = !!entry && entry.updatedAt > 0;
+
+    if (hasData && !force && !this.isStale(key, ttl)) {
+      return entry!.data as T;
+    }
+
+    const request = this.revalidate(key, fetcher);
+    if (hasData && !force) {
+      request.catch(() => {}); // Background failures are kept on the entry
+      return entry!.data as T;
+    }
+    return request;
+  }
+
+  /**
+   * Start (or join) a network request for a key
+   */
+  revalidate<T>(key: string, fetcher: QueryFetcher<T>): Promise<T> {
+    const existing = this.inflight.get(key);
+    if (existing) return existing;
+
+    this.update(key, { isFetching: true });
+
+    const controller = new AbortController();
+    const request: Promise<T> = fetcher(controller.signal).then(
+      (data) => {
+        // Ignore responses superseded by an invalidation
+        if (this.inflight.get(key) === request) {
+          this.settle(key);
+          this.update(key, {
+            data,
+            error: undefined,
+            updatedAt: Date.now(),
+            isFetching: false,
+            isInvalidated: false
+          });
+        }
+        return data;
+      },
+      (error) => {
+        if (this.inflight.get(key) === request) {
+          this.settle(key);
+          // A cancelled request is not a failure of the query
+          this.update(key, controller.signal.aborted ? { isFetching: false } : { error, isFetching: false });
+        }
+        throw error;
+      }
+    );
+
+    this.inflight.set(key, request);
+    this.controllers.set(key, controller);
+    return request;
+  }
+
+  /**
+   * Called when a subscriber stops needing a key (unmount, key change).
+   * Aborts in-flight requests for the key and keys under it once nothing
+   * subscribes to them; checked after the current task so a remount under
+   * the same key keeps the request.
+   */
+  release(key: string): void {
+    setTimeout(() => {
+      // Still needed by another component
+      if (this.listeners.has(key)) return;
+      this.controllers.forEach((controller, inflightKey) => {
+        if (matchesPrefix(inflightKey, key) && !this.listeners.has(inflightKey)) {
+          controller.abort();
+        }
+      });
+    }, 0);
+  }
+
+  /**
+   * Write data for a key directly, e.g. after a mutation
+   */
+  setData<T>(key: string, updater: T | ((previous: T | undefined) => T)): void {
+    const previous = this.entries.get(key)?.data as T | undefined;
+    const data = typeof updater === 'function'
+      ? (updater as (previous: T | undefined) => T)(previous)
+      : updater;
+    this.update(key, { data, error: undefined, updatedAt: Date.now() });
+  }
+
+  /**
+   * Mark a key, or every key under a prefix (`prefix:*`), as stale.
+   * Subscribers are notified so mounted views can refetch.
+   */
+  invalidate(keyOrPrefix: string): void {
+    for (const key of this.entries.keys()) {
+      if (matchesPrefix(key, keyOrPrefix)) {
+        this.settle(key);
+        const invalidations = (this.entries.get(key)?.invalidations ?? 0) + 1;
+        this.update(key, { isInvalidated: true, isFetching: false, invalidations });
+      }
+    }
+  }
+
+  /**
+   * Drop every entry, e.g. when the signed-in user changes
+   */
+  clear(): void {
+    const keys = [...this.entries.keys()];
+    this.controllers.forEach((controller) => controller.abort());
+    this.controllers.clear();
+    this.entries.clear();
+    this.inflight.clear();
+    keys.forEach((key) => this.notify(key));
+  }
+
+  /**
+   * Subscribe to changes of a single key
+   */
+  subscribe(key: string, listener: QueryListener): () => void {
+    let keyListeners = this.listeners.get(key);
+    if (!keyListeners) {
+      keyListeners = new Set();
+      this.listeners.set(key, keyListeners);
+    }
+    keyListeners.add(listener);
+
+    return () => {
+      keyListeners!.delete(listener);
+      if (keyListeners!.size === 0) {
+        this.listeners.delete(key);
+      }
+    };
+  }
+
+  /**
+   * Subscribe to changes of a key and every key under it (`prefix:*`),
+   * e.g. all pages of a paginated list
+   */
+  subscribePrefix(prefix: string, listener: QueryListener): () => void {
+    let prefixListeners = this.prefixListeners.get(prefix);
+    if (!prefixListeners) {
+      prefixListeners = new Set();
+      this.prefixListeners.set(prefix, prefixListeners);
+    }
+    prefixListeners.add(listener);
+
+    return () => {
+      prefixListeners!.delete(listener);
+      if (prefixListeners!.size === 0) {
+        this.prefixListeners.delete(prefix);
+      }
+    };
+  }
+
+  private settle(key: string): void {
+    this.inflight.delete(key);
+    this.controllers.delete(key);
+  }
+
+  private update(key: string, patch: Partial<QueryEntry>): void {
+    const previous = this.entries.get(key) || EMPTY_ENTRY;
+    this.entries.set(key, { ...previous, ...patch });
+    this.notify(key);
+  }
+
+  private notify(key: string): void {
+    this.listeners.get(key)?.forEach((listener) => listener());
+    this.prefixListeners.forEach((listeners, prefix) => {
+      if (matchesPrefix(key, prefix)) listeners.forEach((listener) => listener());
+    });
+  }
+}
+
+// Create and export singleton instance
+export const queryCache = new QueryCache();
+
+// Export the class for testing
+export { QueryCache };
@@ -0,0 +1,40 @@
+/**
+ * Service worker registration
+ * The worker itself (dist/sw.js) is generated by scripts/build.js from
+ * scripts/sw-template.js; it is only present in production builds.
+ */
+
+/** Cache holding API responses for offline reads; must match sw-template.js */
+const API_CACHE = 'api-v1';
+
+/**
+ * Register the app shell service worker once the page has loaded,
+ * so installing it never competes with the first render
+ */
+export const registerServiceWorker = (): void => {
+  if (!import.meta.env.PROD || !('serviceWorker' in navigator)) return;
+
+  const register = () => {
+    navigator.serviceWorker.register('/sw.js').catch(() => {
+      // Offline support is optional; e.g. debug builds have no sw.js
+    });
+  };
+
+  if (document.readyState === 'complete') {
+    register();
+  } else {
+    addEventListener('load', register, { once: true });
+  }
+};
+
+/**
+ * Drop API responses stored for offline use, e.g. on logout
+ */
+export const clearOfflineData = async (): Promise<void> => {
+  if (typeof caches === 'undefined') return;
+  try {
+    await caches.delete(API_CACHE);
+  } catch {
+    // Nothing stored
+  }
+};
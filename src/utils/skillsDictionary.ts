@@ -0,0 +1,134 @@
+/**
+ * Skills dictionary
+ * Canonical skill names with the spellings that map to them, used for
+ * client-side keyword extraction. Entries are matched case-insensitively on
+ * word boundaries; ambiguous short words (e.g. "go", "r") are left out.
+ */
+
+export interface SkillEntry {
+  /** Name shown to the user and used for comparisons */
+  name: string;
+  /** Alternative spellings found in job descriptions and resumes */
+  aliases?: string[];
+}
+
+export const SKILLS_DICTIONARY: SkillEntry[] = [
+  // Languages
+  { name: 'JavaScript', aliases: ['js', 'ecmascript', 'es6'] },
+  { name: 'TypeScript', aliases: ['ts'] },
+  { name: 'Python' },
+  { name: 'Java' },
+  { name: 'Kotlin' },
+  { name: 'Scala' },
+  { name: 'Golang', aliases: ['go lang'] },
+  { name: 'Rust' },
+  { name: 'C++', aliases: ['cpp'] },
+  { name: 'C#', aliases: ['csharp', 'c sharp'] },
+  { name: 'Ruby' },
+  { name: 'PHP' },
+  { name: 'Swift' },
+  { name: 'Objective-C' },
+  { name: 'SQL' },
+  { name: 'Bash', aliases: ['shell scripting'] },
+  { name: 'HTML', aliases: ['html5'] },
+  { name: 'CSS', aliases: ['css3'] },
+  { name: 'Sass', aliases: ['scss'] },
+
+  // Frontend
+  { name: 'React', aliases: ['react.js', 'reactjs'] },
+  { name: 'React Native' },
+  { name: 'Redux' },
+  { name: 'Next.js', aliases: ['nextjs'] },
+  { name: 'Vue', aliases: ['vue.js', 'vuejs'] },
+  { name: 'Angular', aliases: ['angularjs'] },
+  { name: 'Svelte' },
+  { name: 'Tailwind CSS', aliases: ['tailwind'] },
+  { name: 'Webpack' },
+  { name: 'Vite' },
+  { name: 'GraphQL' },
+  { name: 'Accessibility', aliases: ['a11y', 'wcag'] },
+
+  // Backend
+  { name: 'Node.js', aliases: ['nodejs', 'node'] },
+  { name: 'Express', aliases: ['express.js', 'expressjs'] },
+  { name: 'Django' },
+  { name: 'Flask' },
+  { name: 'FastAPI' },
+  { name: 'Spring', aliases: ['spring boot', 'springboot'] },
+  { name: '.NET', aliases: ['dotnet', 'asp.net'] },
+  { name: 'Ruby on Rails', aliases: ['rails'] },
+  { name: 'REST', aliases: ['rest api', 'restful', 'rest apis'] },
+  { name: 'gRPC' },
+  { name: 'Microservices', aliases: ['microservice'] },
+
+  // Data
+  { name: 'PostgreSQL', aliases: ['postgres'] },
+  { name: 'MySQL' },
+  { name: 'MongoDB', aliases: ['mongo'] },
+  { name: 'Redis' },
+  { name: 'Elasticsearch' },
+  { name: 'Kafka', aliases: ['apache kafka'] },
+  { name: 'RabbitMQ' },
+  { name: 'Spark', aliases: ['apache spark', 'pyspark'] },
+  { name: 'Hadoop' },
+  { name: 'Airflow' },
+  { name: 'Snowflake' },
+  { name: 'dbt' },
+  { name: 'Pandas' },
+  { name: 'NumPy' },
+  { name: 'Tableau' },
+  { name: 'Power BI', aliases: ['powerbi'] },
+  { name: 'Excel' },
+  { name: 'ETL' },
+  { name: 'Data Analysis', aliases: ['data analytics'] },
+
+  // Machine learning
+  { name: 'Machine Learning', aliases: ['ml'] },
+  { name: 'Deep Learning' },
+  { name: 'NLP', aliases: ['natural language processing'] },
+  { name: 'Computer Vision' },
+  { name: 'TensorFlow' },
+  { name: 'PyTorch' },
+  { name: 'scikit-learn', aliases: ['sklearn'] },
+  { name: 'LLM', aliases: ['llms', 'large language models'] },
+
+  // Cloud and infrastructure
+  { name: 'AWS', aliases: ['amazon web services'] },
+  { name: 'Azure', aliases: ['microsoft azure'] },
+  { name: 'GCP', aliases: ['google cloud', 'google cloud platform'] },
+  { name: 'Docker' },
+  { name: 'Kubernetes', aliases: ['k8s'] },
+  { name: 'Terraform' },
+  { name: 'Ansible' },
+  { name: 'Linux' },
+  { name: 'CI/CD', aliases: ['continuous integration', 'continuous delivery'] },
+  { name: 'Jenkins' },
+  { name: 'GitHub Actions' },
+  { name: 'Git' },
+  { name: 'Nginx' },
+  { name: 'Serverless', aliases: ['aws lambda', 'lambda'] },
+  { name: 'Observability', aliases: ['monitoring', 'prometheus', 'grafana'] },
+
+  // Practices
+  { name: 'Unit Testing', aliases: ['unit tests', 'tdd', 'test-driven development'] },
+  { name: 'Jest' },
+  { name: 'Cypress' },
+  { name: 'Playwright' },
+  { name: 'Selenium' },
+  { name: 'Agile', aliases: ['scrum', 'kanban'] },
+  { name: 'System Design', aliases: ['distributed systems'] },
+  { name: 'Security', aliases: ['application security', 'owasp'] },
+  { name: 'OAuth', aliases: ['oauth2', 'openid connect', 'sso'] },
+
+  // Product and soft skills
+  { name: 'Project Management' },
+  { name: 'Product Management' },
+  { name: 'Stakeholder Management' },
+  { name: 'Leadership', aliases: ['team lead', 'people management'] },
+  { name: 'Mentoring', aliases: ['mentorship'] },
+  { name: 'Communication', aliases: ['communication skills'] },
+  { name: 'Problem Solving', aliases: ['problem-solving'] },
+  { name: 'Figma' },
+  { name: 'UX', aliases: ['user experience', 'ux design'] },
+  { name: 'Jira' },
+];
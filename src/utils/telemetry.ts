@@ -0,0 +1,250 @@
+/**
+ * Real-user performance telemetry
+ * Production counterpart of the debug timers: Core Web Vitals, route render
+ * timings and per-endpoint API latency histograms, batched in memory and
+ * flushed with navigator.sendBeacon.
+ *
+ * Configured with VITE_TELEMETRY_ENDPOINT and VITE_TELEMETRY_SAMPLE_RATE
+ * (0-1). Sessions outside the sample never register observers or timers;
+ * every recorder returns after a single boolean check.
+ */
+
+const TELEMETRY_ENDPOINT = import.meta.env.VITE_TELEMETRY_ENDPOINT || '';
+const TELEMETRY_SAMPLE_RATE = Number(import.meta.env.VITE_TELEMETRY_SAMPLE_RATE) || 0;
+
+/** Upper bounds (ms) of the API latency histogram buckets; the last bucket is open-ended */
+export const LATENCY_BUCKETS = [50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000];
+
+const MAX_BUFFERED_EVENTS = 50;
+const FLUSH_INTERVAL = 60 * 1000;
+
+// Decided once per page load
+const enabled = !!TELEMETRY_ENDPOINT
+  && TELEMETRY_SAMPLE_RATE > 0
+  && typeof window !== 'undefined'
+  && Math.random() < TELEMETRY_SAMPLE_RATE;
+
+export type WebVitalName = 'LCP' | 'INP' | 'CLS';
+
+interface TimingEvent {
+  type: 'route' | 'timing';
+  name: string;
+  duration: number;
+}
+
+interface LatencyHistogram {
+  count: number;
+  errors: number;
+  sum: number;
+  max: number;
+  buckets: number[];
+}
+
+const sessionId = enabled ? Math.random().toString(36).slice(2) + Date.now().toString(36) : '';
+let events: TimingEvent[] = [];
+let histograms: Record<string, LatencyHistogram> = {};
+const vitals: Partial<Record<WebVitalName, number>> = {};
+let vitalsChanged = false;
+let flushTimer: ReturnType<typeof setTimeout> | null = null;
+let initialized = false;
+
+/**
+ * Whether this session is sampled for telemetry
+ */
+export const isTelemetryEnabled = (): boolean => enabled;
+
+/**
+ * Collapse ids in an API path so one endpoint maps to one histogram
+ * (`/resume/42/status` -> `/resume/:id/status`)
+ */
+export const normalizeEndpoint = (url: string): string =>
+  url
+    .split('?')[0]
+    .replace(/^https?:\/\/[^/]+/, '')
+    .replace(/\/[0-9a-f]{8}-[0-9a-f-]{27,}(?=\/|$)/gi, '/:id')
+    .replace(/\/\d+(?=\/|$)/g, '/:id');
+
+const scheduleFlush = (): void => {
+  if (events.length >= MAX_BUFFERED_EVENTS) {
+    flushTelemetry();
+  } else if (!flushTimer) {
+    flushTimer = setTimeout(flushTelemetry, FLUSH_INTERVAL);
+  }
+};
+
+/**
+ * Record the latency of one API call
+ */
+export const recordApiTiming = (url: string, method: string, status: number, duration: number): void => {
+  if (!enabled) return;
+
+  const key = `${method.toUpperCase()} ${normalizeEndpoint(url)}`;
+  const histogram = histograms[key] || (histograms[key] = {
+    count: 0,
+    errors: 0,
+    sum: 0,
+    max: 0,
+    buckets: new Array(LATENCY_BUCKETS.length + 1).fill(0)
+  });
+
+  const bucket = LATENCY_BUCKETS.findIndex((bound) => duration <= bound);
+  histogram.buckets[bucket === -1 ? LATENCY_BUCKETS.length : bucket] += 1;
+  histogram.count += 1;
+  histogram.sum += duration;
+  histogram.max = Math.max(histogram.max, duration);
+  if (status === 0 || status >= 500) histogram.errors += 1;
+  scheduleFlush();
+};
+
+/**
+ * Record how long a route took to render
+ */
+export const recordRouteTiming = (route: string, duration: number): void => {
+  if (!enabled) return;
+  events.push({ type: 'route', name: route, duration: Math.round(duration) });
+  scheduleFlush();
+};
+
+/**
+ * Record a named duration, e.g. from debugTimer
+ */
+export const recordTiming = (name: string, duration: number): void => {
+  if (!enabled) return;
+  events.push({ type: 'timing', name, duration: Math.round(duration) });
+  scheduleFlush();
+};
+
+/**
+ * Send everything buffered so far. Uses sendBeacon so it survives page unload.
+ */
+export const flushTelemetry = (): void => {
+  if (!enabled) return;
+  if (flushTimer) {
+    clearTimeout(flushTimer);
+    flushTimer = null;
+  }
+  if (events.length === 0 && Object.keys(histograms).length === 0 && !vitalsChanged) return;
+
+  const payload = JSON.stringify({
+    session: sessionId,
+    version: import.meta.env.VITE_APP_VERSION,
+    page: window.location.pathname,
+    sent_at: Date.now(),
+    connection: (navigator as any).connection?.effectiveType,
+    vitals,
+    events,
+    api: histograms
+  });
+  events = [];
+  histograms = {};
+  vitalsChanged = false;
+
+  const body = new Blob([payload], { type: 'application/json' });
+  if (!navigator.sendBeacon?.(TELEMETRY_ENDPOINT, body)) {
+    fetch(TELEMETRY_ENDPOINT, { method: 'POST', body, keepalive: true }).catch(() => {});
+  }
+};
+
+const setVital = (name: WebVitalName, value: number): void => {
+  vitals[name] = name === 'CLS' ? Math.round(value * 1000) / 1000 : Math.round(value);
+  vitalsChanged = true;
+};
+
+const observe = (type: string, callback: (entries: any[]) => void, options: Record<string, any> = {}): void => {
+  try {
+    new PerformanceObserver((list) => callback(list.getEntries())).observe({ type, buffered: true, ...options });
+  } catch {
+    // Entry type not supported by this browser
+  }
+};
+
+/**
+ * Largest Contentful Paint: the last candidate before the first user input
+ */
+const observeLcp = (): void => {
+  let finalized = false;
+  observe('largest-contentful-paint', (entries) => {
+    if (finalized) return;
+    const last = entries[entries.length - 1];
+    if (last) setVital('LCP', last.startTime);
+  });
+  const finalize = () => {
+    finalized = true;
+  };
+  ['keydown', 'pointerdown'].forEach((type) => addEventListener(type, finalize, { once: true, capture: true }));
+};
+
+/**
+ * Cumulative Layout Shift: largest session window of unexpected shifts
+ */
+const observeCls = (): void => {
+  let windowValue = 0;
+  let windowStart = 0;
+  let lastShift = 0;
+  let maxValue = 0;
+
+  observe('layout-shift', (entries) => {
+    entries.forEach((entry) => {
+      if (entry.hadRecentInput) return;
+      // A window ends after a 1s gap or 5s total
+      if (entry.startTime - lastShift > 1000 || entry.startTime - windowStart > 5000) {
+        windowValue = 0;
+        windowStart = entry.startTime;
+      }
+      windowValue += entry.value;
+      lastShift = entry.startTime;
+      if (windowValue > maxValue) {
+        maxValue = windowValue;
+        setVital('CLS', maxValue);
+      }
+    });
+  });
+};
+
+/**
+ * Interaction to Next Paint: roughly the 98th percentile interaction latency
+ */
+const observeInp = (): void => {
+  const longest = new Map<number, number>();
+  let interactionCount = 0;
+
+  observe('event', (entries) => {
+    entries.forEach((entry) => {
+      if (!entry.interactionId) return;
+      const previous = longest.get(entry.interactionId);
+      if (previous === undefined) interactionCount += 1;
+      longest.set(entry.interactionId, Math.max(previous ?? 0, entry.duration));
+    });
+
+    // One interaction in 50 may be ignored as an outlier
+    const durations = [...longest.values()].sort((a, b) => b - a);
+    const index = Math.min(durations.length - 1, Math.floor(interactionCount / 50));
+    if (durations.length > 0) setVital('INP', durations[index]);
+
+    // Only the slowest few interactions can ever be the INP candidate
+    if (longest.size > 10) {
+      const threshold = durations[9];
+      longest.forEach((duration, id) => {
+        if (duration < threshold) longest.delete(id);
+      });
+    }
+  }, { durationThreshold: 40 });
+};
+
+/**
+ * Start collecting. Call once at startup; does nothing outside the sample.
+ */
+export const initTelemetry = (): void => {
+  if (!enabled || initialized || typeof PerformanceObserver === 'undefined') return;
+  initialized = true;
+
+  observeLcp();
+  observeCls();
+  observeInp();
+
+  // The last reliable moment to send data, on every platform
+  addEventListener('visibilitychange', () => {
+    if (document.visibilityState === 'hidden') flushTelemetry();
+  });
+  addEventListener('pagehide', flushTelemetry);
+};
@@ -0,0 +1,127 @@
+/**
+ * Access token store
+ * Keeps the session token in memory so requests never touch localStorage,
+ * persists it for reloads, and keeps every open tab in sync: a login or
+ * logout in one tab reaches the others through a BroadcastChannel and
+ * through `storage` events, which also cover browsers without
+ * BroadcastChannel and changes made outside this store. A change arriving
+ * through both is applied once.
+ */
+
+const TOKEN_KEY = 'token';
+// Only present when the backend issues refresh tokens in the response body
+// rather than as an HttpOnly cookie
+const REFRESH_TOKEN_KEY = 'refresh_token';
+const CHANNEL_NAME = 'resume-scanner-auth';
+
+/** `external` is true when the change was made in another tab */
+type TokenListener = (token: string | null, external: boolean) => void;
+
+interface TokenMessage {
+  token: string | null;
+}
+
+const readStoredToken = (): string | null => {
+  try {
+    return localStorage.getItem(TOKEN_KEY);
+  } catch {
+    return null;
+  }
+};
+
+class TokenStore {
+  private token: string | null = readStoredToken();
+  private listeners = new Set<TokenListener>();
+  private channel: BroadcastChannel | null = null;
+
+  constructor() {
+    if (typeof window === 'undefined') return;
+
+    if (typeof BroadcastChannel !== 'undefined') {
+      this.channel = new BroadcastChannel(CHANNEL_NAME);
+      this.channel.onmessage = (event: MessageEvent<TokenMessage>) => this.apply(event.data.token, true);
+    }
+    addEventListener('storage', (event) => {
+      if (event.key === TOKEN_KEY || event.key === null) this.apply(readStoredToken(), true);
+    });
+  }
+
+  /**
+   * Current token, without storage access
+   */
+  get(): string | null {
+    return this.token;
+  }
+
+  /**
+   * Pick up a token another tab stored, without waiting for its broadcast
+   */
+  reload(): string | null {
+    this.apply(readStoredToken(), true);
+    return this.token;
+  }
+
+  /**
+   * Store a new token (login, refresh) and announce it to other tabs
+   */
+  set(token: string): void {
+    if (token === this.token) return;
+    localStorage.setItem(TOKEN_KEY, token);
+    this.apply(token, false);
+    this.broadcast({ token });
+  }
+
+  /**
+   * Refresh token issued alongside the access token, if any
+   */
+  getRefreshToken(): string | null {
+    try {
+      return localStorage.getItem(REFRESH_TOKEN_KEY);
+    } catch {
+      return null;
+    }
+  }
+
+  setRefreshToken(refreshToken: string | null | undefined): void {
+    if (refreshToken) {
+      localStorage.setItem(REFRESH_TOKEN_KEY, refreshToken);
+    }
+  }
+
+  /**
+   * Forget the token (logout, rejected session) in this and every other tab
+   */
+  clear(): void {
+    localStorage.removeItem(TOKEN_KEY);
+    localStorage.removeItem(REFRESH_TOKEN_KEY);
+    if (this.token === null) return;
+    this.apply(null, false);
+    this.broadcast({ token: null });
+  }
+
+  /**
+   * Called whenever the token changes, including from another tab
+   */
+  subscribe(listener: TokenListener): () => void {
+    this.listeners.add(listener);
+    return () => {
+      this.listeners.delete(listener);
+    };
+  }
+
+  private apply(token: string | null, external: boolean): void {
+    if (token === this.token) return;
+    this.token = token;
+    this.listeners.forEach((listener) => listener(token, external));
+  }
+
+  private broadcast(message: TokenMessage): void {
+    this.channel?.postMessage(message);
+  }
+}
+
+// Create and export singleton instance
+export const tokenStore = new TokenStore();
+
+// Export the class for testing
+export { TokenStore };
@@ -0,0 +1,36 @@
+/**
+ * Image resize worker
+ * Decodes, downscales and re-encodes photos on an OffscreenCanvas so large
+ * phone pictures never block the main thread. Re-encoding drops all
+ * metadata (EXIF, GPS) after the orientation has been applied.
+ */
+
+import { encodeCanvas, scaledSize } from '../utils/imageEncoding';
+import type { ImageResizeRequest } from '../utils/imageEncoding';
+
+export interface ImageResizeResponse {
+  id: number;
+  blob?: Blob;
+  error?: string;
+}
+
+self.addEventListener('message', async (event: MessageEvent<ImageResizeRequest>) => {
+  const { id, file, maxSize, types, quality } = event.data;
+  let response: ImageResizeResponse;
+  try {
+    const bitmap = await createImageBitmap(file, { imageOrientation: 'from-image' });
+    const { width, height } = scaledSize(bitmap.width, bitmap.height, maxSize);
+    const canvas = new OffscreenCanvas(width, height);
+    const context = canvas.getContext('2d');
+    if (!context) throw new Error('2D canvas is not available');
+    context.imageSmoothingQuality = 'high';
+    context.drawImage(bitmap, 0, 0, width, height);
+    bitmap.close();
+
+    const blob = await encodeCanvas((type) => canvas.convertToBlob({ type, quality }), types);
+    response = { id, blob };
+  } catch (error: any) {
+    response = { id, error: error?.message || 'Image could not be processed' };
+  }
+  self.postMessage(response);
+});
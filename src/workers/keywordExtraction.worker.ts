@@ -0,0 +1,26 @@
+/**
+ * Keyword extraction worker
+ * Runs the skills matcher off the main thread so typing in a job description
+ * textarea stays responsive.
+ */
+
+import { KeywordMatcher } from '../utils/keywordMatcher';
+import type { PreMatchResult } from '../utils/keywordMatcher';
+
+export interface KeywordExtractionRequest {
+  id: number;
+  text: string;
+  resumeKeywords: string[];
+}
+
+export interface KeywordExtractionResponse extends PreMatchResult {
+  id: number;
+}
+
+const matcher = new KeywordMatcher();
+
+self.addEventListener('message', (event: MessageEvent<KeywordExtractionRequest>) => {
+  const { id, text, resumeKeywords } = event.data;
+  const response: KeywordExtractionResponse = { id, ...matcher.preMatch(text, resumeKeywords) };
+  self.postMessage(response);
+});
@@ -2,8 +2,29 @@ import react from "@vitejs/plugin-react";
 import { defineConfig } from "vite";
 import path from "path";
 
+// Vendor chunks: long-lived, cached independently of application code
+const VENDOR_CHUNKS = {
+  "vendor-react": ["react", "react-dom", "scheduler"],
+  "vendor-router": ["react-router", "react-router-dom", "@remix-run/router"],
+  "vendor-axios": ["axios"],
+  "vendor-headlessui": ["@headlessui/react"],
+};
+
+function manualChunks(id) {
+  if (!id.includes("node_modules")) return undefined;
+  const packagePath = id.split("node_modules/").pop();
+  for (const [chunk, packages] of Object.entries(VENDOR_CHUNKS)) {
+    if (packages.some((name) => packagePath.startsWith(`${name}/`))) {
+      return chunk;
+    }
+  }
+  return undefined;
+}
+
 // https://vite.dev/config/
-export default defineConfig({
+// `vite build` produces the minified production bundle;
+// `vite build --mode debug` keeps the previous unminified build with inline-referenced source maps.
+export default defineConfig(({ mode }) => ({
   plugins: [react()],
   resolve: {
     alias: {
@@ -107,12 +128,29 @@ export default defineConfig({
       },
     },
   },
-  build: {
-    sourcemap: true, // Enable source maps for debugging
-    minify: false, // Disable minification for easier debugging
-  },
+  build:
+    mode === "debug"
+      ? {
+          sourcemap: true, // Enable source maps for debugging
+          minify: false, // Disable minification for easier debugging
+        }
+      : {
+          // Maps are written but not referenced from the bundles;
+          // scripts/build.js moves them out of dist/ for separate upload
+          sourcemap: "hidden",
+          minify: "esbuild",
+          target: "es2020",
+          manifest: "asset-manifest.json",
+          reportCompressedSize: true,
+          chunkSizeWarningLimit: 250,
+          rollupOptions: {
+            output: {
+              manualChunks,
+            },
+          },
+        },
   define: {
     // Enable debugging in development
     __DEV__: JSON.stringify(process.env.NODE_ENV === "development"),
   },
-});
+}));